@@ -1,2 +1,186 @@
 // Custom JavaScript for ontEAUlogy documentation
-// Currently empty - placeholder for future enhancements
+
+// Entity search
+//
+// Queries the prebuilt index written by the documentation generator
+// (src/search_index.py) to assets/entity-search.json. Tokens are built with
+// the same rules as there: lowercase words, camelCase and digit runs split
+// apart, whole words kept; trigrams over letters and digits only.
+// Any element with a `data-entity-search` attribute gets a search box.
+(function () {
+  "use strict";
+
+  var INDEX_PATH = "assets/entity-search.json";
+  var WORD = /[\p{L}\p{N}]+/gu;
+  var CAMEL_PART = /[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+/g;
+  var NOT_ALNUM = /[^\p{L}\p{N}]+/gu;
+
+  // Site root: this script is served from <root>/javascripts/extra.js
+  var script = document.currentScript;
+  var siteRoot = script ? new URL("../", script.src).href : new URL("./", location.href).href;
+
+  var loading = null;
+
+  function tokenize(text) {
+    var tokens = [];
+    (text.match(WORD) || []).forEach(function (word) {
+      if (/^[\x00-\x7f]*$/.test(word)) {
+        (word.match(CAMEL_PART) || []).forEach(function (part) {
+          tokens.push(part.toLowerCase());
+        });
+      }
+      tokens.push(word.toLowerCase());
+    });
+    return tokens.filter(function (token, i) { return tokens.indexOf(token) === i; });
+  }
+
+  function normalize(text) {
+    return text.toLowerCase().replace(NOT_ALNUM, "");
+  }
+
+  function load() {
+    if (!loading) {
+      loading = fetch(siteRoot + INDEX_PATH)
+        .then(function (response) {
+          if (!response.ok) throw new Error(response.status + " " + response.statusText);
+          return response.json();
+        })
+        .then(function (index) {
+          // Normalized names and labels, for substring checks
+          index.keys = index.entities.map(function (row) {
+            return [row[0], row[1]].concat(row[4]).map(normalize);
+          });
+          index.tokenList = Object.keys(index.tokens);
+          return index;
+        });
+      loading.catch(function () { loading = null; });
+    }
+    return loading;
+  }
+
+  function add(scores, rows, points) {
+    (rows || []).forEach(function (row) {
+      scores.set(row, (scores.get(row) || 0) + points);
+    });
+  }
+
+  // Rows holding every trigram of key, checked for the full substring
+  function substringMatches(index, key) {
+    var rows = null;
+    for (var i = 0; i + 3 <= key.length; i++) {
+      var posting = index.trigrams[key.slice(i, i + 3)];
+      if (!posting) return [];
+      if (rows === null) {
+        rows = posting.slice();
+      } else {
+        var keep = new Set(posting);
+        rows = rows.filter(function (row) { return keep.has(row); });
+      }
+      if (!rows.length) return [];
+    }
+    return (rows || []).filter(function (row) {
+      return index.keys[row].some(function (name) { return name.indexOf(key) !== -1; });
+    });
+  }
+
+  function query(index, text, limit) {
+    var scores = new Map();
+    var tokens = tokenize(text);
+
+    tokens.forEach(function (token) {
+      add(scores, index.tokens[token], 10);
+      add(scores, index.text[token], 2);
+      if (token.length >= 2) {
+        index.tokenList.forEach(function (known) {
+          if (known !== token && known.lastIndexOf(token, 0) === 0) {
+            add(scores, index.tokens[known], 4);
+          }
+        });
+      }
+    });
+
+    var key = normalize(text);
+    if (key.length >= 3) {
+      substringMatches(index, key).forEach(function (row) {
+        var names = index.keys[row];
+        var points = names[0] === key ? 40 : names[0].lastIndexOf(key, 0) === 0 ? 20 : 8;
+        add(scores, [row], points);
+      });
+    }
+
+    return Array.from(scores.entries())
+      .sort(function (a, b) { return b[1] - a[1] || a[0] - b[0]; })
+      .slice(0, limit || 20)
+      .map(function (hit) {
+        var row = index.entities[hit[0]];
+        return {
+          name: row[0], label: row[1], type: row[2], url: siteRoot + row[3],
+          altLabels: row[4], summary: row[5], score: hit[1],
+        };
+      });
+  }
+
+  function search(text, limit) {
+    return load().then(function (index) { return query(index, text, limit); });
+  }
+
+  function renderResults(list, results) {
+    list.textContent = "";
+    results.forEach(function (result) {
+      var item = document.createElement("li");
+      var link = document.createElement("a");
+      link.href = result.url;
+      link.textContent = result.label;
+      var name = document.createElement("code");
+      name.textContent = result.name;
+      var details = document.createElement("span");
+      details.textContent = " " + result.type + (result.summary ? " — " + result.summary : "");
+      item.append(link, " ", name, details);
+      list.appendChild(item);
+    });
+  }
+
+  function attach(container) {
+    if (container.dataset.entitySearchReady) return;
+    container.dataset.entitySearchReady = "true";
+
+    var input = document.createElement("input");
+    input.type = "search";
+    input.placeholder = "Label, altLabel, definition or URI fragment";
+    input.setAttribute("aria-label", "Search ontology entities");
+    var list = document.createElement("ul");
+    container.append(input, list);
+
+    var pending = 0;
+    input.addEventListener("input", function () {
+      var text = input.value.trim();
+      var current = ++pending;
+      if (!text) {
+        list.textContent = "";
+        return;
+      }
+      search(text, 20).then(function (results) {
+        if (current === pending) renderResults(list, results);
+      }, function (error) {
+        list.textContent = "Entity search is unavailable: " + error.message;
+      });
+    });
+    // Fetch the index before the first keystroke finishes
+    input.addEventListener("focus", load, { once: true });
+  }
+
+  function attachAll() {
+    document.querySelectorAll("[data-entity-search]").forEach(attach);
+  }
+
+  window.entitySearch = { load: load, search: search, tokenize: tokenize };
+
+  // Material's instant navigation swaps page content without reloading
+  if (typeof document$ !== "undefined") {
+    document$.subscribe(attachAll);
+  } else if (document.readyState === "loading") {
+    document.addEventListener("DOMContentLoaded", attachAll);
+  } else {
+    attachAll();
+  }
+})();
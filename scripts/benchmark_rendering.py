@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for documentation rendering.
+
+Times the precompiled templates of ``doc_templates`` against the previous
+string-concatenation renderer (kept below as the reference implementation),
+reports throughput in entities per second, and checks that both produce
+byte-identical output.
+
+Usage:
+    python scripts/benchmark_rendering.py [--ontology FILE] [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from rdflib import URIRef
+
+sys.path.insert(0, str(Path(__file__).parent))
+from generate_docs import OntologyDocGenerator
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from module_summary import defined_entities
+
+
+def legacy_link(generator, name):
+    """List item for a related entity, linked if a page documents it."""
+    target = generator._link_target(name.uri)
+    if target:
+        return f"- [{name}]({target})\n"
+    return f"- {name}\n"
+
+
+def legacy_entity_section(generator, entity_info):
+    """Render an entity section by string concatenation, as the generator
+    did before ``doc_templates``.
+
+    Returns:
+        String containing the markdown content for this entity
+    """
+    entity_name = entity_info['local_name']
+    anchor_id = generator._get_anchor_id(entity_info['uri'])
+
+    # Determine entity type for display
+    entity_type = "Entity"
+    if 'Class' in entity_info['types']:
+        entity_type = "Class"
+    elif 'ObjectProperty' in entity_info['types']:
+        entity_type = "Object Property"
+    elif 'DatatypeProperty' in entity_info['types']:
+        entity_type = "Datatype Property"
+    elif 'NamedIndividual' in entity_info['types']:
+        entity_type = "Individual"
+
+    # Generate markdown content using h2 for sections
+    content = f"""## {entity_name} {{#{anchor_id}}}
+
+**Type:** {entity_type}
+
+**URI:** `{entity_info['uri']}`
+
+"""
+
+    # Add labels
+    if entity_info['labels']:
+        content += "### Labels\n\n"
+        for label in entity_info['labels']:
+            content += f"- {label}\n"
+        content += "\n"
+
+    # Add descriptions
+    if entity_info['descriptions']:
+        content += "### Description\n\n"
+        for desc in entity_info['descriptions']:
+            content += f"{desc}\n\n"
+
+    # Add class-specific information
+    if 'Class' in entity_info['types']:
+        if entity_info['superclasses']:
+            content += "### Superclasses\n\n"
+            for superclass in entity_info['superclasses']:
+                content += legacy_link(generator, superclass)
+            content += "\n"
+
+        if entity_info['subclasses']:
+            content += "### Subclasses\n\n"
+            for subclass in entity_info['subclasses']:
+                content += legacy_link(generator, subclass)
+            content += "\n"
+
+        if 'instances' in entity_info and entity_info['instances']:
+            content += "### Instances\n\n"
+            for instance in entity_info['instances']:
+                content += legacy_link(generator, instance)
+            content += "\n"
+
+        hierarchy_lines = generator._hierarchy_lines(entity_info)
+        if hierarchy_lines:
+            content += "### Hierarchy\n\n"
+            for line in hierarchy_lines:
+                content += line
+            content += "\n"
+
+    # Add property-specific information
+    if 'Property' in entity_type:
+        if entity_info['domains']:
+            content += "### Domains\n\n"
+            for domain in entity_info['domains']:
+                content += legacy_link(generator, domain)
+            content += "\n"
+
+        if entity_info['ranges']:
+            content += "### Ranges\n\n"
+            for range_obj in entity_info['ranges']:
+                content += f"- {range_obj}\n"
+            content += "\n"
+
+        if 'characteristics' in entity_info and entity_info['characteristics']:
+            content += "### Characteristics\n\n"
+            for char in entity_info['characteristics']:
+                content += f"- {char}\n"
+            content += "\n"
+
+        if 'inverse_properties' in entity_info and entity_info['inverse_properties']:
+            content += "### Inverse Properties\n\n"
+            for inv_prop in entity_info['inverse_properties']:
+                content += legacy_link(generator, inv_prop)
+            content += "\n"
+
+        if 'subproperties' in entity_info and entity_info['subproperties']:
+            content += "### Subproperties\n\n"
+            for subprop in entity_info['subproperties']:
+                content += legacy_link(generator, subprop)
+            content += "\n"
+
+        if 'superproperties' in entity_info and entity_info['superproperties']:
+            content += "### Superproperties\n\n"
+            for superprop in entity_info['superproperties']:
+                content += legacy_link(generator, superprop)
+            content += "\n"
+
+    # Add individual-specific information
+    if entity_type == "Individual":
+        if 'instance_of' in entity_info and entity_info['instance_of']:
+            content += "### Instance Of\n\n"
+            for class_name in entity_info['instance_of']:
+                content += legacy_link(generator, class_name)
+            content += "\n"
+
+        if 'property_values' in entity_info and entity_info['property_values']:
+            content += "### Property Values\n\n"
+            for prop_value in entity_info['property_values']:
+                prop_name = prop_value['property']
+                value = prop_value['value']
+                # Only create link if it's a URI reference to another entity
+                if prop_value.get('is_uri', False):
+                    # Check if a page documents it
+                    target = generator._link_target(value.uri)
+                    if target:
+                        content += f"- **{prop_name}**: [{value}]({target})\n"
+                    else:
+                        # External or undocumented entity, show as plain text
+                        content += f"- **{prop_name}**: `{value}`\n"
+                else:
+                    # Literal value, show as plain text
+                    content += f"- **{prop_name}**: {value}\n"
+            content += "\n"
+
+    # Add related entities section (only for entities in our ontology)
+    ontology_entities = [
+        r for r in entity_info['related_entities']
+        if generator.ontology_base.lower() in r.lower()
+    ]
+    if ontology_entities:
+        content += "### Related Entities\n\n"
+        for related in sorted(ontology_entities):
+            related_name = generator._get_local_name(URIRef(related))
+            anchor = generator._get_anchor_id(related)
+            content += f"- [{related_name}](#{anchor})\n"
+        content += "\n"
+
+    # Add backlinks from other entities of our ontology
+    if entity_info.get('referenced_by'):
+        content += "### Referenced By\n\n"
+        for predicate_name, referrers in entity_info['referenced_by']:
+            links = ", ".join(
+                f"[{generator._get_local_name(URIRef(uri))}](#{generator._get_anchor_id(uri)})"
+                for uri in referrers
+            )
+            content += f"- **{predicate_name}**: {links}\n"
+        content += "\n"
+
+    return content
+
+
+def legacy_module_page(generator, module_name, module_path, entities_by_type):
+    """Render a module page by string concatenation, as the generator did
+    before ``doc_templates``."""
+    module_info = generator._get_module_info(module_path)
+
+    # Build page content
+    title = module_info['title'] or f"Module: {module_name}"
+    content = f"# {title}\n\n"
+
+    if module_info['description']:
+        content += f"{module_info['description']}\n\n"
+
+    content += f"**Module URI:** `{module_info['uri'] or 'N/A'}`\n\n"
+    source = module_path.relative_to(generator.ontology_path.parent.parent)
+    content += f"**Source:** `{source}`\n\n"
+
+    # Count entities
+    total = sum(len(entities) for entities in entities_by_type.values())
+    content += f"**Total Entities:** {total}\n\n"
+
+    # Table of contents
+    content += "## Contents\n\n"
+    if entities_by_type['classes']:
+        content += f"- [Classes](#classes) ({len(entities_by_type['classes'])})\n"
+    if entities_by_type['object_properties']:
+        obj_props_count = len(entities_by_type['object_properties'])
+        content += (
+            f"- [Object Properties](#object-properties) ({obj_props_count})\n"
+        )
+    if entities_by_type['datatype_properties']:
+        dt_props_count = len(entities_by_type['datatype_properties'])
+        content += (
+            f"- [Datatype Properties](#datatype-properties) ({dt_props_count})\n"
+        )
+    if entities_by_type['individuals']:
+        ind_count = len(entities_by_type['individuals'])
+        content += f"- [Individuals](#individuals) ({ind_count})\n"
+    content += "\n---\n\n"
+
+    # Generate sections for each type
+    if entities_by_type['classes']:
+        content += "## Classes\n\n"
+        for entity_info in entities_by_type['classes']:
+            content += legacy_entity_section(generator, entity_info)
+            content += "\n---\n\n"
+
+    if entities_by_type['object_properties']:
+        content += "## Object Properties\n\n"
+        for entity_info in entities_by_type['object_properties']:
+            content += legacy_entity_section(generator, entity_info)
+            content += "\n---\n\n"
+
+    if entities_by_type['datatype_properties']:
+        content += "## Datatype Properties\n\n"
+        for entity_info in entities_by_type['datatype_properties']:
+            content += legacy_entity_section(generator, entity_info)
+            content += "\n---\n\n"
+
+    if entities_by_type['individuals']:
+        content += "## Individuals\n\n"
+        for entity_info in entities_by_type['individuals']:
+            content += legacy_entity_section(generator, entity_info)
+            content += "\n---\n\n"
+
+    return content
+
+
+def collect_entities(generator):
+    """Entity infos of every documented entity, grouped like a module page.
+
+    Returns:
+        Dictionary of category to list of entity info dictionaries
+    """
+    entity_uris = [
+        uri for uri in defined_entities(generator.graph)
+        if not generator._is_blank_node(uri)
+    ]
+    return generator._categorize_entities_by_type(entity_uris)
+
+
+def render_sections_legacy(generator, entities):
+    return [legacy_entity_section(generator, info) for info in entities]
+
+
+def render_sections_templates(generator, entities):
+    return [generator._generate_entity_section(info) for info in entities]
+
+
+def _best_time(render, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = render()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark entity section rendering")
+    parser.add_argument("--ontology", type=Path,
+                        help="Ontology file (default: data/ontology/waterframe.ttl)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Timed runs per renderer; the best is reported")
+    args = parser.parse_args(argv)
+
+    generator = OntologyDocGenerator(ontology_path=args.ontology)
+    entities_by_type = collect_entities(generator)
+    entities = [info for group in entities_by_type.values() for info in group]
+    if not entities:
+        print("✗ No entities to render")
+        return 1
+    module_path = generator.ontology_path
+
+    print(f"Rendering {len(entities)} entities, best of {args.repeat} runs\n")
+    benchmarks = [
+        ("Entity sections", len(entities),
+         lambda: render_sections_legacy(generator, entities),
+         lambda: render_sections_templates(generator, entities)),
+        ("Module page", len(entities),
+         lambda: legacy_module_page(
+             generator, "benchmark", module_path, entities_by_type
+         ),
+         lambda: generator._generate_module_page(
+             "benchmark", module_path, entities_by_type
+         )),
+    ]
+
+    identical = True
+    for name, count, legacy, templates in benchmarks:
+        legacy_time, legacy_output = _best_time(legacy, args.repeat)
+        template_time, template_output = _best_time(templates, args.repeat)
+        same = legacy_output == template_output
+        identical = identical and same
+
+        print(f"{name}:")
+        print(f"  concatenation: {count / legacy_time:12,.0f} entities/s")
+        print(f"  templates:     {count / template_time:12,.0f} entities/s "
+              f"({legacy_time / template_time:.2f}x)")
+        print(f"  {'✓ identical output' if same else '✗ output differs'}")
+
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
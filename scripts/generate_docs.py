@@ -7,7 +7,12 @@ a single markdown documentation file (entities.md) containing
 all entities as sections with internal anchor links.
 """
 
+import argparse
+import gc
+import hashlib
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from rdflib import Graph, URIRef
@@ -15,33 +20,134 @@ from rdflib.namespace import DC, OWL, RDF, RDFS, SKOS
 
 # Add the src directory to the path so we can import our modules
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import doc_templates as tpl
+from build_manifest import MANIFEST_NAME, BuildManifest
+from build_profile import BuildProfile
+from class_hierarchy import ClassHierarchy
+from entity_index import EntityIndex
 from helpers import get_ontology_path
+from import_resolver import CATALOG_FILENAME, unreachable_files
+from module_diagram import (
+    diagrams_available,
+    module_diagram_spec,
+    render_diagram_job,
+)
+from module_summary import ENTITY_TYPES, defined_entities, summarize_module
+from ontology_loader import load_shared_ontology
+from parallel_parse import mp_context
+from rdf_formats import parse_rdf
+from search_index import SEARCH_INDEX_NAME, SearchEntry, write_search_index
+from uri_table import LinkedName, UriTable
+
+SRC_DIR = (Path(__file__).parent.parent / "src").resolve()
+# Every page depends on the code that renders it: this script and the
+# modules that pick, index, name and format its entities
+RENDER_SOURCES = (
+    Path(__file__).resolve(),
+    SRC_DIR / "class_hierarchy.py",
+    SRC_DIR / "doc_templates.py",
+    SRC_DIR / "entity_index.py",
+    SRC_DIR / "module_summary.py",
+    SRC_DIR / "uri_table.py",
+)
+SEARCH_INDEX_SOURCE = SRC_DIR / "search_index.py"
+DIAGRAM_SOURCE = SRC_DIR / "module_diagram.py"
+
+# Module pages with more entities than this are split into numbered pages
+DEFAULT_SHARD_SIZE = 500
+
+# Set in each page-rendering worker by _init_render_worker
+_worker_generator = None
+
+
+def _init_render_worker(generator):
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _render_module_page_worker(job):
+    return _worker_generator._render_module_page(*job)
 
 
 class OntologyDocGenerator:
     """Generates documentation from ontology entities."""
 
-    def __init__(self, ontology_path=None, output_dir=None):
+    def __init__(self, ontology_path=None, output_dir=None, graph=None, force=False,
+                 max_workers=None, shard_size=DEFAULT_SHARD_SIZE, profile=None,
+                 cache_dir=None):
         """Initialize the documentation generator.
 
         Args:
             ontology_path: Path to the ontology file
             output_dir: Directory to write generated documentation
+            graph: Already loaded ontology graph to document instead of
+                loading ``ontology_path``, e.g. a live OntologyDataset union
+            force: Regenerate every page, even those whose inputs are
+                unchanged since the last build
+            max_workers: Processes rendering module pages in parallel
+                (defaults to the CPU count; 1 renders in this process)
+            shard_size: Module pages documenting more entities than this
+                are split into pages of at most this many entities, listed
+                on the module page (0 never splits)
+            profile: BuildProfile recording the time and memory of each
+                phase per module; pages are then rendered in this process
+                so that every phase is recorded
+            cache_dir: Directory for the ontology's binary snapshots
+                (defaults to the repository's ``.cache/snapshots``)
         """
         self.ontology_path = ontology_path or get_ontology_path()
+        self.cache_dir = cache_dir
         self.output_dir = Path(output_dir) if output_dir else Path(__file__).parent.parent / "docs" / "entities"
         self.graph = Graph()
+        self._index = None
+        self._uris = None
+        self._hierarchy = None
+        # Rendered link lines, by entity URI and by related-entity URI
+        self._link_lines = {}
+        self._related_lines = {}
+        # Page being rendered (None outside page builds), the page holding
+        # each entity of it and the relative path of each page linked to
+        self._link_page = None
+        self._local_pages = {}
+        self._page_paths = {}
+        self._entity_locations = None
+        self.shard_size = shard_size
         self.namespaces = {}
+        # Class diagram of each module file, once generate_module_diagrams ran
+        self.diagrams = {}
 
         # Create output directory if it doesn't exist
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Inputs of every page of the last build, to skip unchanged pages
+        self.manifest = BuildManifest(
+            self.output_dir.parent / MANIFEST_NAME, force=force
+        )
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.profile = profile or BuildProfile(enabled=False)
+        if self.profile.enabled:
+            self.max_workers = 1
+
         # Initialize namespace attributes with defaults
         self.ontology_base = "http://example.org/waterFRAME"
         self.ontology_namespace = f"{self.ontology_base}#"
 
         # Load the ontology (may override namespace if found)
-        self._load_ontology()
+        if graph is not None:
+            self.graph = graph
+            with self.profile.phase("namespace detection"):
+                self._extract_ontology_namespace()
+        else:
+            self._load_ontology()
+
+        # Header and entities of each loaded file, recorded by the loader
+        # while parsing it, so module pages need not parse modules again
+        self.module_summaries = dict(
+            getattr(self.graph, 'module_summaries', None) or {}
+        )
+        # Files of the loaded import closure (empty if the graph did not
+        # come from the loader)
+        self.loaded_files = set(self.module_summaries)
 
     def _load_ontology(self):
         """Load and parse the ontology file and all imported modules."""
@@ -50,32 +156,18 @@ class OntologyDocGenerator:
             return
 
         try:
-            # Load main ontology
-            self.graph.parse(self.ontology_path, format="turtle")
+            # Load the main ontology plus its owl:imports closure. The graph
+            # is shared (read-only) with any other generator in this process
+            # and comes from a binary snapshot when no source file changed
+            with self.profile.phase("load"):
+                self.graph = load_shared_ontology(
+                    self.ontology_path, cache_dir=self.cache_dir, verbose=True
+                )
             print(f"Loaded ontology from {self.ontology_path}")
 
-            # Load all module files from the modules directory
-            modules_dir = self.ontology_path.parent / "modules"
-            if modules_dir.exists():
-                for module_file in modules_dir.rglob("*.ttl"):
-                    try:
-                        self.graph.parse(module_file, format="turtle")
-                        print(f"Loaded module from {module_file}")
-                    except Exception as e:
-                        print(f"Warning: Could not load module {module_file}: {e}")
-
-            # Load all bridge files from the bridges directory
-            bridges_dir = self.ontology_path.parent / "bridges"
-            if bridges_dir.exists():
-                for bridge_file in bridges_dir.rglob("*.ttl"):
-                    try:
-                        self.graph.parse(bridge_file, format="turtle")
-                        print(f"Loaded bridge from {bridge_file}")
-                    except Exception as e:
-                        print(f"Warning: Could not load bridge {bridge_file}: {e}")
-
             # Extract the ontology namespace from the graph
-            self._extract_ontology_namespace()
+            with self.profile.phase("namespace detection"):
+                self._extract_ontology_namespace()
         except Exception as e:
             print(f"Error loading ontology: {e}")
             return
@@ -112,6 +204,53 @@ class OntologyDocGenerator:
             f"using fallback: {self.ontology_namespace}"
         )
 
+    def __getstate__(self):
+        # Page-rendering workers only need the entity index, URI table and
+        # class hierarchy, which are built before they start; the graph and
+        # manifest stay in the parent
+        state = self.__dict__.copy()
+        state['graph'] = None
+        state['manifest'] = None
+        state['profile'] = BuildProfile(enabled=False)
+        return state
+
+    @property
+    def index(self):
+        """Adjacency index of the loaded graph, built on first use."""
+        if self._index is None:
+            with self.profile.phase("entity extraction", "entity index"):
+                self._index = EntityIndex(self.graph)
+        return self._index
+
+    @property
+    def uris(self):
+        """Names and anchors of the URIs of the loaded graph, built on first
+        use; warns about entities whose sections would share an anchor."""
+        if self._uris is None:
+            uris = UriTable(self.graph.namespaces())
+            collisions = uris.register(
+                subject for subject, edges in self.index.out_edges.items()
+                if isinstance(subject, URIRef) and (
+                    RDFS.subClassOf in edges
+                    or any(t in ENTITY_TYPES for t in edges.get(RDF.type, ()))
+                )
+            )
+            for anchor, sharing in collisions.items():
+                print(
+                    f"Warning: Anchor #{anchor} is shared by "
+                    f"{', '.join(uris.qname(uri) for uri in sharing)}; "
+                    f"links to it land on the first of their sections"
+                )
+            self._uris = uris
+        return self._uris
+
+    @property
+    def hierarchy(self):
+        """Transitive closure of the class hierarchy, built on first use."""
+        if self._hierarchy is None:
+            self._hierarchy = ClassHierarchy.from_index(self.index)
+        return self._hierarchy
+
     def _get_entity_info(self, uri):
         """Extract information about a specific entity.
 
@@ -133,32 +272,31 @@ class OntologyDocGenerator:
             'domains': [],
             'ranges': [],
             'properties': {},
-            'related_entities': set()
+            'related_entities': set(),
+            'referenced_by': [],
         }
 
         # Get labels
-        for label in self.graph.objects(entity_uri, RDFS.label):
+        for label in self.index.objects(entity_uri, RDFS.label):
             info['labels'].append(str(label))
 
         # Get alternative labels
-        for alt_label in self.graph.objects(entity_uri, SKOS.altLabel):
+        for alt_label in self.index.objects(entity_uri, SKOS.altLabel):
             info['labels'].append(str(alt_label))
 
         # Get descriptions/comments
-        for desc in self.graph.objects(entity_uri, RDFS.comment):
+        for desc in self.index.objects(entity_uri, RDFS.comment):
             info['descriptions'].append(str(desc))
 
-        for desc in self.graph.objects(entity_uri, SKOS.definition):
+        for desc in self.index.objects(entity_uri, SKOS.definition):
             info['descriptions'].append(str(desc))
 
-        for desc in self.graph.objects(entity_uri, DC.description):
+        for desc in self.index.objects(entity_uri, DC.description):
             info['descriptions'].append(str(desc))
 
         # Get types
-        for type_uri in self.graph.objects(entity_uri, RDF.type):
-            type_name = self._get_local_name(type_uri)
-            info['types'].append(type_name)
-
+        info['types'] = self._entity_types(entity_uri)
+        for type_uri in self.index.objects(entity_uri, RDF.type):
             # Handle different entity types
             if type_uri == OWL.Class:
                 info = self._get_class_info(entity_uri, info)
@@ -171,87 +309,135 @@ class OntologyDocGenerator:
 
         # Implicit class detection: if it has rdfs:subClassOf, it's a class
         # (even if not explicitly declared with rdf:type owl:Class)
-        if (entity_uri, RDFS.subClassOf, None) in self.graph:
-            if 'Class' not in info['types']:
-                info['types'].append('Class')
+        if self.index.has(entity_uri, RDFS.subClassOf):
             info = self._get_class_info(entity_uri, info)
 
+        info['referenced_by'] = self._get_backlinks(entity_uri)
+
         return info
 
+    def _entity_types(self, entity_uri):
+        """Local names of an entity's types, counting an entity with
+        superclasses as a Class even if it is not declared one."""
+        types = [
+            self._get_local_name(t) for t in self.index.objects(entity_uri, RDF.type)
+        ]
+        if self.index.has(entity_uri, RDFS.subClassOf) and 'Class' not in types:
+            types.append('Class')
+        return types
+
+    def _get_backlinks(self, entity_uri):
+        """Get the entities of this ontology that reference an entity.
+
+        Reads the in-edges of the entity index, so the cost is the number
+        of triples pointing at the entity rather than a graph scan.
+
+        Args:
+            entity_uri: URIRef of the entity
+
+        Returns:
+            List of (predicate local name, referencing URIs) pairs, sorted by
+            predicate name, with the URIs sorted by local name
+        """
+        base = self.ontology_base.lower()
+        uris = self.uris
+        groups = {}
+        for predicate, subjects in self.index.predicate_subjects(entity_uri):
+            referrers = [
+                str(subject) for subject in subjects
+                if isinstance(subject, URIRef) and subject != entity_uri
+                and base in str(subject).lower()
+            ]
+            if referrers:
+                groups.setdefault(uris[predicate].local_name, set()).update(referrers)
+
+        return [
+            (predicate_name, sorted(
+                referrers, key=lambda uri: (uris[uri].local_name.lower(), uri)
+            ))
+            for predicate_name, referrers in sorted(
+                groups.items(), key=lambda g: g[0].lower()
+            )
+        ]
+
     def _get_class_info(self, entity_uri, info):
         """Get class-specific information."""
         # Get subclasses
-        for subclass in self.graph.subjects(RDFS.subClassOf, entity_uri):
-            subclass_name = self._get_local_name(subclass)
+        for subclass in self.index.subjects(RDFS.subClassOf, entity_uri):
+            subclass_name = self._entity_name(subclass)
             info['subclasses'].append(subclass_name)
             info['related_entities'].add(str(subclass))
 
         # Get superclasses
-        for superclass in self.graph.objects(entity_uri, RDFS.subClassOf):
-            superclass_name = self._get_local_name(superclass)
+        for superclass in self.index.objects(entity_uri, RDFS.subClassOf):
+            superclass_name = self._entity_name(superclass)
             info['superclasses'].append(superclass_name)
             info['related_entities'].add(str(superclass))
 
         # Get individuals that are instances of this class
-        for individual in self.graph.subjects(RDF.type, entity_uri):
+        for individual in self.index.subjects(RDF.type, entity_uri):
             if individual != entity_uri:  # Avoid self-reference
-                individual_name = self._get_local_name(individual)
+                individual_name = self._entity_name(individual)
                 if 'instances' not in info:
                     info['instances'] = []
                 info['instances'].append(individual_name)
                 info['related_entities'].add(str(individual))
 
+        # Full ancestry and subtree size, from the precomputed closure
+        info['ancestry'] = self.hierarchy.ancestry(entity_uri)
+        info['descendant_count'] = self.hierarchy.subtree_size(entity_uri)
+
         return info
 
     def _get_property_info(self, entity_uri, info, object_property=True):
         """Get property-specific information."""
         # Get domains
-        for domain in self.graph.objects(entity_uri, RDFS.domain):
-            domain_name = self._get_local_name(domain)
+        for domain in self.index.objects(entity_uri, RDFS.domain):
+            domain_name = self._entity_name(domain)
             info['domains'].append(domain_name)
             info['related_entities'].add(str(domain))
 
         # Get ranges
-        for range_obj in self.graph.objects(entity_uri, RDFS.range):
+        for range_obj in self.index.objects(entity_uri, RDFS.range):
             range_name = self._get_local_name(range_obj)
             info['ranges'].append(range_name)
             info['related_entities'].add(str(range_obj))
 
         # Get property characteristics
         characteristics = []
-        if (entity_uri, RDF.type, OWL.FunctionalProperty) in self.graph:
+        if self.index.has(entity_uri, RDF.type, OWL.FunctionalProperty):
             characteristics.append("Functional")
-        if (entity_uri, RDF.type, OWL.InverseFunctionalProperty) in self.graph:
+        if self.index.has(entity_uri, RDF.type, OWL.InverseFunctionalProperty):
             characteristics.append("Inverse Functional")
-        if (entity_uri, RDF.type, OWL.TransitiveProperty) in self.graph:
+        if self.index.has(entity_uri, RDF.type, OWL.TransitiveProperty):
             characteristics.append("Transitive")
-        if (entity_uri, RDF.type, OWL.SymmetricProperty) in self.graph:
+        if self.index.has(entity_uri, RDF.type, OWL.SymmetricProperty):
             characteristics.append("Symmetric")
-        if (entity_uri, RDF.type, OWL.AsymmetricProperty) in self.graph:
+        if self.index.has(entity_uri, RDF.type, OWL.AsymmetricProperty):
             characteristics.append("Asymmetric")
-        if (entity_uri, RDF.type, OWL.ReflexiveProperty) in self.graph:
+        if self.index.has(entity_uri, RDF.type, OWL.ReflexiveProperty):
             characteristics.append("Reflexive")
-        if (entity_uri, RDF.type, OWL.IrreflexiveProperty) in self.graph:
+        if self.index.has(entity_uri, RDF.type, OWL.IrreflexiveProperty):
             characteristics.append("Irreflexive")
             
 
         info['characteristics'] = characteristics
 
         # Get inverse properties
-        for inverse in self.graph.objects(entity_uri, OWL.inverseOf):
-            inverse_name = self._get_local_name(inverse)
+        for inverse in self.index.objects(entity_uri, OWL.inverseOf):
+            inverse_name = self._entity_name(inverse)
             info['inverse_properties'] = info.get('inverse_properties', []) + [inverse_name]
             info['related_entities'].add(str(inverse))
 
         # Get subproperties
-        for subproperty in self.graph.subjects(RDFS.subPropertyOf, entity_uri):
-            subproperty_name = self._get_local_name(subproperty)
+        for subproperty in self.index.subjects(RDFS.subPropertyOf, entity_uri):
+            subproperty_name = self._entity_name(subproperty)
             info['subproperties'] = info.get('subproperties', []) + [subproperty_name]
             info['related_entities'].add(str(subproperty))
 
         # Get superproperties
-        for superproperty in self.graph.objects(entity_uri, RDFS.subPropertyOf):
-            superproperty_name = self._get_local_name(superproperty)
+        for superproperty in self.index.objects(entity_uri, RDFS.subPropertyOf):
+            superproperty_name = self._entity_name(superproperty)
             info['superproperties'] = info.get('superproperties', []) + [superproperty_name]
             info['related_entities'].add(str(superproperty))
 
@@ -260,20 +446,20 @@ class OntologyDocGenerator:
     def _get_individual_info(self, entity_uri, info):
         """Get individual-specific information."""
         # Get classes this individual is an instance of
-        for class_uri in self.graph.objects(entity_uri, RDF.type):
+        for class_uri in self.index.objects(entity_uri, RDF.type):
             if class_uri != OWL.NamedIndividual:  # Avoid the type declaration itself
-                class_name = self._get_local_name(class_uri)
+                class_name = self._entity_name(class_uri)
                 info['instance_of'] = info.get('instance_of', []) + [class_name]
                 info['related_entities'].add(str(class_uri))
 
         # Get property values for this individual
-        for predicate in self.graph.predicates(entity_uri, None):
-            for obj in self.graph.objects(entity_uri, predicate):
+        for predicate, objects in self.index.predicate_objects(entity_uri):
+            for obj in objects:
                 predicate_name = self._get_local_name(predicate)
 
                 # Check if obj is a URI or a literal value
                 if isinstance(obj, URIRef):
-                    obj_name = self._get_local_name(obj)
+                    obj_name = self._entity_name(obj)
                     # Only add URIRefs to related entities
                     info['related_entities'].add(str(obj))
                 else:
@@ -291,19 +477,14 @@ class OntologyDocGenerator:
 
         return info
 
+    def _entity_name(self, uri):
+        """Local name of a related entity, keeping its URI to link it by."""
+        return LinkedName(self._get_local_name(uri), uri)
+
     def _get_local_name(self, uri):
         """Get the local name from a URI."""
         if isinstance(uri, URIRef):
-            uri_str = str(uri)
-            # Handle common namespaces
-            if uri_str.startswith('http://www.w3.org/'):
-                return uri_str.split('#')[-1] if '#' in uri_str else uri_str.split('/')[-1]
-            elif '#' in uri_str:
-                return uri_str.split('#')[-1]
-            elif '/' in uri_str:
-                return uri_str.split('/')[-1]
-            else:
-                return uri_str
+            return self.uris[uri].local_name
         return str(uri)
 
     def _get_safe_filename(self, uri):
@@ -315,9 +496,7 @@ class OntologyDocGenerator:
 
     def _get_anchor_id(self, uri):
         """Get a safe anchor ID from a URI for use in markdown links."""
-        safe_name = self._get_safe_filename(uri)
-        # Convert to lowercase for consistency
-        return safe_name.lower()
+        return self.uris[uri].anchor
 
     def _generate_entity_section(self, entity_info):
         """Generate a markdown section for a single entity.
@@ -325,167 +504,231 @@ class OntologyDocGenerator:
         Returns:
             String containing the markdown content for this entity
         """
-        entity_name = entity_info['local_name']
-        anchor_id = self._get_anchor_id(entity_info['uri'])
-
-        # Determine entity type for display
-        entity_type = "Entity"
-        if 'Class' in entity_info['types']:
-            entity_type = "Class"
-        elif 'ObjectProperty' in entity_info['types']:
-            entity_type = "Object Property"
-        elif 'DatatypeProperty' in entity_info['types']:
-            entity_type = "Datatype Property"
-        elif 'NamedIndividual' in entity_info['types']:
-            entity_type = "Individual"
+        out = []
+        self._write_entity_section(out, entity_info)
+        return "".join(out)
 
-        # Generate markdown content using h2 for sections
-        content = f"""## {entity_name} {{#{anchor_id}}}
+    def _write_entity_section(self, out, entity_info):
+        """Append the markdown parts of an entity's section to ``out``.
 
-**Type:** {entity_type}
-
-**URI:** `{entity_info['uri']}`
+        Args:
+            out: List collecting the page parts
+            entity_info: Dictionary from ``_get_entity_info``
+        """
+        entity_name = entity_info['local_name']
+        anchor_id = self._get_anchor_id(entity_info['uri'])
+        entity_type = self._entity_type(entity_info)
 
-"""
+        # Heading (h2), type and URI
+        out.append(tpl.ENTITY_HEADING(
+            entity_name, anchor_id, entity_type, entity_info['uri']
+        ))
 
-        # Add labels
-        if entity_info['labels']:
-            content += "### Labels\n\n"
-            for label in entity_info['labels']:
-                content += f"- {label}\n"
-            content += "\n"
+        tpl.LABELS.write(out, entity_info['labels'], tpl.BULLET)
+        tpl.DESCRIPTION.write(out, entity_info['descriptions'], tpl.PARAGRAPH)
 
-        # Add descriptions
-        if entity_info['descriptions']:
-            content += "### Description\n\n"
-            for desc in entity_info['descriptions']:
-                content += f"{desc}\n\n"
+        link = self._entity_link
 
         # Add class-specific information
         if 'Class' in entity_info['types']:
-            if entity_info['superclasses']:
-                content += "### Superclasses\n\n"
-                for superclass in entity_info['superclasses']:
-                    anchor = self._get_anchor_id(
-                        f"{self.ontology_namespace}{superclass}"
-                    )
-                    content += f"- [{superclass}](#{anchor})\n"
-                content += "\n"
-
-            if entity_info['subclasses']:
-                content += "### Subclasses\n\n"
-                for subclass in entity_info['subclasses']:
-                    anchor = self._get_anchor_id(
-                        f"{self.ontology_namespace}{subclass}"
-                    )
-                    content += f"- [{subclass}](#{anchor})\n"
-                content += "\n"
-
-            if 'instances' in entity_info and entity_info['instances']:
-                content += "### Instances\n\n"
-                for instance in entity_info['instances']:
-                    anchor = self._get_anchor_id(
-                        f"{self.ontology_namespace}{instance}"
-                    )
-                    content += f"- [{instance}](#{anchor})\n"
-                content += "\n"
+            tpl.SUPERCLASSES.write(out, entity_info['superclasses'], link)
+            tpl.SUBCLASSES.write(out, entity_info['subclasses'], link)
+            tpl.INSTANCES.write(out, entity_info.get('instances'), link)
+            tpl.HIERARCHY.write(out, self._hierarchy_lines(entity_info), str)
 
         # Add property-specific information
         if 'Property' in entity_type:
-            if entity_info['domains']:
-                content += "### Domains\n\n"
-                for domain in entity_info['domains']:
-                    anchor = self._get_anchor_id(
-                        f"{self.ontology_namespace}{domain}"
-                    )
-                    content += f"- [{domain}](#{anchor})\n"
-                content += "\n"
+            tpl.DOMAINS.write(out, entity_info['domains'], link)
+            tpl.RANGES.write(out, entity_info['ranges'], tpl.BULLET)
+            tpl.CHARACTERISTICS.write(
+                out, entity_info.get('characteristics'), tpl.BULLET
+            )
+            tpl.INVERSE_PROPERTIES.write(
+                out, entity_info.get('inverse_properties'), link
+            )
+            tpl.SUBPROPERTIES.write(out, entity_info.get('subproperties'), link)
+            tpl.SUPERPROPERTIES.write(out, entity_info.get('superproperties'), link)
 
-            if entity_info['ranges']:
-                content += "### Ranges\n\n"
-                for range_obj in entity_info['ranges']:
-                    content += f"- {range_obj}\n"
-                content += "\n"
+        # Add individual-specific information
+        if entity_type == "Individual":
+            tpl.INSTANCE_OF.write(out, entity_info.get('instance_of'), link)
+            tpl.PROPERTY_VALUES.write(
+                out, entity_info.get('property_values'), self._property_value_line
+            )
 
-            if 'characteristics' in entity_info and entity_info['characteristics']:
-                content += "### Characteristics\n\n"
-                for char in entity_info['characteristics']:
-                    content += f"- {char}\n"
-                content += "\n"
+        # Add related entities section (only for entities in our ontology)
+        related = entity_info['related_entities']
+        if related:
+            base = self.ontology_base.lower()
+            tpl.RELATED_ENTITIES.write(
+                out, sorted(r for r in related if base in r.lower()), self._related_link
+            )
 
-            if 'inverse_properties' in entity_info and entity_info['inverse_properties']:
-                content += "### Inverse Properties\n\n"
-                for inv_prop in entity_info['inverse_properties']:
-                    anchor = self._get_anchor_id(
-                        f"{self.ontology_namespace}{inv_prop}"
-                    )
-                    content += f"- [{inv_prop}](#{anchor})\n"
-                content += "\n"
+        # Add backlinks from other entities of our ontology
+        tpl.REFERENCED_BY.write(
+            out, entity_info.get('referenced_by'), self._reference_line
+        )
 
-            if 'subproperties' in entity_info and entity_info['subproperties']:
-                content += "### Subproperties\n\n"
-                for subprop in entity_info['subproperties']:
-                    anchor = self._get_anchor_id(
-                        f"{self.ontology_namespace}{subprop}"
-                    )
-                    content += f"- [{subprop}](#{anchor})\n"
-                content += "\n"
+    def _hierarchy_lines(self, entity_info):
+        """Lines of a class's Hierarchy section: its ancestry, when it goes
+        beyond the direct superclass, and its number of descendants, when
+        there are more than its direct subclasses."""
+        lines = []
+        ancestry = entity_info.get('ancestry', ())
+        if len(ancestry) > 1:
+            chain = []
+            for uri in ancestry:
+                name = self.uris[uri].local_name
+                target = self._link_target(uri)
+                chain.append(tpl.INLINE_LINK(name, target) if target else name)
+            lines.append(tpl.ANCESTRY(" › ".join(chain)))
+        count = entity_info.get('descendant_count', 0)
+        if count > len(entity_info['subclasses']):
+            lines.append(tpl.DESCENDANTS(count))
+        return lines
+
+    def _entity_type(self, entity_info):
+        """Display name of an entity's type."""
+        if 'Class' in entity_info['types']:
+            return "Class"
+        elif 'ObjectProperty' in entity_info['types']:
+            return "Object Property"
+        elif 'DatatypeProperty' in entity_info['types']:
+            return "Datatype Property"
+        elif 'NamedIndividual' in entity_info['types']:
+            return "Individual"
+        return "Entity"
+
+    def _property_value_line(self, prop_value):
+        """List item showing one property value of an individual."""
+        prop_name = prop_value['property']
+        value = prop_value['value']
+        # Only create link if it's a URI reference to another entity
+        if prop_value.get('is_uri', False):
+            # Check if it's from our ontology namespace
+            target = self._link_target(value.uri)
+            if target:
+                return tpl.PROPERTY_VALUE_LINK(prop_name, value, target)
+            # External or undocumented entity, show as plain text
+            return tpl.PROPERTY_VALUE_URI(prop_name, value)
+        # Literal value, show as plain text
+        return tpl.PROPERTY_VALUE_LITERAL(prop_name, value)
+
+    def _entity_link(self, name):
+        """List item linking to the section of a related entity.
 
-            if 'superproperties' in entity_info and entity_info['superproperties']:
-                content += "### Superproperties\n\n"
-                for superprop in entity_info['superproperties']:
-                    anchor = self._get_anchor_id(
-                        f"{self.ontology_namespace}{superprop}"
-                    )
-                    content += f"- [{superprop}](#{anchor})\n"
-                content += "\n"
+        Args:
+            name: LinkedName of the entity
 
-        # Add individual-specific information
-        if entity_type == "Individual":
-            if 'instance_of' in entity_info and entity_info['instance_of']:
-                content += "### Instance Of\n\n"
-                for class_name in entity_info['instance_of']:
-                    anchor = self._get_anchor_id(
-                        f"{self.ontology_namespace}{class_name}"
-                    )
-                    content += f"- [{class_name}](#{anchor})\n"
-                content += "\n"
+        Returns:
+            Markdown line, rendered once per entity and then reused; the
+            bare name if no page documents the entity
+        """
+        line = self._link_lines.get(name.uri)
+        if line is None:
+            target = self._link_target(name.uri)
+            line = self._link_lines[name.uri] = (
+                tpl.LINK(name, target) if target else tpl.BULLET(name)
+            )
+        return line
+
+    def _reference_line(self, group):
+        """List item naming a predicate and the entities using it to point here."""
+        predicate_name, referrers = group
+        uris = self.uris
+        names = []
+        for uri in referrers:
+            name = uris[uri].local_name
+            target = self._link_target(uri)
+            names.append(tpl.INLINE_LINK(name, target) if target else name)
+        return tpl.REFERENCE_GROUP(predicate_name, ", ".join(names))
+
+    def _related_link(self, uri):
+        """List item linking to a related entity, given its full URI string."""
+        line = self._related_lines.get(uri)
+        if line is None:
+            name = self.uris[uri].local_name
+            target = self._link_target(uri)
+            line = self._related_lines[uri] = (
+                tpl.LINK(name, target) if target else tpl.BULLET(name)
+            )
+        return line
 
-            if 'property_values' in entity_info and entity_info['property_values']:
-                content += "### Property Values\n\n"
-                for prop_value in entity_info['property_values']:
-                    prop_name = prop_value['property']
-                    value = prop_value['value']
-                    # Only create link if it's a URI reference to another entity
-                    if prop_value.get('is_uri', False):
-                        # Check if it's from our ontology namespace
-                        if self.ontology_base.lower() in str(value).lower():
-                            anchor = self._get_anchor_id(
-                                f"{self.ontology_namespace}{value}"
-                            )
-                            content += f"- **{prop_name}**: [{value}](#{anchor})\n"
-                        else:
-                            # External URI, show as plain text
-                            content += f"- **{prop_name}**: `{value}`\n"
-                    else:
-                        # Literal value, show as plain text
-                        content += f"- **{prop_name}**: {value}\n"
-                content += "\n"
+    def _link_target(self, uri):
+        """Link target of an entity's section, or None if no page documents it.
 
-        # Add related entities section (only for entities in our ontology)
-        ontology_entities = [
-            r for r in entity_info['related_entities']
-            if self.ontology_base.lower() in r.lower()
-        ]
-        if ontology_entities:
-            content += "### Related Entities\n\n"
-            for related in sorted(ontology_entities):
-                related_name = self._get_local_name(URIRef(related))
-                anchor = self._get_anchor_id(related)
-                content += f"- [{related_name}](#{anchor})\n"
-            content += "\n"
+        While a page is rendered (see ``_set_link_context``) the target is
+        the anchor, prefixed with the path to the page holding the section
+        when that is another page. Outside page builds every entity of this
+        ontology is taken to be on the same page.
+        """
+        uri = str(uri)
+        anchor = self.uris[uri].anchor
+        if self._link_page is None:
+            return f"#{anchor}" if self.ontology_base.lower() in uri.lower() else None
+        page = self._local_pages.get(uri) or self.entity_locations.get(uri)
+        if page is None:
+            return None
+        if page == self._link_page:
+            return f"#{anchor}"
+        path = self._page_paths.get(page)
+        if path is None:
+            path = self._page_paths[page] = Path(
+                os.path.relpath(page, self._link_page.parent)
+            ).as_posix()
+        return f"{path}#{anchor}"
+
+    def _set_link_context(self, page_file=None, local_pages=None):
+        """Set the page being rendered, for ``_link_target``.
+
+        Link lines are cached per entity, so the caches are cleared whenever
+        the targets change.
 
-        return content
+        Args:
+            page_file: Page being rendered, or None once it is done
+            local_pages: Page holding each entity (URI string) of the pages
+                being rendered, where it differs from ``entity_locations``
+        """
+        self._link_page = page_file
+        self._local_pages = local_pages or {}
+        self._page_paths = {}
+        self._link_lines = {}
+        self._related_lines = {}
+
+    @property
+    def entity_locations(self):
+        """Page documenting each entity of the module and bridge pages
+        (URI string → page file), built on first use.
+
+        An entity documented on several pages maps to the first of them,
+        modules before bridges, and to the numbered page holding it when
+        its module is sharded. Entities are picked and ordered as on the
+        pages themselves, but from their types alone, without rendering.
+        """
+        if self._entity_locations is None:
+            locations = {}
+            for _, _, source_file, output_file in self._module_pages():
+                try:
+                    summary = self._module_summary(source_file)
+                except Exception:
+                    # Warned about when the page is rendered
+                    continue
+                entities_by_type = {key: [] for key, _, _ in tpl.ENTITY_GROUPS}
+                for uri in sorted(self._ontology_entities(summary.entities)):
+                    if self._is_blank_node(uri):
+                        continue
+                    group = self._entity_group(self._entity_types(URIRef(uri)))
+                    if group in entities_by_type:
+                        entities_by_type[group].append(
+                            {'uri': uri, 'local_name': self.uris[uri].local_name}
+                        )
+                for group in entities_by_type.values():
+                    group.sort(key=lambda x: x['local_name'].lower())
+                pages = self._entity_pages(output_file, entities_by_type)
+                for page_file, entity in pages:
+                    locations.setdefault(entity['uri'], page_file)
+            self._entity_locations = locations
+        return self._entity_locations
 
     def _get_ontology_metadata(self):
         """Extract metadata about the ontology itself."""
@@ -544,6 +787,27 @@ class OntologyDocGenerator:
 
     def generate_index(self):
         """Generate the index.md file with ontology overview."""
+        with self.profile.phase("rendering", "index"):
+            content = self._generate_index_content()
+
+        # Write to index.md, unless it already has this content
+        index_file = self.output_dir.parent / "index.md"
+        inputs = {'content': hashlib.sha256(content.encode('utf-8')).hexdigest()}
+        if self.manifest.is_current(index_file, inputs):
+            print(f"Index is up to date: {index_file}")
+            return index_file
+
+        with self.profile.phase("writing", "index"):
+            with open(index_file, 'w', encoding='utf-8') as f:
+                f.write(content)
+        self.manifest.record(index_file, inputs)
+        self.manifest.save()
+
+        print(f"Generated index at {index_file}")
+        return index_file
+
+    def _generate_index_content(self):
+        """Markdown of the index page."""
         metadata = self._get_ontology_metadata()
 
         # Count entities by type
@@ -578,9 +842,14 @@ class OntologyDocGenerator:
         content += f"- **Total Entities:** {classes + object_properties + datatype_properties + individuals}\n\n"
 
         content += "## Navigation\n\n"
-        content += "- **[Browse All Entities](entities.md)** - "
+        reference = self.entity_reference_file.relative_to(self.output_dir.parent)
+        content += f"- **[Browse All Entities]({reference.as_posix()})** - "
         content += "Complete documentation of all classes, properties, and individuals\n\n"
 
+        # Filled in by docs/javascripts/extra.js from the search index
+        content += "## Find an Entity\n\n"
+        content += '<div class="entity-search" data-entity-search></div>\n\n'
+
         if metadata['uri']:
             content += "## Ontology Information\n\n"
             content += f"**Ontology URI:** `{metadata['uri']}`\n\n"
@@ -599,37 +868,112 @@ class OntologyDocGenerator:
         if metadata['license']:
             content += f"## License\n\n{metadata['license']}\n\n"
 
-        # Write to index.md
-        index_file = self.output_dir.parent / "index.md"
-        with open(index_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        return content
 
-        print(f"Generated index at {index_file}")
-        return index_file
+    @property
+    def entity_reference_file(self):
+        """The single-page entity reference, linked from the index page."""
+        return self.output_dir / "entities.md"
+
+    def generate_all_docs(self):
+        """Generate entities.md, documenting every entity on one page.
+
+        The page starts with a table of contents and then has one section
+        per entity, sorted by name. Each section is written to the file as
+        soon as it is rendered, so memory use does not grow with the size
+        of the page.
+
+        Returns:
+            Path to the generated file
+        """
+        output_file = self.entity_reference_file
+        entity_uris = sorted(
+            (uri for uri in self._ontology_entities(defined_entities(self.graph))
+             if not self._is_blank_node(uri)),
+            key=lambda uri: (self.uris[uri].local_name.lower(), uri),
+        )
+
+        # Rebuild only if an entity, the namespace or the rendering code changed
+        entities_digest = hashlib.sha256()
+        for uri in entity_uris:
+            digest = self.index.digest(URIRef(uri))
+            entities_digest.update(f"{uri} {digest}\n".encode('utf-8'))
+        inputs = {
+            'sources': self.manifest.source_hashes(RENDER_SOURCES),
+            'namespace': self.ontology_namespace,
+            'entities': entities_digest.hexdigest(),
+            'hierarchy': self._hierarchy_inputs(entity_uris),
+        }
+        if self.manifest.is_current(output_file, inputs):
+            print(f"Entity reference is up to date: {output_file}")
+            return output_file
+
+        metadata = self._get_ontology_metadata()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(f"# {metadata['title']}: All Entities\n\n")
+            f.write(
+                "Complete documentation of all classes, properties, "
+                "and individuals.\n\n"
+            )
+
+            # Table of contents
+            f.write("## Table of Contents\n\n")
+            for uri in entity_uris:
+                names = self.uris[uri]
+                f.write(f"- [{names.local_name}](#{names.anchor})\n")
+            f.write("\n---\n\n")
+
+            # One section per entity, written as soon as it is rendered
+            profile = self.profile
+            self._set_link_context(output_file, dict.fromkeys(entity_uris, output_file))
+            try:
+                for uri in entity_uris:
+                    with profile.phase("entity extraction", "entities"):
+                        entity_info = self._add_placeholder_content(
+                            self._get_entity_info(uri)
+                        )
+                    with profile.phase("rendering", "entities"):
+                        parts = []
+                        self._write_entity_section(parts, entity_info)
+                        parts.append(tpl.SECTION_SEPARATOR)
+                    with profile.phase("writing", "entities"):
+                        f.writelines(parts)
+            finally:
+                self._set_link_context()
+
+        self.manifest.record(output_file, inputs)
+        self.manifest.save()
+
+        print(
+            f"Generated entity reference at {output_file} "
+            f"({len(entity_uris)} entities)"
+        )
+        return output_file
+
+    def _module_summary(self, module_path):
+        """Return the summary of a module file, parsing it only if the loader
+        did not record one (e.g. a module outside the import closure)."""
+        module_path = Path(module_path).resolve()
+        summary = self.module_summaries.get(module_path)
+        if summary is None:
+            module_graph = Graph()
+            parse_rdf(module_path, module_graph)
+            summary = self.module_summaries[module_path] = summarize_module(
+                module_path, module_graph
+            )
+        return summary
 
     def _get_module_info(self, module_path):
         """Extract metadata from a module file."""
-        module_graph = Graph()
         try:
-            module_graph.parse(module_path, format="turtle")
-
-            # Find ontology declaration
-            for ontology_uri in module_graph.subjects(RDF.type, OWL.Ontology):
-                metadata = {
-                    'title': None,
-                    'description': None,
-                    'uri': str(ontology_uri)
+            summary = self._module_summary(module_path)
+            if summary.uri is not None:
+                return {
+                    'title': summary.title,
+                    'description': summary.description,
+                    'uri': summary.uri
                 }
-
-                for label in module_graph.objects(ontology_uri, DC.title):
-                    metadata['title'] = str(label)
-                    break
-
-                for comment in module_graph.objects(ontology_uri, RDFS.comment):
-                    metadata['description'] = str(comment)
-                    break
-
-                return metadata
         except Exception as e:
             print(f"Warning: Could not extract metadata from {module_path}: {e}")
 
@@ -655,8 +999,13 @@ class OntologyDocGenerator:
 
         return entity_info
 
-    def _categorize_entities_by_type(self, entity_uris):
-        """Categorize entities by their OWL type."""
+    def _categorize_entities_by_type(self, entity_uris, module=None):
+        """Categorize entities by their OWL type.
+
+        Args:
+            entity_uris: Entities to categorize
+            module: Page the entities are for, as named in the build profile
+        """
         categories = {
             'classes': [],
             'object_properties': [],
@@ -665,266 +1014,771 @@ class OntologyDocGenerator:
             'other': []
         }
 
-        for entity_uri in entity_uris:
-            # Skip blank nodes and RDF/OWL internal constructs
-            if self._is_blank_node(entity_uri):
-                continue
-
-            try:
-                entity_info = self._get_entity_info(entity_uri)
-                if not entity_info:
+        entity_infos = []
+        with self.profile.phase("entity extraction", module):
+            for entity_uri in entity_uris:
+                # Skip blank nodes and RDF/OWL internal constructs
+                if self._is_blank_node(entity_uri):
                     continue
 
-                # Skip if it has no types (likely not a real entity)
-                if not entity_info['types']:
-                    continue
+                try:
+                    entity_info = self._get_entity_info(entity_uri)
+                    if not entity_info:
+                        continue
 
-                # Add placeholder content if missing labels/descriptions
-                entity_info = self._add_placeholder_content(entity_info)
-
-                # Categorize based on types
-                if 'Class' in entity_info['types']:
-                    categories['classes'].append(entity_info)
-                elif 'ObjectProperty' in entity_info['types']:
-                    categories['object_properties'].append(entity_info)
-                elif 'DatatypeProperty' in entity_info['types']:
-                    categories['datatype_properties'].append(entity_info)
-                elif 'NamedIndividual' in entity_info['types']:
-                    categories['individuals'].append(entity_info)
-                else:
-                    categories['other'].append(entity_info)
-            except Exception as e:
-                print(f"Error categorizing {entity_uri}: {e}")
+                    # Skip if it has no types (likely not a real entity)
+                    if not entity_info['types']:
+                        continue
+
+                    # Add placeholder content if missing labels/descriptions
+                    entity_infos.append(self._add_placeholder_content(entity_info))
+                except Exception as e:
+                    print(f"Error categorizing {entity_uri}: {e}")
 
-        # Sort each category alphabetically
-        for category in categories.values():
-            category.sort(key=lambda x: x['local_name'].lower())
+        with self.profile.phase("categorisation", module):
+            for entity_info in entity_infos:
+                categories[self._entity_group(entity_info['types'])].append(entity_info)
+
+            # Sort each category alphabetically
+            for category in categories.values():
+                category.sort(key=lambda x: x['local_name'].lower())
 
         return categories
 
+    def _entity_group(self, types):
+        """Key of the page section listing an entity with these types."""
+        if 'Class' in types:
+            return 'classes'
+        elif 'ObjectProperty' in types:
+            return 'object_properties'
+        elif 'DatatypeProperty' in types:
+            return 'datatype_properties'
+        elif 'NamedIndividual' in types:
+            return 'individuals'
+        return 'other'
+
     def _generate_module_page(self, module_name, module_path, entities_by_type):
         """Generate a documentation page for a single module."""
         module_info = self._get_module_info(module_path)
 
         # Build page content
-        title = module_info['title'] or f"Module: {module_name}"
-        content = f"# {title}\n\n"
+        out = [tpl.MODULE_TITLE(module_info['title'] or f"Module: {module_name}")]
 
         if module_info['description']:
-            content += f"{module_info['description']}\n\n"
-
-        content += f"**Module URI:** `{module_info['uri'] or 'N/A'}`\n\n"
-        content += f"**Source:** `{module_path.relative_to(self.ontology_path.parent.parent)}`\n\n"
+            out.append(tpl.MODULE_DESCRIPTION(module_info['description']))
 
         # Count entities
         total = sum(len(entities) for entities in entities_by_type.values())
-        content += f"**Total Entities:** {total}\n\n"
+        out.append(tpl.MODULE_DETAILS(
+            module_info['uri'] or 'N/A',
+            module_path.relative_to(self.ontology_path.parent.parent),
+            total,
+        ))
+        self._write_module_diagram(out, module_name, module_path)
 
         # Table of contents
-        content += "## Contents\n\n"
-        if entities_by_type['classes']:
-            content += f"- [Classes](#classes) ({len(entities_by_type['classes'])})\n"
-        if entities_by_type['object_properties']:
-            obj_props_count = len(entities_by_type['object_properties'])
-            content += (
-                f"- [Object Properties](#object-properties) ({obj_props_count})\n"
-            )
-        if entities_by_type['datatype_properties']:
-            dt_props_count = len(entities_by_type['datatype_properties'])
-            content += (
-                f"- [Datatype Properties](#datatype-properties) ({dt_props_count})\n"
-            )
-        if entities_by_type['individuals']:
-            ind_count = len(entities_by_type['individuals'])
-            content += f"- [Individuals](#individuals) ({ind_count})\n"
-        content += "\n---\n\n"
+        out.append(tpl.MODULE_CONTENTS)
+        for key, heading, anchor in tpl.ENTITY_GROUPS:
+            if entities_by_type[key]:
+                out.append(tpl.MODULE_CONTENTS_LINE(
+                    heading, anchor, len(entities_by_type[key])
+                ))
+        out.append(tpl.MODULE_CONTENTS_END)
 
         # Generate sections for each type
-        if entities_by_type['classes']:
-            content += "## Classes\n\n"
-            for entity_info in entities_by_type['classes']:
-                content += self._generate_entity_section(entity_info)
-                content += "\n---\n\n"
-
-        if entities_by_type['object_properties']:
-            content += "## Object Properties\n\n"
-            for entity_info in entities_by_type['object_properties']:
-                content += self._generate_entity_section(entity_info)
-                content += "\n---\n\n"
-
-        if entities_by_type['datatype_properties']:
-            content += "## Datatype Properties\n\n"
-            for entity_info in entities_by_type['datatype_properties']:
-                content += self._generate_entity_section(entity_info)
-                content += "\n---\n\n"
-
-        if entities_by_type['individuals']:
-            content += "## Individuals\n\n"
-            for entity_info in entities_by_type['individuals']:
-                content += self._generate_entity_section(entity_info)
-                content += "\n---\n\n"
+        for key, heading, _ in tpl.ENTITY_GROUPS:
+            if entities_by_type[key]:
+                out.append(tpl.TYPE_HEADING(heading))
+                for entity_info in entities_by_type[key]:
+                    self._write_entity_section(out, entity_info)
+                    out.append(tpl.SECTION_SEPARATOR)
 
-        return content
+        return "".join(out)
 
-    def generate_modular_docs(self):
-        """Generate documentation organized by module structure."""
-        if not self.graph:
-            print("No ontology loaded. Cannot generate documentation.")
-            return []
+    def _write_module_diagram(self, out, module_name, module_path):
+        """Append the module's class diagram to its page, if one was drawn.
 
-        # Create modules directory in docs
-        modules_doc_dir = self.output_dir.parent / "modules"
-        modules_doc_dir.mkdir(parents=True, exist_ok=True)
+        The SVG sits next to the page, under the same name.
+        """
+        diagram = self.diagrams.get(Path(module_path).resolve())
+        if diagram is not None:
+            out.append(tpl.MODULE_DIAGRAM(module_name, diagram.name))
 
-        # Get the ontology directory structure
-        ontology_dir = self.ontology_path.parent
-        modules_dir = ontology_dir / "modules"
-        bridges_dir = ontology_dir / "bridges"
+    def _shard_entities(self, entities_by_type):
+        """Split a module's documented entities into pages of ``shard_size``.
 
-        generated_files = []
+        Entities keep their module page order (classes, object properties,
+        datatype properties, individuals, each sorted by name).
 
-        # Process modules directory
-        if modules_dir.exists():
-            for module_file in sorted(modules_dir.rglob("*.ttl")):
-                # Get relative path from modules directory
-                rel_path = module_file.relative_to(modules_dir)
-                module_name = rel_path.stem
+        Returns:
+            List of pages, each a list of (group key, entity infos) pairs,
+            or None if the module fits on one page
+        """
+        entities = [
+            (key, entity_info)
+            for key, _, _ in tpl.ENTITY_GROUPS for entity_info in entities_by_type[key]
+        ]
+        if not self.shard_size or len(entities) <= self.shard_size:
+            return None
+
+        shards = []
+        for start in range(0, len(entities), self.shard_size):
+            groups = {}
+            for key, entity_info in entities[start:start + self.shard_size]:
+                groups.setdefault(key, []).append(entity_info)
+            shards.append(list(groups.items()))
+        return shards
+
+    def _shard_file(self, output_file, page):
+        """File of a numbered page of a sharded module page."""
+        return output_file.with_suffix("") / f"page-{page}.md"
+
+    def _entity_pages(self, output_file, entities_by_type):
+        """Yield (page file, entity info) for the entities of a module page,
+        naming the numbered page each is on if the module is sharded."""
+        shards = self._shard_entities(entities_by_type)
+        if shards is None:
+            for key, _, _ in tpl.ENTITY_GROUPS:
+                for entity_info in entities_by_type[key]:
+                    yield output_file, entity_info
+            return
+        for page, shard in enumerate(shards, 1):
+            for _, entity_infos in shard:
+                for entity_info in entity_infos:
+                    yield self._shard_file(output_file, page), entity_info
+
+    def _shard_navigation(self, module_file_name, page_names, position):
+        """Links from a numbered page to the module page and its neighbours."""
+        links = [tpl.INLINE_LINK("Module overview", f"../{module_file_name}")]
+        if position > 0:
+            links.append(tpl.INLINE_LINK("Previous page", page_names[position - 1]))
+        if position < len(page_names) - 1:
+            links.append(tpl.INLINE_LINK("Next page", page_names[position + 1]))
+        return tpl.SHARD_NAVIGATION(" · ".join(links))
+
+    def _generate_sharded_module(self, module_name, module_path, output_file,
+                                 entities_by_type, shards, local_pages):
+        """Generate the overview and numbered pages of a large module.
+
+        The overview keeps the module's page path and header and lists the
+        numbered pages. Each entity keeps its anchor on the numbered page
+        holding it, and links between numbered pages name that page.
 
-                # Parse the module to find its entities
-                module_graph = Graph()
-                try:
-                    module_graph.parse(module_file, format="turtle")
-                except Exception as e:
-                    print(f"Warning: Could not parse {module_file}: {e}")
-                    continue
+        Args:
+            module_name: Page name
+            module_path: Module or bridge file
+            output_file: Module page file
+            entities_by_type: Categorized entity infos
+            shards: Pages from ``_shard_entities``
+            local_pages: Numbered page holding each entity (URI string)
 
-                # Collect entities from this module
-                # Look for all classes, properties, and individuals defined here
-                entity_uris = set()
+        Returns:
+            List of (file, content) pairs, overview first
+        """
+        module_info = self._get_module_info(module_path)
+        title = module_info['title'] or f"Module: {module_name}"
+        headings = {key: heading for key, heading, _ in tpl.ENTITY_GROUPS}
+        page_names = [self._shard_file(output_file, page).name
+                      for page in range(1, len(shards) + 1)]
+        shard_dir = output_file.stem
 
-                # Get all classes
-                for class_uri in module_graph.subjects(RDF.type, OWL.Class):
-                    if self.ontology_base.lower() in str(class_uri).lower():
-                        entity_uris.add(str(class_uri))
+        # Overview page
+        out = [tpl.MODULE_TITLE(title)]
+        if module_info['description']:
+            out.append(tpl.MODULE_DESCRIPTION(module_info['description']))
+        total = sum(len(entities) for entities in entities_by_type.values())
+        out.append(tpl.MODULE_DETAILS(
+            module_info['uri'] or 'N/A',
+            module_path.relative_to(self.ontology_path.parent.parent),
+            total,
+        ))
+        self._write_module_diagram(out, module_name, module_path)
+
+        out.append(tpl.MODULE_CONTENTS)
+        first_page = {}
+        for position, shard in enumerate(shards):
+            for key, _ in shard:
+                first_page.setdefault(key, position)
+        for key, heading, anchor in tpl.ENTITY_GROUPS:
+            if entities_by_type[key]:
+                target = f"{shard_dir}/{page_names[first_page[key]]}#{anchor}"
+                out.append(tpl.SHARD_CONTENTS_LINE(
+                    heading, target, len(entities_by_type[key])
+                ))
+        out.append(tpl.SHARD_PAGES_END)
+
+        out.append(tpl.SHARD_PAGES)
+        for position, shard in enumerate(shards):
+            out.append(tpl.SHARD_PAGES_LINE(
+                position + 1, f"{shard_dir}/{page_names[position]}",
+                shard[0][1][0]['local_name'], shard[-1][1][-1]['local_name'],
+                sum(len(entity_infos) for _, entity_infos in shard),
+            ))
+        out.append(tpl.MODULE_CONTENTS_END)
+        files = [(output_file, "".join(out))]
+
+        # Numbered pages
+        for position, shard in enumerate(shards):
+            shard_file = self._shard_file(output_file, position + 1)
+            self._set_link_context(shard_file, local_pages)
+            navigation = self._shard_navigation(output_file.name, page_names, position)
+            out = [tpl.SHARD_TITLE(title, position + 1, len(shards)), navigation]
+            for key, entity_infos in shard:
+                out.append(tpl.TYPE_HEADING(headings[key]))
+                for entity_info in entity_infos:
+                    self._write_entity_section(out, entity_info)
+                    out.append(tpl.SECTION_SEPARATOR)
+            out.append(navigation)
+            files.append((shard_file, "".join(out)))
+
+        return files
+
+    def _ontology_entities(self, entity_uris):
+        """Keep the entity URIs that belong to this ontology's namespace."""
+        base = self.ontology_base.lower()
+        return {uri for uri in entity_uris if base in uri.lower()}
+
+    def _page_inputs(self, sources, entity_uris, module_file):
+        """Build-manifest inputs of a module page.
+
+        The page's inputs are the module file, the rendering code (see
+        ``RENDER_SOURCES``), the ontology namespace, the shard size, whether
+        the page shows a class diagram, the content digest of every entity
+        on the page, the ancestry and subtree size of its classes and the
+        pages documenting the entities it links to.
+        """
+        diagram = self.diagrams.get(Path(module_file).resolve())
+        return {
+            'sources': sources,
+            'namespace': self.ontology_namespace,
+            'shard_size': self.shard_size,
+            'diagram': diagram.name if diagram else None,
+            'entities': {
+                uri: self.index.digest(URIRef(uri)) for uri in sorted(entity_uris)
+            },
+            'hierarchy': self._hierarchy_inputs(entity_uris),
+            'links': self._link_inputs(entity_uris),
+        }
 
-                # Also get classes defined via rdfs:subClassOf
-                for class_uri in module_graph.subjects(RDFS.subClassOf, None):
-                    if self.ontology_base.lower() in str(class_uri).lower():
-                        entity_uris.add(str(class_uri))
+    def _link_inputs(self, entity_uris):
+        """Page documenting each entity that sections of some entities may
+        link to (URI string → path relative to the docs directory), so that
+        their links are rebuilt when such a page moves."""
+        locations = self.entity_locations
+        hierarchy = self.hierarchy
+        own = set(entity_uris)
+        linked = set()
+        for uri in own:
+            term = URIRef(uri)
+            for _, objects in self.index.predicate_objects(term):
+                linked.update(str(obj) for obj in objects if isinstance(obj, URIRef))
+            for _, subjects in self.index.predicate_subjects(term):
+                linked.update(
+                    str(subject) for subject in subjects if isinstance(subject, URIRef)
+                )
+            if uri in hierarchy:
+                linked.update(hierarchy.ancestry(uri))
+        docs_dir = self.output_dir.parent
+        return {
+            uri: locations[uri].relative_to(docs_dir).as_posix()
+            for uri in sorted(linked - own) if uri in locations
+        }
 
-                # Get all properties
-                for prop_uri in module_graph.subjects(RDF.type, OWL.ObjectProperty):
-                    if self.ontology_base.lower() in str(prop_uri).lower():
-                        entity_uris.add(str(prop_uri))
+    def _hierarchy_inputs(self, entity_uris):
+        """Ancestry and descendant count of the classes among some entities,
+        which change with classes other than the entities themselves."""
+        hierarchy = self.hierarchy
+        return {
+            uri: [*hierarchy.ancestry(uri), hierarchy.subtree_size(uri)]
+            for uri in sorted(entity_uris) if uri in hierarchy
+        }
+
+    def _render_module_page(self, module_name, module_file, output_file, sources,
+                            entity_uris=None):
+        """Render one module or bridge page.
 
-                for prop_uri in module_graph.subjects(RDF.type, OWL.DatatypeProperty):
-                    if self.ontology_base.lower() in str(prop_uri).lower():
-                        entity_uris.add(str(prop_uri))
+        Runs in a worker process when pages are rendered in parallel, so it
+        only reads the entity index and module summaries and writes nothing.
+
+        Args:
+            module_name: Page name
+            module_file: Module or bridge file
+            output_file: Page file
+            sources: Source file hashes of the page
+            entity_uris: Entities on the page, or None to take them from
+                the module's summary
 
-                # Get all individuals
-                for ind_uri in module_graph.subjects(RDF.type, OWL.NamedIndividual):
-                    if self.ontology_base.lower() in str(ind_uri).lower():
-                        entity_uris.add(str(ind_uri))
+        Returns:
+            Tuple of (inputs, files) where files lists (file, content) pairs,
+            the page first and then any numbered pages it was split into; or
+            (None, warning) if the module file could not be parsed
+        """
+        if entity_uris is None:
+            # Find the module's entities
+            try:
+                summary = self._module_summary(module_file)
+            except Exception as e:
+                return None, f"Warning: Could not parse {module_file}: {e}"
+            entity_uris = self._ontology_entities(summary.entities)
 
-                # Categorize entities
-                entities_by_type = self._categorize_entities_by_type(entity_uris)
+        inputs = self._page_inputs(sources, entity_uris, module_file)
 
-                # Generate page content
+        # Categorize entities
+        entities_by_type = self._categorize_entities_by_type(
+            inputs['entities'], module_name
+        )
+
+        # Generate page content, split into numbered pages if it is large
+        with self.profile.phase("rendering", module_name):
+            # Links to the page's own entities stay on it, even for entities
+            # that an earlier page documents too
+            local_pages = {
+                entity_info['uri']: page_file
+                for page_file, entity_info
+                in self._entity_pages(output_file, entities_by_type)
+            }
+            shards = self._shard_entities(entities_by_type)
+            try:
+                if shards is not None:
+                    return inputs, self._generate_sharded_module(
+                        module_name, module_file, output_file, entities_by_type, shards,
+                        local_pages,
+                    )
+                self._set_link_context(output_file, local_pages)
                 content = self._generate_module_page(
                     module_name, module_file, entities_by_type
                 )
+                return inputs, [(output_file, content)]
+            finally:
+                self._set_link_context()
 
-                # Create output directory structure
-                output_subdir = modules_doc_dir / rel_path.parent
-                output_subdir.mkdir(parents=True, exist_ok=True)
+    def _render_module_pages(self, jobs):
+        """Render module pages, in a process pool when there are several.
 
-                # Write file
-                output_file = output_subdir / f"{module_name}.md"
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
+        Workers are forked after the entity index is built and share it
+        with this process; results come back in job order, so the output
+        is the same as rendering the pages one by one.
+
+        Args:
+            jobs: Argument tuples for ``_render_module_page``
+
+        Returns:
+            List of ``_render_module_page`` results, in job order
+        """
+        max_workers = min(self.max_workers, len(jobs))
+        if max_workers <= 1:
+            return [self._render_module_page(*job) for job in jobs]
+
+        # Build them, and the index, before forking
+        self.uris
+        self.hierarchy
+        self.entity_locations
+        # Keep the garbage collector from touching (and so copying) the
+        # index pages the workers share with this process
+        gc.freeze()
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context(),
+                                     initializer=_init_render_worker,
+                                     initargs=(self,)) as pool:
+                return list(pool.map(_render_module_page_worker, jobs))
+        finally:
+            gc.unfreeze()
 
-                print(f"Generated module page: {output_file}")
-                generated_files.append(output_file)
+    def _module_pages(self):
+        """List the module and bridge pages, modules first.
+
+        Returns:
+            List of (kind, page name, source file, output file) tuples
+        """
+        # Get the ontology directory structure
+        ontology_dir = self.ontology_path.parent
+        modules_dir = ontology_dir / "modules"
+        bridges_dir = ontology_dir / "bridges"
+        modules_doc_dir = self.output_dir.parent / "modules"
+        bridges_doc_dir = self.output_dir.parent / "bridges"
+
+        pages = []
+
+        # Process modules directory
+        if modules_dir.exists():
+            for module_file in sorted(modules_dir.rglob("*.ttl")):
+                # Get relative path from modules directory
+                rel_path = module_file.relative_to(modules_dir)
+                module_name = rel_path.stem
+                output_file = modules_doc_dir / rel_path.parent / f"{module_name}.md"
+                pages.append(("module", module_name, module_file, output_file))
 
         # Process bridges directory
         if bridges_dir.exists():
-            bridges_doc_dir = self.output_dir.parent / "bridges"
-            bridges_doc_dir.mkdir(parents=True, exist_ok=True)
-
             for bridge_file in sorted(bridges_dir.rglob("*.ttl")):
                 rel_path = bridge_file.relative_to(bridges_dir)
                 bridge_name = rel_path.stem
+                output_file = bridges_doc_dir / f"{bridge_name}.md"
+                pages.append(("bridge", bridge_name, bridge_file, output_file))
+
+        return pages
+
+    def _page_url(self, page_file, use_directory_urls=True):
+        """Site URL of a generated page, relative to the site root."""
+        rel_path = page_file.relative_to(self.output_dir.parent).with_suffix("")
+        if use_directory_urls:
+            return f"{rel_path.as_posix()}/"
+        return f"{rel_path.as_posix()}.html"
+
+    def _search_entry(self, entity_info, page_url):
+        """Search index entry of an entity documented on a page."""
+        entity_uri = URIRef(entity_info['uri'])
+        return SearchEntry(
+            name=entity_info['local_name'],
+            url=f"{page_url}#{self._get_anchor_id(entity_info['uri'])}",
+            type=self._entity_type(entity_info),
+            labels=[str(label) for label in self.index.objects(entity_uri, RDFS.label)],
+            alt_labels=[
+                str(label) for label in self.index.objects(entity_uri, SKOS.altLabel)
+            ],
+            definitions=[
+                str(desc)
+                for predicate in (SKOS.definition, RDFS.comment, DC.description)
+                for desc in self.index.objects(entity_uri, predicate)
+            ],
+        )
 
-                # Parse the bridge file
-                bridge_graph = Graph()
-                try:
-                    bridge_graph.parse(bridge_file, format="turtle")
-                except Exception as e:
-                    print(f"Warning: Could not parse {bridge_file}: {e}")
-                    continue
+    def generate_search_index(self, use_directory_urls=True):
+        """Generate the client-side search index of the documented entities.
 
-                # Collect entities from this bridge
-                # Look for all classes, properties, and individuals defined here
-                entity_uris = set()
+        Indexes every entity shown on a module or bridge page (see
+        ``search_index``), linking it to its section on the first page it
+        appears on (the numbered page holding it, for a sharded module). The
+        index is rebuilt only when an entity, a module file or the namespace
+        changed.
 
-                # Get all classes
-                for class_uri in bridge_graph.subjects(RDF.type, OWL.Class):
-                    if self.ontology_base.lower() in str(class_uri).lower():
-                        entity_uris.add(str(class_uri))
+        Args:
+            use_directory_urls: Whether MkDocs serves ``page.md`` as
+                ``page/`` (its default) rather than ``page.html``
 
-                # Also get classes defined via rdfs:subClassOf
-                for class_uri in bridge_graph.subjects(RDFS.subClassOf, None):
-                    if self.ontology_base.lower() in str(class_uri).lower():
-                        entity_uris.add(str(class_uri))
+        Returns:
+            Path to the search index
+        """
+        output_file = self.output_dir.parent / "assets" / SEARCH_INDEX_NAME
+        module_pages = self._module_pages()
+
+        pages = []  # (page file, entity URIs)
+        for _, _, source_file, page_file in module_pages:
+            try:
+                summary = self._module_summary(source_file)
+            except Exception as e:
+                print(f"Warning: Could not parse {source_file}: {e}")
+                continue
+            pages.append((page_file, sorted(self._ontology_entities(summary.entities))))
+
+        # Rebuild only if an entity, a module, the URL style or this code changed
+        inputs = {
+            'sources': self.manifest.source_hashes(
+                [*RENDER_SOURCES, SEARCH_INDEX_SOURCE]
+                + [source_file for _, _, source_file, _ in module_pages]
+            ),
+            'namespace': self.ontology_namespace,
+            'directory_urls': use_directory_urls,
+            'shard_size': self.shard_size,
+            'entities': {
+                uri: self.index.digest(URIRef(uri))
+                for _, entity_uris in pages for uri in entity_uris
+            },
+        }
+        if self.manifest.is_current(output_file, inputs):
+            print(f"Search index is up to date: {output_file}")
+            return output_file
 
-                # Get all properties
-                for prop_uri in bridge_graph.subjects(RDF.type, OWL.ObjectProperty):
-                    if self.ontology_base.lower() in str(prop_uri).lower():
-                        entity_uris.add(str(prop_uri))
+        categorized = [
+            (page_file, self._categorize_entities_by_type(entity_uris, "search index"))
+            for page_file, entity_uris in pages
+        ]
+        entries = []
+        seen = set()
+        with self.profile.phase("rendering", "search index"):
+            for page_file, entities_by_type in categorized:
+                # Only the entities that get a section, on the page holding it
+                entity_pages = self._entity_pages(page_file, entities_by_type)
+                for entity_page, entity_info in entity_pages:
+                    if entity_info['uri'] not in seen:
+                        seen.add(entity_info['uri'])
+                        page_url = self._page_url(entity_page, use_directory_urls)
+                        entries.append(self._search_entry(entity_info, page_url))
+
+        with self.profile.phase("writing", "search index"):
+            write_search_index(output_file, entries)
+        self.manifest.record(output_file, inputs)
+        self.manifest.save()
+        print(f"Generated search index of {len(entries)} entities at {output_file}")
+        return output_file
+
+    def _remove_stale_parts(self, output_file, parts):
+        """Delete numbered pages of a module page that the last build wrote
+        and this one did not, e.g. after the module shrank."""
+        stale = [part for part in self.manifest.parts(output_file) if part not in parts]
+        for part in stale:
+            part.unlink(missing_ok=True)
+        if stale and not parts:
+            try:
+                output_file.with_suffix("").rmdir()
+            except OSError:
+                pass
 
-                for prop_uri in bridge_graph.subjects(RDF.type, OWL.DatatypeProperty):
-                    if self.ontology_base.lower() in str(prop_uri).lower():
-                        entity_uris.add(str(prop_uri))
+    def generate_module_diagrams(self):
+        """Draw a class and property diagram (SVG) of every module.
 
-                # Get all individuals
-                for ind_uri in bridge_graph.subjects(RDF.type, OWL.NamedIndividual):
-                    if self.ontology_base.lower() in str(ind_uri).lower():
-                        entity_uris.add(str(ind_uri))
+        Each diagram is written next to its module page, which then shows
+        it. A diagram is redrawn only when its module file or what it shows
+        changed since the last build (see the build manifest); the others
+        are drawn in parallel (see ``max_workers``). Needs networkx and
+        matplotlib; without them no diagrams are drawn. Diagrams of earlier
+        builds that are not drawn now, such as that of a module whose classes
+        were all removed, are deleted.
 
-                # Categorize entities
-                entities_by_type = self._categorize_entities_by_type(entity_uris)
+        Returns:
+            List of diagram files
+        """
+        if not self.graph:
+            print("No ontology loaded. Cannot generate diagrams.")
+            return []
+        if not diagrams_available():
+            print(
+                "Warning: networkx and matplotlib are needed for module diagrams, "
+                "skipping them"
+            )
+            self.diagrams = {}
+            self._remove_stale_diagrams()
+            self.manifest.save()
+            return []
 
-                # Generate page content
-                content = self._generate_module_page(
-                    bridge_name, bridge_file, entities_by_type
+        diagrams = {}
+        jobs = []
+        job_inputs = []
+        for kind, page_name, source_file, output_file in self._module_pages():
+            if kind != "module":
+                continue
+            try:
+                summary = self._module_summary(source_file)
+            except Exception as e:
+                print(f"Warning: Could not parse {source_file}: {e}")
+                continue
+            spec = module_diagram_spec(
+                summary.title or page_name, summary.entities,
+                self.index, self.uris, self.hierarchy,
+            )
+            if not spec.nodes:
+                continue
+
+            # Redraw only if the module, what the diagram shows or the
+            # drawing code changed
+            diagram_file = output_file.with_suffix(".svg")
+            inputs = {
+                'sources': self.manifest.source_hashes([source_file, DIAGRAM_SOURCE]),
+                'diagram': spec.digest(),
+            }
+            diagrams[source_file.resolve()] = diagram_file
+            if not self.manifest.is_current(diagram_file, inputs):
+                jobs.append((spec, diagram_file))
+                job_inputs.append(inputs)
+
+        with self.profile.phase("rendering", "diagrams"):
+            errors = self._render_diagrams(jobs)
+
+        for (_, diagram_file), inputs, error in zip(jobs, job_inputs, errors):
+            if error:
+                print(f"Warning: Could not draw {diagram_file}: {error}")
+                diagrams = {k: v for k, v in diagrams.items() if v != diagram_file}
+                continue
+            self.manifest.record(diagram_file, inputs)
+            print(f"Generated diagram: {diagram_file}")
+        self.diagrams = diagrams
+        self._remove_stale_diagrams()
+        self.manifest.save()
+        unchanged = len(diagrams) - len(jobs)
+        if unchanged > 0:
+            print(f"Skipped {unchanged} unchanged module diagrams")
+
+        return list(diagrams.values())
+
+    def _remove_stale_diagrams(self):
+        """Delete the diagrams recorded by earlier builds that are not in
+        ``self.diagrams``, and forget them in the build manifest."""
+        current = {diagram.resolve() for diagram in self.diagrams.values()}
+        for diagram in self.manifest.files():
+            if diagram.suffix == ".svg" and diagram.resolve() not in current:
+                diagram.unlink(missing_ok=True)
+                self.manifest.remove(diagram)
+                print(f"Removed stale diagram: {diagram}")
+
+    def _render_diagrams(self, jobs):
+        """Draw diagrams, in a process pool when there are several.
+
+        Args:
+            jobs: (DiagramSpec, file) pairs
+
+        Returns:
+            Error message or None per job, in job order
+        """
+        max_workers = min(self.max_workers, len(jobs))
+        if max_workers <= 1:
+            return [render_diagram_job(job) for job in jobs]
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=mp_context()
+        ) as pool:
+            return list(pool.map(render_diagram_job, jobs))
+
+    def generate_modular_docs(self):
+        """Generate documentation organized by module structure.
+
+        Pages whose module file and entities are unchanged since the last
+        build (see the build manifest) are left as they are, unless the
+        generator was created with ``force=True``. The remaining pages are
+        rendered in parallel (see ``max_workers``).
+        """
+        if not self.graph:
+            print("No ontology loaded. Cannot generate documentation.")
+            return []
+
+        # Create modules directory in docs
+        (self.output_dir.parent / "modules").mkdir(parents=True, exist_ok=True)
+
+        pages = self._module_pages()
+
+        # A module the catalog does not reach has none of its entities in
+        # the graph, so its page would document nothing
+        if self.loaded_files:
+            for path in unreachable_files(self.ontology_path, self.loaded_files):
+                print(
+                    f"Warning: {path} is not in the import closure of "
+                    f"{self.ontology_path.name}; add it to {CATALOG_FILENAME} "
+                    f"and import it, or its page documents no entities"
                 )
 
-                # Write file
-                output_file = bridges_doc_dir / f"{bridge_name}.md"
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
+        # Find the pages whose inputs changed since the last build
+        stale = []
+        jobs = []
+        for position, (_, page_name, source_file, output_file) in enumerate(pages):
+            sources = self.manifest.source_hashes([source_file, *RENDER_SOURCES])
+            previous = self.manifest.entry(output_file)
+            entity_uris = None
+            if (previous and previous['sources'] == sources
+                    and previous['namespace'] == self.ontology_namespace):
+                # Same module file: it defines the same entities as last time
+                entity_uris = list(previous['entities'])
+                inputs = self._page_inputs(sources, entity_uris, source_file)
+                if self.manifest.is_current(output_file, inputs):
+                    continue
+            stale.append(position)
+            jobs.append((page_name, source_file, output_file, sources, entity_uris))
+
+        rendered = dict(zip(stale, self._render_module_pages(jobs)))
 
-                print(f"Generated bridge page: {output_file}")
-                generated_files.append(output_file)
+        generated_files = []
+        for position, (kind, page_name, _, output_file) in enumerate(pages):
+            if position in rendered:
+                inputs, result = rendered[position]
+                if inputs is None:
+                    print(result)
+                    continue
+                files = result
+
+                # Write files
+                with self.profile.phase("writing", page_name):
+                    for file, content in files:
+                        file.parent.mkdir(parents=True, exist_ok=True)
+                        with open(file, 'w', encoding='utf-8') as f:
+                            f.write(content)
+                parts = [file for file, _ in files[1:]]
+                self._remove_stale_parts(output_file, parts)
+                self.manifest.record(output_file, inputs, parts)
+                if parts:
+                    print(f"Generated {kind} page: {output_file} ({len(parts)} pages)")
+                else:
+                    print(f"Generated {kind} page: {output_file}")
+            generated_files.append(output_file)
+
+        self.manifest.save()
+        unchanged = len(pages) - len(stale)
+        if unchanged:
+            print(f"Skipped {unchanged} unchanged module pages")
 
         return generated_files
 
-def main():
+def main(argv=None):
     """Main function to run the documentation generator."""
-    generator = OntologyDocGenerator()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Regenerate every page, ignoring the build manifest",
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=None,
+        help="Processes rendering module pages (default: CPU count)",
+    )
+    parser.add_argument(
+        "--shard-size", type=int, default=DEFAULT_SHARD_SIZE,
+        help="Split module pages with more entities than this into numbered "
+             f"pages (default: {DEFAULT_SHARD_SIZE}; 0 never splits)",
+    )
+    parser.add_argument(
+        "--profile", nargs="?", const="build-profile.json", metavar="FILE",
+        help="Record time and peak memory of each phase per module, write "
+             "them to FILE (default: build-profile.json) and print a summary; "
+             "renders in one process",
+    )
+    args = parser.parse_args(argv)
+
+    profile = BuildProfile(enabled=bool(args.profile))
+    try:
+        generate_all(OntologyDocGenerator(force=args.force, max_workers=args.jobs,
+                                          shard_size=args.shard_size, profile=profile))
+    finally:
+        profile.close()
+    if profile.enabled:
+        profile.write_json(args.profile)
+        print(f"\n{profile.summary()}\nWrote build profile to {args.profile}")
+
+
+def generate_all(generator, use_directory_urls=True):
+    """Generate every documentation page with a configured generator.
+
+    Shared by ``main``, the ``waterframe docs`` command and the MkDocs hook.
+
+    Args:
+        generator: OntologyDocGenerator to run
+        use_directory_urls: Whether MkDocs serves ``page.md`` as ``page/``
+            (see ``generate_search_index``)
+
+    Returns:
+        List of generated module pages
+    """
 
     # Generate index page
     index_file = generator.generate_index()
 
+    # Generate the single-page entity reference
+    entities_file = generator.generate_all_docs()
+
+    # Draw the module diagrams first, so that module pages show them
+    diagram_files = generator.generate_module_diagrams()
+
     # Generate modular documentation
     module_files = generator.generate_modular_docs()
 
+    # Generate the entity search index
+    search_file = generator.generate_search_index(use_directory_urls=use_directory_urls)
+
     if module_files:
         print("\nSuccessfully generated documentation:")
         print(f"  - Index: {index_file}")
+        print(f"  - Entity reference: {entities_file}")
+        print(f"  - Search index: {search_file}")
+        print(f"  - Module diagrams: {len(diagram_files)}")
         print(f"  - Module pages: {len(module_files)}")
         for file in module_files:
             print(f"    - {file}")
 
+    return module_files
+
 if __name__ == "__main__":
     main()
@@ -5,10 +5,18 @@ MkDocs Hook for Ontology Documentation Generation
 This hook integrates the ontology documentation generation
 into the MkDocs build process, ensuring that entity documentation
 is always up-to-date when building the site.
+
+After the build, the links between all pages are validated.
+
+The marimo notebook export is recorded in the documentation build manifest
+and skipped while the notebook and the ontology files it reads are
+unchanged. When it does run, it runs in a background process while the
+entity documentation is generated.
 """
 
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 
 # Add the parent directories to the path so we can import our modules
@@ -20,102 +28,248 @@ src_dir = project_root / "src"
 sys.path.insert(0, str(scripts_dir))
 sys.path.insert(0, str(src_dir))
 
+from build_manifest import MANIFEST_NAME, BuildManifest  # noqa: E402
+from link_validator import nav_pages, validate_site  # noqa: E402
+
+NOTEBOOK_PATH = project_root / "notebooks" / "explore_ontology.py"
+# Export to docs/notebook so MkDocs can copy it to site/notebook
+NOTEBOOK_OUTPUT_DIR = project_root / "docs" / "notebook"
+# Shared with OntologyDocGenerator, which keeps its manifest next to docs/entities
+MANIFEST_PATH = project_root / "docs" / MANIFEST_NAME
+# Seconds the build waits for the notebook export once the docs are generated
+NOTEBOOK_EXPORT_TIMEOUT = 60
+# Link problems printed after a build
+MAX_REPORTED_LINK_PROBLEMS = 20
+
 try:
-    from generate_docs import OntologyDocGenerator
+    from generate_docs import OntologyDocGenerator, generate_all
+
+    from ontology_dataset import live_dataset
 except ImportError as e:
     print(f"Warning: Could not import generate_docs: {e}")
     OntologyDocGenerator = None
 
 
-def export_marimo_notebook(config):
+def notebook_sources():
+    """
+    Files the exported notebook depends on: the notebook itself, the
+    ontology files it loads (the main file, modules and bridges), this hook,
+    which holds the export command, and pyproject.toml, which pins the
+    marimo that `uv run` exports with. The notebook imports no modules of
+    this repository.
+
+    Returns:
+        List of paths
     """
-    Export marimo notebook to HTML for inclusion in docs.
+    ontology_dir = project_root / "data" / "ontology"
+    sources = [
+        NOTEBOOK_PATH,
+        Path(__file__).resolve(),
+        project_root / "pyproject.toml",
+        ontology_dir / "waterframe.ttl",
+    ]
+    for sub_dir in ("modules", "bridges"):
+        sources.extend(sorted((ontology_dir / sub_dir).rglob("*.ttl")))
+    return sources
 
-    The notebook is exported to a temporary location in docs/notebook,
-    which MkDocs will copy to the site directory during build.
+
+def notebook_export_inputs(manifest):
+    """
+    Build-manifest inputs of the notebook export.
 
     Args:
-        config: MkDocs configuration object
+        manifest: BuildManifest used to hash the sources
 
     Returns:
-        Path to exported notebook or None if failed
+        Dictionary of inputs, or None if a source is missing
     """
     try:
-        print("Exporting marimo notebook...")
-        notebook_path = project_root / "notebooks" / "explore_ontology.py"
-        # Export to docs/notebook so MkDocs can copy it to site/notebook
-        output_dir = project_root / "docs" / "notebook"
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Run marimo export command with --force to avoid prompts
-        cmd = [
-            "uv",
-            "run",
-            "marimo",
-            "export",
-            "html-wasm",
-            str(notebook_path),
-            "-o",
-            str(output_dir),
-            "--force",
-        ]
+        return {"sources": manifest.source_hashes(notebook_sources())}
+    except OSError as e:
+        print(f"Warning: Could not hash notebook inputs: {e}")
+        return None
+
+
+def start_notebook_export(config):
+    """
+    Start exporting the marimo notebook to HTML, unless it is up to date.
+
+    The notebook is exported to docs/notebook, which MkDocs will copy to
+    the site directory during build. The export runs in a separate process
+    rather than a thread of this one, since the documentation generator
+    forks its page-rendering workers meanwhile. Its output goes to a
+    temporary file rather than a pipe, which nothing reads until the export
+    is done and which would stall a noisy export once full.
 
+    Args:
+        config: MkDocs configuration object
+
+    Returns:
+        Tuple (process, log, inputs); process and log (the file holding the
+        export's output) are None if the export is skipped or could not be
+        started
+    """
+    output_file = NOTEBOOK_OUTPUT_DIR / "index.html"
+    manifest = BuildManifest(MANIFEST_PATH)
+    inputs = notebook_export_inputs(manifest)
+    if inputs is not None and manifest.is_current(output_file, inputs):
+        print(f"Marimo notebook is up to date: {output_file}")
+        return None, None, inputs
+
+    print("Exporting marimo notebook...")
+    NOTEBOOK_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Run marimo export command with --force to avoid prompts
+    cmd = [
+        "uv",
+        "run",
+        "marimo",
+        "export",
+        "html-wasm",
+        str(NOTEBOOK_PATH),
+        "-o",
+        str(NOTEBOOK_OUTPUT_DIR),
+        "--force",
+    ]
+    log = tempfile.TemporaryFile("w+", encoding="utf-8", errors="replace")
+    try:
         # Use stdin=subprocess.DEVNULL to prevent hanging on input
-        result = subprocess.run(
+        process = subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
-            check=True,
             stdin=subprocess.DEVNULL,
-            timeout=60,
+            stdout=log,
+            stderr=subprocess.STDOUT,
         )
-
-        print(f"Successfully exported marimo notebook to {output_dir}")
-        print("MkDocs will copy it to site/notebook/ during build")
-        return output_dir / "index.html"
-    except subprocess.CalledProcessError as e:
-        print(f"Error exporting marimo notebook: {e}")
-        print(f"stdout: {e.stdout}")
-        print(f"stderr: {e.stderr}")
-        return None
-    except Exception as e:
+    except OSError as e:
+        log.close()
         print(f"Error exporting marimo notebook: {e}")
-        import traceback
+        return None, None, inputs
+    return process, log, inputs
 
-        traceback.print_exc()
-        return None
+
+def finish_notebook_export(process, log, inputs):
+    """
+    Wait for the notebook export and record it in the build manifest.
+
+    The manifest is re-read here, after the documentation generator has
+    saved its own entries, so that neither overwrites the other.
+
+    Args:
+        process: Process returned by start_notebook_export, or None
+        log: File holding the export's output, closed here
+        inputs: Inputs the export was started for
+    """
+    if process is None:
+        return
+
+    with log:
+        try:
+            process.wait(timeout=NOTEBOOK_EXPORT_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            print(
+                f"Error exporting marimo notebook: no result after "
+                f"{NOTEBOOK_EXPORT_TIMEOUT} seconds"
+            )
+            print("Warning: Failed to export marimo notebook")
+            return
+        if process.returncode != 0:
+            log.seek(0)
+            print(
+                f"Error exporting marimo notebook: {' '.join(process.args)} "
+                f"exited with status {process.returncode}"
+            )
+            print(f"output: {log.read()}")
+            print("Warning: Failed to export marimo notebook")
+            return
+
+    notebook_export = NOTEBOOK_OUTPUT_DIR / "index.html"
+    print(f"Successfully exported marimo notebook to {NOTEBOOK_OUTPUT_DIR}")
+    print("MkDocs will copy it to site/notebook/ during build")
+    print(f"Exported marimo notebook: {notebook_export}")
+
+    if inputs is not None:
+        manifest = BuildManifest(MANIFEST_PATH)
+        manifest.record(notebook_export, inputs)
+        manifest.save()
 
 
 def on_pre_build(config, **kwargs):
     """
     MkDocs hook that runs before the build starts.
-    Generates ontology documentation and exports marimo notebook.
+    Exports the marimo notebook in the background while generating the
+    ontology documentation, and waits for both before returning.
 
     Args:
         config: MkDocs configuration object
         **kwargs: Additional keyword arguments from MkDocs
     """
-    # Export marimo notebook
-    notebook_export = export_marimo_notebook(config)
-    if notebook_export:
-        print(f"Exported marimo notebook: {notebook_export}")
-    else:
-        print("Warning: Failed to export marimo notebook")
-
-    # Generate ontology documentation
+    export, log, inputs = start_notebook_export(config)
+    try:
+        return generate_ontology_docs(config)
+    finally:
+        finish_notebook_export(export, log, inputs)
+
+
+def on_post_build(config, **kwargs):
+    """
+    MkDocs hook that runs after the build.
+    Validates the links between all pages of the docs directory and reports
+    broken links, duplicate anchors and pages nothing links to.
+
+    Args:
+        config: MkDocs configuration object
+        **kwargs: Additional keyword arguments from MkDocs
+    """
+    docs_dir = Path(config["docs_dir"]) if config else project_root / "docs"
+    entry_pages = ["index.md", *nav_pages(config.get("nav") if config else None)]
+    report = validate_site(docs_dir, entry_pages)
+    if report.ok:
+        print(f"Validated {report.links} links across {report.pages} pages")
+        return
+    problems = report.problems()
+    print(f"Warning: {len(problems)} link problems across {report.pages} pages")
+    for problem in problems[:MAX_REPORTED_LINK_PROBLEMS]:
+        print(f"  {problem}")
+    if len(problems) > MAX_REPORTED_LINK_PROBLEMS:
+        print(f"  ... and {len(problems) - MAX_REPORTED_LINK_PROBLEMS} more "
+              "(run `waterframe check-links` for the full list)")
+
+
+def generate_ontology_docs(config):
+    """
+    Generate the index, entity reference, module diagrams and pages, and
+    entity search index of the ontology documentation.
+
+    Args:
+        config: MkDocs configuration object
+
+    Returns:
+        List of generated module pages, or None if generation failed
+    """
     if OntologyDocGenerator is None:
         print("Warning: Ontology documentation generator not available")
         return
 
     try:
         print("Generating ontology documentation...")
-        generator = OntologyDocGenerator()
-
-        # Generate index page
-        generator.generate_index()
+        # Under `mkdocs serve` only the files edited since the last build
+        # are re-parsed; the dataset outlives this (re-imported) hook module
+        dataset, refresh = live_dataset(
+            project_root / "data" / "ontology" / "waterframe.ttl"
+        )
+        if refresh is not None:
+            print(
+                f"Refreshed ontology: {len(refresh.reloaded)} reloaded, "
+                f"{len(refresh.added)} added, {len(refresh.removed)} removed"
+            )
+        generator = OntologyDocGenerator(graph=dataset.graph)
 
-        # Generate modular documentation
-        module_files = generator.generate_modular_docs()
+        # Same pages as `waterframe docs`; the search index links to pages
+        # the way this site serves them
+        use_directory_urls = config.get("use_directory_urls", True) if config else True
+        module_files = generate_all(generator, use_directory_urls=use_directory_urls)
 
         if module_files:
             print(f"Generated {len(module_files)} module documentation pages")
@@ -7,54 +7,36 @@ Checks ontology loading, consistency, and competency question answering
 import sys
 import os
 from pathlib import Path
-from rdflib import Graph, Namespace, URIRef
+from rdflib import Namespace, URIRef
 from rdflib.namespace import RDF, RDFS, OWL
 
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent.parent / "src"))
+from ontology_loader import load_ontology as load_ontology_graph
 
 
 def load_ontology():
     """Load the ontology modules and instances"""
-    g = Graph()
-
     # Define base paths
     base_dir = Path(__file__).parent.parent
     ontology_dir = base_dir / "data" / "ontology"
     instances_dir = base_dir / "data" / "ontology" / "instances"
     sparql_dir = base_dir / "data" / "competency_questions" / "sparql"
 
-    # Load main ontology (this imports all modules)
+    # Main ontology and everything it imports, resolved via the local catalog
     main_ontology_file = ontology_dir / "waterframe.ttl"
-    if main_ontology_file.exists():
-        g.parse(str(main_ontology_file), format="turtle")
-        print(f"✓ Loaded main ontology: {len(g)} triples")
-
-        # Load core modules explicitly (RDFLib doesn't auto-download imports)
-        modules_dir = ontology_dir / "modules" / "core"
-        core_modules = ["material_entities.ttl", "properties.ttl"]
-
-        for module_file in core_modules:
-            module_path = modules_dir / module_file
-            if module_path.exists():
-                g.parse(str(module_path), format="turtle")
-                print(f"✓ Loaded {module_file}: {len(g)} total triples")
-            else:
-                print(f"✗ {module_file} not found")
-                return None, None, None
-    else:
+    if not main_ontology_file.exists():
         print("✗ Main ontology file not found")
         return None, None, None
 
-    # Load instances
     instances_file = instances_dir / "household_case1.ttl"
-    if instances_file.exists():
-        g.parse(str(instances_file), format="turtle")
-        print(f"✓ Loaded instances: {len(g)} total triples")
-    else:
+    if not instances_file.exists():
         print("✗ Instance file not found")
         return None, None, None
 
+    g = load_ontology_graph(main_ontology_file, extra_files=[instances_file])
+    print(f"✓ Loaded ontology import closure and instances: {len(g)} total triples")
+
     return g, sparql_dir, base_dir
 
 
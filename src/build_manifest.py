@@ -0,0 +1,131 @@
+"""Build manifest for incremental documentation builds.
+
+The manifest is a JSON file recording, for every generated page, the inputs
+it was rendered from: the content hashes of its source files and of the
+entities it documents, plus any settings that change its text (such as the
+ontology namespace), and the size and modification time of the file written.
+A page whose recorded inputs equal the current ones and whose output file is
+still the one written is up to date and need not be rendered again. A page
+rendered as several files (a sharded module page) also records its parts,
+and is up to date only if every part is still the one written.
+"""
+import json
+import os
+from pathlib import Path
+
+from helpers import file_sha256
+
+MANIFEST_VERSION = 2
+
+MANIFEST_NAME = ".build-manifest.json"
+
+
+class BuildManifest:
+    """Per-page build inputs, persisted between documentation builds."""
+
+    def __init__(self, path, force=False):
+        """Load the manifest, or start an empty one.
+
+        Args:
+            path: Manifest file
+            force: Treat every page as out of date (the manifest is still
+                updated, so the next unforced build is incremental again)
+        """
+        self.path = Path(path)
+        self.force = force
+        self.pages = {}
+        self._hashes = {}
+
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                print(f"Warning: Ignoring unreadable build manifest {self.path}: {e}")
+                data = {}
+            if data.get("version") == MANIFEST_VERSION:
+                self.pages = data.get("pages", {})
+
+    def _key(self, page):
+        page = Path(page)
+        try:
+            return page.relative_to(self.path.parent).as_posix()
+        except ValueError:
+            return str(page)
+
+    def _path(self, key):
+        return self.path.parent / key
+
+    def source_hashes(self, paths):
+        """Map each source file to its SHA-256, hashing each file once per build."""
+        hashes = {}
+        for path in paths:
+            path = Path(path).resolve()
+            if path not in self._hashes:
+                self._hashes[path] = file_sha256(path)
+            hashes[str(path)] = self._hashes[path]
+        return hashes
+
+    def entry(self, page):
+        """Inputs recorded for a page by the last build, or None."""
+        recorded = self.pages.get(self._key(page))
+        return recorded["inputs"] if recorded else None
+
+    def parts(self, page):
+        """Extra files recorded with a page by the last build."""
+        recorded = self.pages.get(self._key(page))
+        if not recorded:
+            return []
+        return [self._path(key) for key in recorded.get("parts", {})]
+
+    def is_current(self, page, inputs):
+        """Whether a page was last rendered from these inputs and not touched since."""
+        recorded = self.pages.get(self._key(page))
+        if self.force or recorded is None:
+            return False
+        return (
+            recorded["inputs"] == inputs
+            and recorded["output"] == _output_stat(page)
+            and all(_output_stat(self._path(key)) == stat
+                    for key, stat in recorded.get("parts", {}).items())
+        )
+
+    def record(self, page, inputs, parts=()):
+        """Remember the inputs a page was just rendered from and written with.
+
+        Args:
+            page: Output file
+            inputs: Inputs it was rendered from
+            parts: Further files written for the same page
+        """
+        self.pages[self._key(page)] = {"inputs": inputs, "output": _output_stat(page)}
+        if parts:
+            self.pages[self._key(page)]["parts"] = {
+                self._key(part): _output_stat(part) for part in parts
+            }
+
+    def files(self):
+        """Output files of every page recorded by the last build."""
+        return [self._path(key) for key in self.pages]
+
+    def remove(self, page):
+        """Forget a page that is no longer generated."""
+        self.pages.pop(self._key(page), None)
+
+    def save(self):
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(
+            json.dumps({"version": MANIFEST_VERSION, "pages": self.pages},
+                       indent=1, sort_keys=True),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.path)
+
+
+def _output_stat(page):
+    try:
+        stat = Path(page).stat()
+    except FileNotFoundError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
@@ -0,0 +1,160 @@
+"""Per-phase profile of a documentation build.
+
+``BuildProfile.phase(name, module)`` is a context manager timing one phase
+of the docs pipeline (load, namespace detection, entity extraction,
+categorisation, rendering, writing) for one module page: wall time, CPU time
+and the peak memory allocated by Python while it ran, measured with
+``tracemalloc``. Repeated phases of the same module are summed. The profile
+is written as JSON and summarized as a table.
+
+A disabled profile (the default everywhere) only enters and leaves an empty
+context, so the generator can wrap its phases unconditionally.
+"""
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Order of phases in reports
+PHASES = (
+    "load",
+    "namespace detection",
+    "entity extraction",
+    "categorisation",
+    "rendering",
+    "writing",
+)
+
+
+class BuildProfile:
+    """Wall time, CPU time and peak memory per (phase, module)."""
+
+    def __init__(self, enabled=True):
+        """Create a profile.
+
+        Args:
+            enabled: Record phases; a disabled profile records nothing
+        """
+        self.enabled = enabled
+        self.records = {}
+        self._stack = []  # peak memory seen so far by each open phase
+        self._started_tracing = False
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name, module=None):
+        """Time a phase of the build.
+
+        Args:
+            name: Phase name, one of ``PHASES``
+            module: Module page (or other output) the phase worked on
+        """
+        if not self.enabled:
+            yield
+            return
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if self._stack:
+            # Fold the enclosing phase's peak so far in before resetting it
+            self._stack[-1] = max(self._stack[-1], tracemalloc.get_traced_memory()[1])
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        self._stack.append(0)
+
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            peak = max(self._stack.pop(), tracemalloc.get_traced_memory()[1])
+            if self._stack:
+                self._stack[-1] = max(self._stack[-1], peak)
+            tracemalloc.reset_peak()
+            self._add(name, module, wall, cpu, max(peak - base, 0))
+
+    def _add(self, name, module, wall, cpu, peak):
+        record = self.records.setdefault((name, module), {
+            "phase": name, "module": module, "calls": 0,
+            "wall_s": 0.0, "cpu_s": 0.0, "peak_bytes": 0,
+        })
+        record["calls"] += 1
+        record["wall_s"] += wall
+        record["cpu_s"] += cpu
+        record["peak_bytes"] = max(record["peak_bytes"], peak)
+
+    def close(self):
+        """Stop tracing memory, if this profile started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def phase_totals(self):
+        """Records summed over modules, one per phase, in pipeline order."""
+        totals = {}
+        for record in self.records.values():
+            total = totals.setdefault(record["phase"], {
+                "phase": record["phase"], "modules": 0, "calls": 0,
+                "wall_s": 0.0, "cpu_s": 0.0, "peak_bytes": 0,
+            })
+            total["modules"] += 1
+            total["calls"] += record["calls"]
+            total["wall_s"] += record["wall_s"]
+            total["cpu_s"] += record["cpu_s"]
+            total["peak_bytes"] = max(total["peak_bytes"], record["peak_bytes"])
+        return sorted(totals.values(), key=lambda t: _phase_order(t["phase"]))
+
+    def to_json(self):
+        """Return the profile as a JSON-serializable dict."""
+        return {
+            "total_wall_s": time.perf_counter() - self._start,
+            "phases": self.phase_totals(),
+            "records": sorted(
+                self.records.values(),
+                key=lambda r: (_phase_order(r["phase"]), r["module"] or ""),
+            ),
+        }
+
+    def write_json(self, path):
+        """Write the profile to a JSON file."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_json(), f, indent=1)
+
+    def summary(self, top=5):
+        """Human-readable report: totals per phase, then the slowest modules.
+
+        Args:
+            top: Modules listed under each phase
+
+        Returns:
+            Multi-line string
+        """
+        data = self.to_json()
+        lines = [
+            f"Build profile ({data['total_wall_s']:.2f}s wall)",
+            f"  {'phase':<22}{'wall s':>9}{'cpu s':>9}{'peak MB':>10}{'modules':>9}",
+        ]
+        for total in data["phases"]:
+            lines.append(
+                f"  {total['phase']:<22}{total['wall_s']:>9.3f}{total['cpu_s']:>9.3f}"
+                f"{total['peak_bytes'] / 1e6:>10.1f}{total['modules']:>9}"
+            )
+        for total in data["phases"]:
+            modules = [r for r in data["records"]
+                       if r["phase"] == total["phase"] and r["module"]]
+            if len(modules) < 2:
+                continue
+            lines.append(f"  Slowest {total['phase']}:")
+            for record in sorted(modules, key=lambda r: -r["wall_s"])[:top]:
+                lines.append(
+                    f"    {record['module']:<40}{record['wall_s']:>9.3f}s"
+                    f"{record['peak_bytes'] / 1e6:>8.1f} MB"
+                )
+        return "\n".join(lines)
+
+
+def _phase_order(name):
+    return PHASES.index(name) if name in PHASES else len(PHASES)
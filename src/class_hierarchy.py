@@ -0,0 +1,248 @@
+"""Transitive closure of the rdfs:subClassOf hierarchy, computed in one pass.
+
+Entity pages only see a class's direct superclasses and subclasses; its full
+ancestry (up to BFO's material entity, say) or the size of its subtree would
+otherwise take a recursive graph walk per class. ``ClassHierarchy`` reads
+the subclass edges once and precomputes, for every named class:
+
+- its position in a topological order, superclasses before subclasses
+- its depth, the length of its longest chain of superclasses
+- its ancestors, as a frozenset of topological positions
+- its descendants, as a bitset: a Python integer with bit ``i`` set for the
+  class at topological position ``i``
+
+"Is X a subclass of Y" is then a constant-time set lookup, and a subtree
+size a popcount (linear in the number of classes, but in C).
+Subclass cycles (classes declared subclasses of each other, i.e.
+equivalent) are collapsed into one strongly connected component first, so
+every member of a cycle is an ancestor of the others.
+
+URIs are accepted as URIRefs or strings and returned as strings.
+"""
+from rdflib import URIRef
+from rdflib.namespace import OWL, RDF, RDFS
+
+
+class ClassHierarchy:
+    """Topological order, depth, ancestors and descendants of named classes."""
+
+    def __init__(self, edges, classes=()):
+        """Compute the closure of a set of subclass edges.
+
+        Args:
+            edges: (subclass, superclass) pairs
+            classes: Other classes to include, e.g. declared classes
+                without any subclass edge
+        """
+        names = {str(c) for c in classes}
+        edges = {(str(sub), str(sup)) for sub, sup in edges}
+        for sub, sup in edges:
+            names.add(sub)
+            names.add(sup)
+        names = sorted(names)
+        ids = {name: i for i, name in enumerate(names)}
+        parents = [[] for _ in names]
+        for sub, sup in sorted(edges):
+            if sub != sup:
+                parents[ids[sub]].append(ids[sup])
+
+        components = _strongly_connected(parents)
+
+        # Topological positions: components in order, members sorted
+        self.classes = [names[i] for component in components for i in sorted(component)]
+        self._position = {name: p for p, name in enumerate(self.classes)}
+        position = [self._position[name] for name in names]
+        n = len(self.classes)
+        self._parents = [[] for _ in range(n)]
+        self._children = [[] for _ in range(n)]
+        for i, sups in enumerate(parents):
+            for j in sups:
+                self._parents[position[i]].append(position[j])
+                self._children[position[j]].append(position[i])
+
+        self._ancestors = [frozenset()] * n
+        self._descendants = [0] * n
+        self._depth = [0] * n
+        members = [sorted(position[i] for i in component) for component in components]
+
+        # Superclasses first: ancestors and depth
+        for component in members:
+            inside = set(component)
+            ancestors = set()
+            depth = 0
+            for p in component:
+                for q in self._parents[p]:
+                    if q not in inside:
+                        ancestors |= self._ancestors[q]
+                        ancestors.add(q)
+                        depth = max(depth, self._depth[q] + 1)
+            for p in component:
+                self._ancestors[p] = frozenset(ancestors | (inside - {p}))
+                self._depth[p] = depth
+
+        # Subclasses first: descendants
+        for component in reversed(members):
+            bits = sum(1 << p for p in component)
+            descendants = 0
+            for p in component:
+                for q in self._children[p]:
+                    if not (bits >> q) & 1:
+                        descendants |= self._descendants[q] | (1 << q)
+            for p in component:
+                self._descendants[p] = descendants | (bits & ~(1 << p))
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Build the hierarchy of the named classes of a graph.
+
+        Args:
+            graph: rdflib Graph; subclass edges to or from blank nodes
+                (restrictions, class expressions) are ignored
+        """
+        edges = [
+            (sub, sup) for sub, sup in graph.subject_objects(RDFS.subClassOf)
+            if isinstance(sub, URIRef) and isinstance(sup, URIRef)
+        ]
+        classes = [
+            c for c in graph.subjects(RDF.type, OWL.Class) if isinstance(c, URIRef)
+        ]
+        return cls(edges, classes)
+
+    @classmethod
+    def from_index(cls, index):
+        """Build the hierarchy from an ``EntityIndex``, without a graph scan."""
+        edges = []
+        classes = []
+        for subject, predicates in index.out_edges.items():
+            if not isinstance(subject, URIRef):
+                continue
+            if OWL.Class in predicates.get(RDF.type, ()):
+                classes.append(subject)
+            edges.extend(
+                (subject, sup) for sup in predicates.get(RDFS.subClassOf, ())
+                if isinstance(sup, URIRef)
+            )
+        return cls(edges, classes)
+
+    def __len__(self):
+        return len(self.classes)
+
+    def __contains__(self, uri):
+        return str(uri) in self._position
+
+    def is_subclass(self, sub, sup):
+        """Whether ``sub`` is ``sup`` or one of its (transitive) subclasses."""
+        sub, sup = str(sub), str(sup)
+        if sub == sup:
+            return True
+        i = self._position.get(sub)
+        j = self._position.get(sup)
+        if i is None or j is None:
+            return False
+        return j in self._ancestors[i]
+
+    def ancestors(self, uri):
+        """Transitive superclasses of a class, in topological order."""
+        p = self._position.get(str(uri))
+        if p is None:
+            return []
+        return [self.classes[q] for q in sorted(self._ancestors[p])]
+
+    def descendants(self, uri):
+        """Transitive subclasses of a class, in topological order."""
+        p = self._position.get(str(uri))
+        bits = 0 if p is None else self._descendants[p]
+        classes = []
+        while bits:
+            low = bits & -bits
+            classes.append(self.classes[low.bit_length() - 1])
+            bits ^= low
+        return classes
+
+    def subtree_size(self, uri):
+        """Number of transitive subclasses of a class."""
+        p = self._position.get(str(uri))
+        return 0 if p is None else self._descendants[p].bit_count()
+
+    def depth(self, uri):
+        """Length of the longest superclass chain above a class (0 for roots)."""
+        p = self._position.get(str(uri))
+        return 0 if p is None else self._depth[p]
+
+    def roots(self):
+        """Classes without superclasses, in topological order."""
+        return [name for p, name in enumerate(self.classes) if not self._ancestors[p]]
+
+    def ancestry(self, uri):
+        """The longest superclass chain above a class, root first.
+
+        At each step the deepest superclass is followed (the first in
+        topological order on ties), so the chain ends at a root.
+
+        Returns:
+            List of ancestor URIs, without the class itself
+        """
+        p = self._position.get(str(uri))
+        chain = []
+        while p is not None:
+            above = [q for q in self._parents[p] if self._depth[q] < self._depth[p]]
+            p = max(above, key=lambda q: (self._depth[q], -q)) if above else None
+            if p is not None:
+                chain.append(self.classes[p])
+        chain.reverse()
+        return chain
+
+
+def _strongly_connected(parents):
+    """Strongly connected components of a graph, by Tarjan's algorithm.
+
+    Args:
+        parents: Out-neighbours of each node
+
+    Returns:
+        List of components (lists of nodes), each after every component
+        it has an edge to
+    """
+    index = [None] * len(parents)
+    low = [0] * len(parents)
+    on_stack = [False] * len(parents)
+    stack = []
+    components = []
+    counter = 0
+
+    for root in range(len(parents)):
+        if index[root] is not None:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, i = work[-1]
+            if i == 0:
+                index[node] = low[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack[node] = True
+            edges = parents[node]
+            while i < len(edges):
+                target = edges[i]
+                i += 1
+                if index[target] is None:
+                    work[-1] = (node, i)
+                    work.append((target, 0))
+                    break
+                if on_stack[target]:
+                    low[node] = min(low[node], index[target])
+            else:
+                work.pop()
+                if work:
+                    caller = work[-1][0]
+                    low[caller] = min(low[caller], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
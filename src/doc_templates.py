@@ -0,0 +1,151 @@
+"""Precompiled markdown templates for the documentation generator.
+
+Templates are written with named ``{field}`` placeholders and compiled once,
+at import time, into the bound ``format`` of an equivalent template with
+positional placeholders, so rendering never builds a keyword dictionary and
+no code is generated from template text. Renderers append the formatted parts
+to a list and join the page once at the end, or hand the parts straight to a
+file's ``writelines``, instead of growing one string with ``+=``.
+"""
+from string import Formatter
+
+
+def compile_template(template, *fields):
+    """Compile a template into a function of its fields.
+
+    Args:
+        template: Text with ``{field}`` placeholders (``{{``/``}}`` for
+            literal braces), as in ``str.format``
+        fields: Names of the placeholders, in argument order
+
+    Returns:
+        Function taking the fields positionally and returning the text
+
+    Raises:
+        ValueError: If the template uses a placeholder not in ``fields``
+    """
+    positions = {field: i for i, field in enumerate(fields)}
+    parts = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field is None:
+            continue
+        if field not in positions:
+            raise ValueError(f"Unknown field {field!r} in template {template!r}")
+        parts.append("{" + str(positions[field]))
+        if conversion:
+            parts.append("!" + conversion)
+        if spec:
+            parts.append(":" + spec)
+        parts.append("}")
+    return "".join(parts).format
+
+
+class ListSection:
+    """A ``### Heading`` section with one formatted line per item."""
+
+    __slots__ = ("head", "tail")
+
+    def __init__(self, heading, tail="\n"):
+        """Compile a section template.
+
+        Args:
+            heading: Section heading text
+            tail: Text closing the section
+        """
+        self.head = f"### {heading}\n\n"
+        self.tail = tail
+
+    def write(self, out, items, line):
+        """Append the section to ``out``; an empty section is left out.
+
+        Args:
+            out: List collecting the page parts
+            items: Items listed in the section
+            line: Callable formatting one item as a line
+        """
+        if items:
+            out.append(self.head)
+            out.extend(map(line, items))
+            out.append(self.tail)
+
+
+# Lines of list sections
+BULLET = compile_template("- {item}\n", "item")
+LINK = compile_template("- [{name}]({target})\n", "name", "target")
+INLINE_LINK = compile_template("[{name}]({target})", "name", "target")
+PARAGRAPH = compile_template("{text}\n\n", "text")
+PROPERTY_VALUE_LINK = compile_template(
+    "- **{prop}**: [{value}]({target})\n", "prop", "value", "target"
+)
+PROPERTY_VALUE_URI = compile_template("- **{prop}**: `{value}`\n", "prop", "value")
+PROPERTY_VALUE_LITERAL = compile_template("- **{prop}**: {value}\n", "prop", "value")
+REFERENCE_GROUP = compile_template("- **{prop}**: {links}\n", "prop", "links")
+ANCESTRY = compile_template("- **Ancestry:** {chain}\n", "chain")
+DESCENDANTS = compile_template("- **Descendant classes:** {count}\n", "count")
+
+# Entity sections
+ENTITY_HEADING = compile_template(
+    "## {name} {{#{anchor}}}\n\n**Type:** {kind}\n\n**URI:** `{uri}`\n\n",
+    "name", "anchor", "kind", "uri",
+)
+LABELS = ListSection("Labels")
+DESCRIPTION = ListSection("Description", tail="")
+SUPERCLASSES = ListSection("Superclasses")
+SUBCLASSES = ListSection("Subclasses")
+INSTANCES = ListSection("Instances")
+HIERARCHY = ListSection("Hierarchy")
+DOMAINS = ListSection("Domains")
+RANGES = ListSection("Ranges")
+CHARACTERISTICS = ListSection("Characteristics")
+INVERSE_PROPERTIES = ListSection("Inverse Properties")
+SUBPROPERTIES = ListSection("Subproperties")
+SUPERPROPERTIES = ListSection("Superproperties")
+INSTANCE_OF = ListSection("Instance Of")
+PROPERTY_VALUES = ListSection("Property Values")
+RELATED_ENTITIES = ListSection("Related Entities")
+REFERENCED_BY = ListSection("Referenced By")
+
+# Module and bridge pages
+MODULE_TITLE = compile_template("# {title}\n\n", "title")
+MODULE_DESCRIPTION = PARAGRAPH
+MODULE_DETAILS = compile_template(
+    "**Module URI:** `{uri}`\n\n"
+    "**Source:** `{source}`\n\n"
+    "**Total Entities:** {total}\n\n",
+    "uri", "source", "total",
+)
+MODULE_DIAGRAM = compile_template(
+    "## Class Diagram\n\n![Class diagram of {name}]({target})\n\n", "name", "target"
+)
+MODULE_CONTENTS = "## Contents\n\n"
+MODULE_CONTENTS_LINE = compile_template(
+    "- [{heading}](#{anchor}) ({count})\n", "heading", "anchor", "count"
+)
+MODULE_CONTENTS_END = "\n---\n\n"
+TYPE_HEADING = compile_template("## {heading}\n\n", "heading")
+
+# Sharded module pages: an overview page plus numbered pages of entities
+SHARD_CONTENTS_LINE = compile_template(
+    "- [{heading}]({target}) ({count})\n", "heading", "target", "count"
+)
+SHARD_PAGES = "## Pages\n\n"
+SHARD_PAGES_LINE = compile_template(
+    "- [Page {page}]({target}): {first} – {last} ({count} entities)\n",
+    "page", "target", "first", "last", "count",
+)
+SHARD_PAGES_END = "\n"
+SHARD_TITLE = compile_template(
+    "# {title} (page {page} of {pages})\n\n", "title", "page", "pages"
+)
+SHARD_NAVIGATION = compile_template("{links}\n\n", "links")
+
+SECTION_SEPARATOR = "\n---\n\n"
+
+# (key in entities_by_type, heading, contents anchor) in page order
+ENTITY_GROUPS = (
+    ("classes", "Classes", "classes"),
+    ("object_properties", "Object Properties", "object-properties"),
+    ("datatype_properties", "Datatype Properties", "datatype-properties"),
+    ("individuals", "Individuals", "individuals"),
+)
@@ -0,0 +1,101 @@
+"""Adjacency index answering per-entity lookups without repeated graph scans.
+
+Documentation generation asks the same handful of questions about every
+entity: its labels, comments, types, superclasses, subclasses, instances,
+domains, ranges and so on. Each ``graph.objects()``/``graph.subjects()``
+call is a separate store lookup, so a page costs entities × lookups calls.
+``EntityIndex`` instead sweeps the graph twice, up front: once per subject,
+grouping triples by subject (out-edges), and once per predicate, grouping
+them by object (in-edges). Those questions are then answered from plain
+dictionaries. The in-edges double as a backlink index: every entity
+referencing a term, grouped by predicate, without scanning the graph per
+entity.
+
+Values keep the order the store returns for ``objects(s, p)`` and
+``subjects(p, o)``, so output built from the index is identical to output
+built from the graph directly. That is why there are two sweeps: a single
+pass over ``graph.triples()`` yields triples grouped by subject, which
+gives the order of ``objects(s, p)`` but not that of ``subjects(p, o)``.
+"""
+import hashlib
+
+from rdflib import BNode
+
+
+class EntityIndex:
+    """Out-edges (subject → predicate → objects) and in-edges
+    (object → predicate → subjects) of a graph."""
+
+    def __init__(self, graph):
+        """Index every triple of a graph.
+
+        Args:
+            graph: rdflib Graph, Dataset union or frozen graph to index
+        """
+        self.out_edges = {}
+        self.in_edges = {}
+
+        predicates = {}
+        # Per-subject sweep: the store returns each subject's objects in
+        # objects(s, p) order
+        for subject in graph.subjects(unique=True):
+            edges = self.out_edges.setdefault(subject, {})
+            for predicate, obj in graph.predicate_objects(subject):
+                edges.setdefault(predicate, []).append(obj)
+                predicates[predicate] = None
+
+        # Per-predicate sweep: the store returns subjects in subjects(p, o)
+        # order
+        for predicate in predicates:
+            for subject, obj in graph.subject_objects(predicate):
+                edges = self.in_edges.setdefault(obj, {})
+                edges.setdefault(predicate, []).append(subject)
+
+    def __len__(self):
+        return sum(
+            len(objects)
+            for edges in self.out_edges.values() for objects in edges.values()
+        )
+
+    def objects(self, subject, predicate):
+        """Objects of (subject, predicate, ?), in store order."""
+        return self.out_edges.get(subject, {}).get(predicate, ())
+
+    def subjects(self, predicate, obj):
+        """Subjects of (?, predicate, obj), in store order."""
+        return self.in_edges.get(obj, {}).get(predicate, ())
+
+    def predicate_objects(self, subject):
+        """(predicate, objects) pairs for every predicate of a subject."""
+        return self.out_edges.get(subject, {}).items()
+
+    def predicate_subjects(self, obj):
+        """(predicate, subjects) pairs for every predicate pointing at an object."""
+        return self.in_edges.get(obj, {}).items()
+
+    def has(self, subject, predicate, obj=None):
+        """Whether (subject, predicate, obj) exists; obj None matches any object."""
+        objects = self.objects(subject, predicate)
+        return bool(objects) if obj is None else obj in objects
+
+    def digest(self, term):
+        """SHA-256 over every triple a term appears in as subject or object.
+
+        Everything the documentation shows for an entity comes from these
+        triples, so an unchanged digest means an unchanged entity section.
+        Values of one predicate are hashed in store order, since that
+        decides the order they are listed in. Blank nodes all hash alike:
+        their labels change on every parse.
+        """
+        digest = hashlib.sha256()
+        for predicate, objects in sorted(self.predicate_objects(term)):
+            for obj in objects:
+                digest.update(f"> {predicate.n3()} {_n3(obj)}\n".encode("utf-8"))
+        for predicate, subjects in sorted(self.predicate_subjects(term)):
+            for subject in subjects:
+                digest.update(f"< {_n3(subject)} {predicate.n3()}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+
+def _n3(term):
+    return "[]" if isinstance(term, BNode) else term.n3()
@@ -0,0 +1,243 @@
+"""Read-only, dictionary-encoded rdflib store backed by sorted NumPy arrays.
+
+``freeze`` turns a loaded graph into one that answers the same reads with a
+fraction of the memory. Every distinct term is interned once and given an
+integer ID; triples become rows of ID triples, kept in three permutations
+(SPO, POS, OSP) sorted with ``np.lexsort`` and binary-searched with
+``np.searchsorted`` for each ``triples()`` pattern.
+
+Rows sharing the two leading terms of a permutation keep the order of the
+source graph, so ``objects(s, p)`` and ``subjects(p, o)`` return results in
+exactly the order the Memory store would. The documentation
+generator relies on this (first label, order of superclasses, ...).
+
+Frozen graphs cannot be modified. Re-freeze after reloading the sources.
+"""
+import numpy as np
+from rdflib import Graph
+from rdflib.graph import ModificationException
+from rdflib.store import Store
+
+# Column order of each permutation, as positions in an (s, p, o) triple
+PERMUTATIONS = {"spo": (0, 1, 2), "pos": (1, 2, 0), "osp": (2, 0, 1)}
+
+ID_DTYPE = np.uint32
+
+
+class FrozenStoreError(ModificationException):
+    """Raised when something tries to modify a frozen graph."""
+
+    def __str__(self):
+        return "Frozen graphs are read-only; modify the source graph and re-freeze"
+
+
+class FrozenStore(Store):
+    """Immutable triple store holding term IDs in sorted NumPy arrays."""
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    def __init__(self, configuration=None, identifier=None):
+        super().__init__(configuration, identifier)
+        self.terms = []
+        self.term_ids = {}
+        self.rows = np.empty((0, 3), dtype=ID_DTYPE)
+        self.indexes = {}
+        self._namespaces = {}
+        self._prefixes = {}
+
+    @classmethod
+    def from_triples(cls, triples):
+        """Build a store from triples, keeping their order for equal keys.
+
+        Args:
+            triples: Iterable of (s, p, o) terms; duplicates are dropped
+
+        Returns:
+            FrozenStore holding the distinct triples
+        """
+        store = cls()
+        term_ids = store.term_ids
+        terms = store.terms
+        seen = set()
+        flat = []
+        for triple in triples:
+            if triple in seen:
+                continue
+            seen.add(triple)
+            for term in triple:
+                term_id = term_ids.get(term)
+                if term_id is None:
+                    term_id = term_ids[term] = len(terms)
+                    terms.append(term)
+                flat.append(term_id)
+
+        store.rows = np.array(flat, dtype=ID_DTYPE).reshape(-1, 3)
+        store._build_indexes()
+        return store
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Build a store that answers lookups in the same order as the graph.
+
+        Graphs that log their insertion order (RecordingGraph) are frozen
+        from that log. For any other graph the SPO and POS orders are read
+        back through the graph's own ``predicate_objects`` and ``subjects``
+        lookups, which for the Memory store follow insertion order even
+        though whole-graph iteration does not. OSP keeps iteration order.
+        """
+        added = getattr(graph, "added", None)
+        if added is not None:
+            return cls.from_triples(added)
+
+        triples = list(graph.triples((None, None, None)))
+        store = cls.from_triples(triples)
+        subjects = dict.fromkeys(s for s, _, _ in triples)
+        pairs = dict.fromkeys((p, o) for _, p, o in triples)
+        store._build_indexes({
+            "spo": [(s, p, o) for s in subjects
+                    for p, o in graph.predicate_objects(s)],
+            "pos": [(s, p, o) for p, o in pairs for s in graph.subjects(p, o)],
+        })
+        return store
+
+    def _build_indexes(self, orders=None):
+        """Sort each permutation, keeping rows with equal leading terms in order.
+
+        Args:
+            orders: Optional mapping of permutation name to the triples in the
+                order that permutation should keep; others use ``rows`` order
+        """
+        for name, (a, b, c) in PERMUTATIONS.items():
+            rows = self.rows
+            if orders is not None and name in orders:
+                term_ids = self.term_ids
+                rows = np.array(
+                    [term_ids[term] for triple in orders[name] for term in triple],
+                    dtype=ID_DTYPE,
+                ).reshape(-1, 3)
+            # lexsort is stable and sorts on the last key first
+            order = np.lexsort((rows[:, b], rows[:, a]))
+            self.indexes[name] = tuple(
+                np.ascontiguousarray(rows[order, column]) for column in (a, b, c)
+            )
+
+    @property
+    def nbytes(self):
+        """Bytes held by the ID arrays (excluding the term dictionary)."""
+        return self.rows.nbytes + sum(
+            column.nbytes for columns in self.indexes.values() for column in columns
+        )
+
+    def __len__(self, context=None):
+        return len(self.rows)
+
+    def _range(self, index, first, second=None):
+        """Row range of an index whose leading column(s) equal the given IDs."""
+        col0, col1, _ = self.indexes[index]
+        lo = np.searchsorted(col0, first, side="left")
+        hi = np.searchsorted(col0, first, side="right")
+        if second is not None:
+            lo, hi = (
+                lo + np.searchsorted(col1[lo:hi], second, side="left"),
+                lo + np.searchsorted(col1[lo:hi], second, side="right"),
+            )
+        return lo, hi
+
+    def _lookup(self, s, p, o):
+        """Yield matching ID triples for a pattern of IDs (None = unbound)."""
+        if s is None and p is None and o is None:
+            yield from self.rows.tolist()
+            return
+
+        if s is not None and p is not None:
+            index, bound, check = "spo", (s, p), o
+        elif p is not None:
+            index, bound, check = "pos", (p, o), None
+        elif o is not None:
+            index, bound, check = "osp", (o, s), None
+        else:
+            index, bound, check = "spo", (s, None), None
+
+        col0, col1, col2 = self.indexes[index]
+        lo, hi = self._range(index, *bound)
+        if check is not None:
+            if check in col2[lo:hi]:
+                yield [s, p, o]
+            return
+        rows = zip(col0[lo:hi].tolist(), col1[lo:hi].tolist(), col2[lo:hi].tolist())
+
+        a, b, c = PERMUTATIONS[index]
+        for row in rows:
+            triple = [0, 0, 0]
+            triple[a], triple[b], triple[c] = row
+            yield triple
+
+    def triples(self, triple_pattern, context=None):
+        term_ids = self.term_ids
+        pattern_ids = []
+        for term in triple_pattern:
+            if term is None:
+                pattern_ids.append(None)
+                continue
+            term_id = term_ids.get(term)
+            if term_id is None:
+                return
+            pattern_ids.append(term_id)
+
+        terms = self.terms
+        for s, p, o in self._lookup(*pattern_ids):
+            yield (terms[s], terms[p], terms[o]), iter(())
+
+    def contexts(self, triple=None):
+        return iter(())
+
+    def add(self, triple, context=None, quoted=False):
+        raise FrozenStoreError()
+
+    def addN(self, quads):
+        raise FrozenStoreError()
+
+    def remove(self, triple, context=None):
+        raise FrozenStoreError()
+
+    def update(self, *args, **kwargs):
+        raise FrozenStoreError()
+
+    def bind(self, prefix, namespace, override=True):
+        # Namespace bindings are metadata, not triples, so they stay mutable
+        bound = self._namespaces.get(prefix)
+        if bound is not None and not override:
+            return
+        if bound is not None:
+            self._prefixes.pop(bound, None)
+        self._prefixes.pop(namespace, None)
+        self._namespaces = {k: v for k, v in self._namespaces.items() if v != namespace}
+        self._namespaces[prefix] = namespace
+        self._prefixes[namespace] = prefix
+
+    def namespace(self, prefix):
+        return self._namespaces.get(prefix)
+
+    def prefix(self, namespace):
+        return self._prefixes.get(namespace)
+
+    def namespaces(self):
+        yield from self._namespaces.items()
+
+
+def freeze(graph):
+    """Create a read-only, array-backed copy of a graph.
+
+    Args:
+        graph: Graph to copy (any store)
+
+    Returns:
+        Graph backed by a FrozenStore, with the same identifier and prefixes
+    """
+    store = FrozenStore.from_graph(graph)
+    for prefix, namespace in graph.namespaces():
+        store.bind(prefix, namespace)
+    return Graph(store=store, identifier=graph.identifier, bind_namespaces="none")
@@ -1,4 +1,5 @@
 """This module contains utility functions used to build and explore the ontology"""
+import hashlib
 from pathlib import Path
 
 
@@ -27,3 +28,12 @@ def get_ontology_path() -> Path:
                 "Project directory not found (looking for waterFRAME or ontEAUlogy)."
             )
     return root / "data/ontology/waterframe.ttl"
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Return the hex SHA-256 digest of a file's content, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
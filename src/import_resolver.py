@@ -0,0 +1,221 @@
+"""Resolve the owl:imports closure of an ontology against a local catalog.
+
+Imports are mapped to local files through an OASIS XML catalog in the format
+Protégé writes (``catalog-v001.xml``), so nothing is fetched from the network
+and only files that are actually reachable from the root ontology get loaded.
+Files are parsed one after the other: rdflib's parsers are pure Python, so
+threads would not parse them any faster (see ``parallel_parse`` for a
+process pool).
+
+A module that is missing from the catalog, or that nothing imports, is not
+part of the closure; ``unreachable_files`` lists the files under ``modules/``
+and ``bridges/`` that were left out, so callers can warn about them.
+"""
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+from rdflib import Graph
+from rdflib.namespace import OWL
+
+from rdf_formats import parse_rdf
+
+CATALOG_FILENAME = "catalog-v001.xml"
+
+# Directories next to the root ontology whose files should all be imported
+MODULE_DIRS = ("modules", "bridges")
+
+_CATALOG_NS = "urn:oasis:names:tc:entity:xmlns:xml:catalog"
+_XML_BASE = "{http://www.w3.org/XML/1998/namespace}base"
+
+
+def read_catalog(catalog_path):
+    """Read an OASIS XML catalog into a mapping of IRI to local file path.
+
+    Args:
+        catalog_path: Path to the catalog file
+
+    Returns:
+        Dictionary mapping each ``<uri name=...>`` to the resolved local path
+    """
+    catalog_path = Path(catalog_path)
+    mapping = {}
+
+    def walk(element, base_dir):
+        base = element.get(_XML_BASE)
+        if base:
+            base_dir = base_dir / base
+        for child in element:
+            if child.tag == f"{{{_CATALOG_NS}}}uri":
+                name, uri = child.get("name"), child.get("uri")
+                if name and uri:
+                    mapping.setdefault(name, (base_dir / uri).resolve())
+            else:
+                walk(child, base_dir)
+
+    walk(ET.parse(catalog_path).getroot(), catalog_path.parent)
+    return mapping
+
+
+def find_catalog(ontology_path):
+    """Find the nearest catalog in the ontology's directory or its parents."""
+    for directory in Path(ontology_path).resolve().parents:
+        candidate = directory / CATALOG_FILENAME
+        if candidate.exists():
+            return candidate
+    return None
+
+
+class RecordingGraph(Graph):
+    """Graph that remembers the order in which triples were added.
+
+    rdflib iterates a whole graph in set order, so merging parsed graphs by
+    iterating them would shuffle the order in which labels, superclasses and
+    so on come back from ``Graph.objects``. Replaying ``added`` keeps merged
+    graphs identical to parsing the files one after the other.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.added = []
+
+    def add(self, triple):
+        self.added.append(triple)
+        return super().add(triple)
+
+
+def parse_file(path, graph=None):
+    """Parse a single RDF file, detecting its format and compression.
+
+    Args:
+        path: File to parse
+        graph: Graph to parse into (defaults to a new RecordingGraph)
+
+    Returns:
+        The graph the file was parsed into, with the file's ParseStats
+        attached as ``graph.parse_stats``
+    """
+    graph = graph if graph is not None else RecordingGraph()
+    graph.parse_stats = parse_rdf(path, graph)
+    return graph
+
+
+class ImportClosure:
+    """The files reachable from a set of roots and their parsed graphs."""
+
+    def __init__(self, catalog_path=None):
+        self.catalog_path = catalog_path
+        self.files = []
+        self.graphs = {}
+        self.unresolved = set()
+        self.failed = {}
+
+    @property
+    def key_files(self):
+        """Files whose content determines the closure (sources plus catalog)."""
+        if self.catalog_path is None:
+            return list(self.files)
+        return [*self.files, self.catalog_path]
+
+    def merge(self):
+        """Merge every parsed graph into a single new graph, in load order."""
+        merged = Graph()
+        for path in self.files:
+            graph = self.graphs[path]
+            for prefix, namespace in graph.namespaces():
+                merged.bind(prefix, namespace, override=False)
+            merged.addN((s, p, o, merged) for s, p, o in graph.added)
+        return merged
+
+
+class ImportResolver:
+    """Follows owl:imports from root ontologies using a local catalog."""
+
+    def __init__(self, catalog_path=None):
+        """Initialize the resolver.
+
+        Args:
+            catalog_path: OASIS catalog mapping import IRIs to local files
+        """
+        self.catalog_path = Path(catalog_path) if catalog_path else None
+        self.catalog = read_catalog(self.catalog_path) if self.catalog_path else {}
+
+    @classmethod
+    def for_ontology(cls, ontology_path):
+        """Create a resolver using the catalog nearest to an ontology file."""
+        return cls(find_catalog(ontology_path))
+
+    def resolve_iri(self, iri):
+        """Map an import IRI to a local file, or None if it is not available."""
+        iri = str(iri)
+        for candidate in (iri, iri.rstrip("#/")):
+            if candidate in self.catalog:
+                return self.catalog[candidate]
+        parsed = urlparse(iri)
+        if parsed.scheme == "file":
+            path = Path(unquote(parsed.path))
+            if path.exists():
+                return path.resolve()
+        return None
+
+    def resolve(self, roots):
+        """Parse the roots and everything they transitively import.
+
+        Args:
+            roots: Ontology file paths to start from
+
+        Returns:
+            ImportClosure with files in breadth-first, per-level sorted order
+        """
+        closure = ImportClosure(self.catalog_path)
+        seen = set()
+        level = []
+        for root in roots:
+            root = Path(root).resolve()
+            if root not in seen:
+                seen.add(root)
+                level.append(root)
+
+        while level:
+            next_level = set()
+            for path in level:
+                try:
+                    graph = parse_file(path)
+                except Exception as e:
+                    print(f"Warning: Could not load {path}: {e}")
+                    closure.failed[path] = e
+                    continue
+                closure.files.append(path)
+                closure.graphs[path] = graph
+                for iri in graph.objects(None, OWL.imports):
+                    target = self.resolve_iri(iri)
+                    if target is None:
+                        closure.unresolved.add(str(iri))
+                    elif target not in seen:
+                        seen.add(target)
+                        next_level.add(target)
+            level = sorted(next_level)
+
+        return closure
+
+
+def unreachable_files(ontology_path, loaded_files):
+    """List the module and bridge files an import closure left out.
+
+    Args:
+        ontology_path: Root ontology; its ``modules/`` and ``bridges/``
+            directories are searched
+        loaded_files: Files of the loaded closure
+
+    Returns:
+        Sorted Turtle files under those directories that were not loaded,
+        e.g. because they are missing from the catalog or never imported
+    """
+    ontology_dir = Path(ontology_path).resolve().parent
+    loaded = {Path(f).resolve() for f in loaded_files}
+    return [
+        path
+        for name in MODULE_DIRS
+        for path in sorted((ontology_dir / name).rglob("*.ttl"))
+        if path.resolve() not in loaded
+    ]
@@ -0,0 +1,256 @@
+"""Whole-site validation of links between documentation pages.
+
+Scans every markdown page under a docs directory once, line by line, and
+builds one anchor table for the site: the explicit ``{#id}`` of headings,
+the ids MkDocs' toc extension derives from the other headings, and HTML
+``id`` attributes. Every internal link (``[text](page.md#anchor)``, within
+the page or to another one) is then checked against that table, and pages
+no link or nav entry leads to are reported as orphans.
+
+Each page is read once and each link is a dictionary lookup, so a check runs
+in time linear in the total size of the docs. External links (with a URL
+scheme) are not checked; links to other files are only checked to exist.
+"""
+import posixpath
+import re
+import unicodedata
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import unquote
+
+_FENCE = re.compile(r"^\s*(```|~~~)")
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*$")
+# Explicit id at the end of a heading: {#id} or {: #id .class}
+_HEADING_ID = re.compile(r"\s*\{:?[^}#]*#([^\s}]+)[^}]*\}\s*$")
+_HTML_ID = re.compile(r"""<[a-zA-Z][^>]*?\sid=["']([^"']+)["']""")
+_INLINE_CODE = re.compile(r"`+[^`]*`+")
+_LINK = re.compile(r"\]\(\s*<?([^)\s>]*)>?(?:\s+[\"'][^\"']*[\"'])?\s*\)")
+_REFERENCE = re.compile(r"^\s{0,3}\[[^\]]+\]:\s*<?(\S+?)>?(?:\s.*)?$")
+_SCHEME = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*:")
+
+
+@dataclass
+class BrokenLink:
+    """An internal link whose page or anchor does not exist."""
+
+    page: str
+    line: int
+    target: str
+    reason: str
+
+
+@dataclass
+class LinkReport:
+    """Result of validating the links of a site."""
+
+    pages: int = 0
+    links: int = 0
+    broken: list = field(default_factory=list)
+    duplicate_anchors: list = field(default_factory=list)  # (page, anchor, lines)
+    orphans: list = field(default_factory=list)
+
+    @property
+    def ok(self):
+        """Whether no problem was found."""
+        return not (self.broken or self.duplicate_anchors or self.orphans)
+
+    def problems(self):
+        """One line per problem, for printing."""
+        lines = [f"{b.page}:{b.line}: broken link {b.target} ({b.reason})"
+                 for b in self.broken]
+        lines += [
+            f"{page}: duplicate anchor #{anchor} (lines {', '.join(map(str, at))})"
+            for page, anchor, at in self.duplicate_anchors
+        ]
+        lines += [f"{page}: orphan page, not linked from any page or the nav"
+                  for page in self.orphans]
+        return lines
+
+
+def slugify(text):
+    """The heading id MkDocs' toc extension derives from a heading's text."""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    text = re.sub(r"[^\w\s-]", "", text).strip().lower()
+    return re.sub(r"[-\s]+", "-", text)
+
+
+def _strip_markup(text):
+    """Heading text as rendered: link targets, emphasis and code marks removed."""
+    text = re.sub(r"!?\[([^\]]*)\]\([^)]*\)", r"\1", text)
+    return re.sub(r"[*_`]", "", text)
+
+
+def scan_page(text):
+    """Collect the anchors and internal links of one markdown page.
+
+    Args:
+        text: Markdown source
+
+    Returns:
+        Tuple (anchors, links): anchors maps each id to the lines defining
+        it; links is a list of (line, target) with the raw link target
+    """
+    anchors = {}
+    links = []
+    fence = None
+    for number, line in enumerate(text.splitlines(), 1):
+        marker = _FENCE.match(line)
+        if fence:
+            if marker and marker.group(1) == fence:
+                fence = None
+            continue
+        if marker:
+            fence = marker.group(1)
+            continue
+
+        heading = _HEADING.match(line)
+        if heading:
+            title = heading.group(2).rstrip("#").rstrip()
+            explicit = _HEADING_ID.search(title)
+            if explicit:
+                anchors.setdefault(explicit.group(1), []).append(number)
+                title = title[:explicit.start()]
+            else:
+                # toc numbers repeated heading ids: id, id_1, id_2, ...
+                slug = base = slugify(_strip_markup(title))
+                suffix = 0
+                while slug in anchors:
+                    suffix += 1
+                    slug = f"{base}_{suffix}"
+                anchors[slug] = [number]
+        for html_id in _HTML_ID.findall(line):
+            anchors.setdefault(html_id, []).append(number)
+
+        reference = _REFERENCE.match(line)
+        if reference:
+            links.append((number, reference.group(1)))
+            continue
+        for target in _LINK.findall(_INLINE_CODE.sub("", line)):
+            links.append((number, target))
+    return anchors, links
+
+
+def _resolve(page, target):
+    """Split a link target into (site-relative path or None, anchor)."""
+    path, _, anchor = target.partition("#")
+    path = unquote(path.split("?", 1)[0])
+    if not path:
+        return page, unquote(anchor)
+    directory = posixpath.dirname(page)
+    return posixpath.normpath(posixpath.join(directory, path)), unquote(anchor)
+
+
+def validate_site(docs_dir, entry_pages=("index.md",)):
+    """Validate the links between all markdown pages of a docs directory.
+
+    Args:
+        docs_dir: MkDocs docs directory
+        entry_pages: Pages reachable without a link (the home page and the
+            nav), relative to docs_dir
+
+    Returns:
+        LinkReport
+    """
+    docs_dir = Path(docs_dir)
+    report = LinkReport()
+
+    # One pass over the site: anchors and links of every page
+    pages = {}
+    for path in sorted(docs_dir.rglob("*.md")):
+        page = path.relative_to(docs_dir).as_posix()
+        pages[page] = scan_page(path.read_text(encoding="utf-8"))
+    report.pages = len(pages)
+
+    for page, (anchors, _) in pages.items():
+        for anchor, lines in anchors.items():
+            if len(lines) > 1:
+                report.duplicate_anchors.append((page, anchor, lines))
+
+    linked = {page: [] for page in pages}
+    files = {}  # other link targets, checked once each
+    for page, (_, links) in pages.items():
+        for line, target in links:
+            if _SCHEME.match(target) or target.startswith("/"):
+                continue
+            report.links += 1
+            path, anchor = _resolve(page, target)
+            if path in pages:
+                linked[page].append(path)
+                if anchor and anchor not in pages[path][0]:
+                    report.broken.append(
+                        BrokenLink(page, line, target, f"no anchor #{anchor} in {path}")
+                    )
+                continue
+            if path.endswith(".md"):
+                report.broken.append(BrokenLink(page, line, target, f"no page {path}"))
+                continue
+            if path not in files:
+                files[path] = (docs_dir / path).exists()
+            if not files[path]:
+                report.broken.append(BrokenLink(page, line, target, f"no file {path}"))
+
+    # Pages reachable from the entry pages
+    reached = {page for page in entry_pages if page in pages}
+    queue = deque(reached)
+    while queue:
+        for target in linked[queue.popleft()]:
+            if target not in reached:
+                reached.add(target)
+                queue.append(target)
+    report.orphans = [page for page in pages if page not in reached]
+    return report
+
+
+def nav_pages(nav):
+    """Markdown pages listed in an MkDocs ``nav`` configuration.
+
+    Args:
+        nav: The ``nav`` setting: a list of page paths and of single-key
+            dicts mapping titles to paths or nested lists
+
+    Returns:
+        List of page paths relative to the docs directory
+    """
+    pages = []
+    stack = [nav or []]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            if item.endswith(".md"):
+                pages.append(item)
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(reversed(item))
+    return pages
+
+
+def config_nav_pages(config_file):
+    """Markdown pages listed in the ``nav`` of an MkDocs configuration file.
+
+    MkDocs' custom tags (``!ENV``, ``!relative``, ``!!python/name:...``) are
+    read as empty values; only the nav is used.
+
+    Args:
+        config_file: Path of the ``mkdocs.yml`` file
+
+    Returns:
+        List of page paths relative to the docs directory
+
+    Raises:
+        ImportError: If PyYAML (installed with MkDocs) is missing
+    """
+    import yaml
+
+    class ConfigLoader(yaml.SafeLoader):
+        pass
+
+    def ignore_tag(loader, suffix, node):
+        return None
+
+    ConfigLoader.add_multi_constructor("!", ignore_tag)
+    ConfigLoader.add_multi_constructor("tag:yaml.org,2002:python/", ignore_tag)
+    with open(config_file, encoding="utf-8") as f:
+        config = yaml.load(f, Loader=ConfigLoader) or {}
+    return nav_pages(config.get("nav"))
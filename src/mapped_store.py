@@ -0,0 +1,195 @@
+"""Memory-mappable on-disk form of a ``FrozenStore``.
+
+A mapped store is a directory holding a frozen graph in files that can be
+opened with ``mmap`` instead of being parsed or unpickled:
+
+- ``terms.bin`` / ``term_offsets.npy``: every term's N3 form, UTF-8 encoded
+  and concatenated in sorted byte order, plus the offset of each term.
+  Term IDs are positions in this order, so looking a term up is a binary
+  search over the file and no term dictionary is built in memory.
+- ``rows.npy``, ``spo.npy``, ``pos.npy``, ``osp.npy``: the ID arrays of the
+  frozen store, one column per row of each index array.
+- ``manifest.json``: format version, sizes, prefixes and the source files
+  (with SHA-256 hashes) the graph was built from.
+
+Every process that opens the same directory shares the pages through the OS
+page cache, so several workers holding QUDT, OntoCAPE and waterFRAME cost
+roughly the memory of one. Terms are decoded on first use and cached per
+process.
+"""
+import json
+import mmap
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import rdflib
+from rdflib import Graph
+from rdflib.util import from_n3
+
+from frozen_store import ID_DTYPE, PERMUTATIONS, FrozenStore, freeze
+from helpers import file_sha256
+
+# Bump when the on-disk layout changes so old stores are rebuilt
+MAPPED_VERSION = 1
+
+MANIFEST_FILENAME = "manifest.json"
+
+
+class MappedTerms:
+    """Read-only term table over a sorted, memory-mapped blob of N3 strings.
+
+    Supports the two operations FrozenStore needs from its term list and
+    term dictionary: ``terms[term_id]`` and ``term_ids.get(term)``.
+    """
+
+    def __init__(self, blob, offsets):
+        self._blob = blob
+        self._offsets = offsets
+        self._decoded = {}
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def _n3(self, term_id):
+        return self._blob[int(self._offsets[term_id]):int(self._offsets[term_id + 1])]
+
+    def __getitem__(self, term_id):
+        term = self._decoded.get(term_id)
+        if term is None:
+            term = self._decoded[term_id] = from_n3(self._n3(term_id).decode("utf-8"))
+        return term
+
+    def get(self, term, default=None):
+        """Return the ID of a term, or ``default`` if the store does not hold it."""
+        key = term.n3().encode("utf-8")
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._n3(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self) and self._n3(lo) == key:
+            return lo
+        return default
+
+
+class MappedStore(FrozenStore):
+    """FrozenStore whose arrays and terms are memory-mapped from a directory."""
+
+    def __init__(self, configuration=None, identifier=None):
+        super().__init__(configuration, identifier)
+        self.manifest = {}
+        self._mmap = None
+
+    @classmethod
+    def open_directory(cls, directory):
+        """Open a directory written by ``write_mapped_store``.
+
+        Raises:
+            ValueError: If the directory was written by an incompatible version
+        """
+        directory = Path(directory)
+        with open(directory / MANIFEST_FILENAME, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != MAPPED_VERSION:
+            raise ValueError(f"Unsupported mapped store version in {directory}")
+
+        store = cls()
+        store.manifest = manifest
+        blob = b""
+        # mmap refuses empty files, which an empty graph produces
+        if manifest["terms"]:
+            with open(directory / "terms.bin", "rb") as f:
+                blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        store._mmap = blob
+        offsets = np.load(directory / "term_offsets.npy", mmap_mode="r")
+        store.terms = store.term_ids = MappedTerms(blob, offsets)
+        store.rows = np.load(directory / "rows.npy", mmap_mode="r")
+        for name in PERMUTATIONS:
+            columns = np.load(directory / f"{name}.npy", mmap_mode="r")
+            store.indexes[name] = tuple(columns)
+        for prefix, namespace in manifest["namespaces"]:
+            store.bind(prefix, rdflib.URIRef(namespace))
+        return store
+
+    @property
+    def sources(self):
+        """Mapping of source file path to the SHA-256 it had when built."""
+        return {Path(path): digest for path, digest in self.manifest["sources"]}
+
+    def is_current(self):
+        """Whether every recorded source file still has the recorded content."""
+        return all(
+            path.exists() and file_sha256(path) == digest
+            for path, digest in self.sources.items()
+        )
+
+
+def write_mapped_store(graph, directory, source_files=()):
+    """Write a graph as a memory-mappable store directory.
+
+    The directory is written next to its final location and renamed into
+    place, so readers never see a partial store.
+
+    Args:
+        graph: Graph to write; frozen graphs are written without re-freezing
+        directory: Target directory (replaced if it exists)
+        source_files: Files the graph was built from, recorded with hashes
+
+    Returns:
+        Path of the written directory
+    """
+    directory = Path(directory)
+    if isinstance(graph.store, FrozenStore):
+        frozen = graph.store
+    else:
+        frozen = freeze(graph).store
+
+    # Renumber terms in sorted N3 byte order so IDs double as search keys
+    encoded = [term.n3().encode("utf-8") for term in frozen.terms]
+    order = sorted(range(len(encoded)), key=encoded.__getitem__)
+    new_ids = np.empty(len(order), dtype=ID_DTYPE)
+    new_ids[order] = np.arange(len(order), dtype=ID_DTYPE)
+    offsets = np.zeros(len(order) + 1, dtype=np.uint64)
+    offsets[1:] = np.cumsum([len(encoded[i]) for i in order], dtype=np.uint64)
+
+    tmp_dir = directory.with_name(f"{directory.name}.tmp{os.getpid()}")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+    with open(tmp_dir / "terms.bin", "wb") as f:
+        for i in order:
+            f.write(encoded[i])
+    np.save(tmp_dir / "term_offsets.npy", offsets)
+    np.save(tmp_dir / "rows.npy", new_ids[np.asarray(frozen.rows)])
+    for name in PERMUTATIONS:
+        columns = new_ids[np.stack(frozen.indexes[name])]
+        # Stable re-sort on the renumbered leading columns keeps the
+        # source order of rows that share them
+        order_rows = np.lexsort((columns[1], columns[0]))
+        np.save(tmp_dir / f"{name}.npy", np.ascontiguousarray(columns[:, order_rows]))
+
+    manifest = {
+        "version": MAPPED_VERSION,
+        "rdflib": rdflib.__version__,
+        "triples": len(frozen),
+        "terms": len(order),
+        "namespaces": [[prefix, str(ns)] for prefix, ns in graph.namespaces()],
+        "sources": [
+            [str(Path(p).resolve()), file_sha256(Path(p))] for p in source_files
+        ],
+    }
+    with open(tmp_dir / MANIFEST_FILENAME, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    shutil.rmtree(directory, ignore_errors=True)
+    os.replace(tmp_dir, directory)
+    return directory
+
+
+def open_mapped_graph(directory):
+    """Open a mapped store directory as a read-only Graph."""
+    store = MappedStore.open_directory(directory)
+    return Graph(store=store, bind_namespaces="none")
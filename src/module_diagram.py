@@ -0,0 +1,180 @@
+"""Class and property diagrams of ontology modules, rendered as SVG.
+
+A module's diagram shows the classes it defines, the superclasses they
+extend (outside the module too), ``rdfs:subClassOf`` edges, and one edge
+per object property from each of its domains to each of its ranges. Classes
+are laid out in layers by their depth in the class hierarchy, roots on top.
+
+Building the diagram's contents (``module_diagram_spec``) only reads the
+entity index, so the generator does it for every module and compares its
+digest with the last build; only changed diagrams are drawn. Drawing
+(``render_diagram``) is slow for large modules and runs in worker processes.
+It needs networkx and matplotlib, which are imported there and not at module
+level, so generating documentation without diagrams never pays for them.
+"""
+import hashlib
+import importlib.util
+import json
+import math
+from dataclasses import asdict, dataclass, field
+
+from rdflib import URIRef
+from rdflib.namespace import OWL, RDF, RDFS
+
+# Fixed salt for the ids matplotlib writes into SVGs, so that an unchanged
+# diagram is byte-identical across builds
+SVG_HASH_SALT = "waterframe-module-diagram"
+
+NODE_COLORS = {"class": "#bbdefb", "external": "#eeeeee"}
+
+
+@dataclass
+class DiagramSpec:
+    """What a module diagram shows, independent of how it is drawn."""
+
+    title: str
+    nodes: list = field(default_factory=list)  # [uri, label, kind, layer]
+    edges: list = field(default_factory=list)  # [source, target, property label or ""]
+
+    def digest(self):
+        """SHA-256 of the diagram's contents."""
+        data = json.dumps(asdict(self), sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def diagrams_available():
+    """Whether networkx and matplotlib are installed, without importing them."""
+    return all(importlib.util.find_spec(name) for name in ("networkx", "matplotlib"))
+
+
+def module_diagram_spec(title, entity_uris, index, uris, hierarchy):
+    """Collect the classes and edges of a module's diagram.
+
+    Args:
+        title: Diagram title
+        entity_uris: URIs of the entities the module defines
+        index: EntityIndex of the loaded graph
+        uris: UriTable giving the labels of the nodes
+        hierarchy: ClassHierarchy giving the layer of each class
+
+    Returns:
+        DiagramSpec, with nodes and edges sorted
+    """
+    defined = {str(uri) for uri in entity_uris}
+    nodes = {}
+    edges = set()
+
+    def add_node(uri):
+        if uri not in nodes:
+            kind = "class" if uri in defined else "external"
+            nodes[uri] = [uri, uris.local_name(uri), kind, hierarchy.depth(uri)]
+
+    for uri in sorted(defined):
+        term = URIRef(uri)
+        types = index.objects(term, RDF.type)
+        superclasses = [
+            s for s in index.objects(term, RDFS.subClassOf) if isinstance(s, URIRef)
+        ]
+        if OWL.Class in types or superclasses:
+            add_node(uri)
+            for superclass in superclasses:
+                add_node(str(superclass))
+                edges.add((uri, str(superclass), ""))
+        if OWL.ObjectProperty in types:
+            label = uris.local_name(uri)
+            for domain in index.objects(term, RDFS.domain):
+                for range_ in index.objects(term, RDFS.range):
+                    if isinstance(domain, URIRef) and isinstance(range_, URIRef):
+                        add_node(str(domain))
+                        add_node(str(range_))
+                        edges.add((str(domain), str(range_), label))
+
+    return DiagramSpec(
+        title,
+        sorted(nodes.values()),
+        [list(edge) for edge in sorted(edges)],
+    )
+
+
+def render_diagram(spec, path):
+    """Draw a diagram and write it as SVG.
+
+    Args:
+        spec: DiagramSpec to draw
+        path: Output file
+    """
+    import matplotlib
+    import networkx as nx
+    from matplotlib.figure import Figure
+
+    graph = nx.DiGraph()
+    for uri, label, kind, layer in spec.nodes:
+        graph.add_node(uri, label=label, kind=kind, layer=layer)
+    graph.add_edges_from((source, target) for source, target, _ in spec.edges)
+
+    # Layers stacked along y, roots (depth 0) on top
+    pos = nx.multipartite_layout(graph, subset_key="layer", align="horizontal")
+    pos = {node: (x, -y) for node, (x, y) in pos.items()}
+
+    layers = {}
+    for _, _, _, layer in spec.nodes:
+        layers[layer] = layers.get(layer, 0) + 1
+    width = max(6.0, 1.6 * max(layers.values(), default=1))
+    height = max(3.0, 1.4 * len(layers))
+
+    subclass_edges = [(s, t) for s, t, label in spec.edges if not label]
+    # One arrow per (domain, range) pair, labelled with all its properties
+    property_labels = {}
+    for s, t, label in spec.edges:
+        if label:
+            property_labels.setdefault((s, t), []).append(label)
+    node_size = 1800 if len(spec.nodes) < 30 else int(54000 / len(spec.nodes))
+    font_size = max(5, min(9, int(180 / math.sqrt(len(spec.nodes) + 1))))
+
+    with matplotlib.rc_context({"svg.hashsalt": SVG_HASH_SALT}):
+        figure = Figure(figsize=(width, height))
+        ax = figure.add_subplot()
+        ax.set_axis_off()
+        ax.set_title(spec.title)
+        nx.draw_networkx_nodes(
+            graph, pos, ax=ax, node_size=node_size, node_shape="s",
+            node_color=[NODE_COLORS[kind] for _, _, kind, _ in spec.nodes],
+            nodelist=[uri for uri, _, _, _ in spec.nodes], edgecolors="#546e7a",
+        )
+        nx.draw_networkx_edges(
+            graph, pos, ax=ax, edgelist=subclass_edges, node_size=node_size,
+            arrowstyle="-|>", arrowsize=14, edge_color="#37474f",
+        )
+        nx.draw_networkx_edges(
+            graph, pos, ax=ax, edgelist=list(property_labels), node_size=node_size,
+            arrowstyle="->", style="dashed", edge_color="#ef6c00",
+            connectionstyle="arc3,rad=0.15",
+        )
+        nx.draw_networkx_labels(
+            graph, pos, ax=ax, font_size=font_size,
+            labels={uri: label for uri, label, _, _ in spec.nodes},
+        )
+        nx.draw_networkx_edge_labels(
+            graph, pos, ax=ax, font_size=6, font_color="#ef6c00",
+            edge_labels={
+                edge: ", ".join(labels) for edge, labels in property_labels.items()
+            },
+            connectionstyle="arc3,rad=0.15",
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        figure.savefig(path, format="svg", bbox_inches="tight", metadata={"Date": None})
+
+
+def render_diagram_job(job):
+    """Pool entry point: render one (spec, path) job.
+
+    Returns:
+        None on success, else the error message, so one failing diagram
+        does not stop the others
+    """
+    spec, path = job
+    try:
+        render_diagram(spec, path)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    return None
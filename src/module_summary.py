@@ -0,0 +1,84 @@
+"""Per-file summaries of ontology modules, captured when the files are loaded.
+
+The documentation generator needs to know, for every module and bridge file,
+its ontology header (IRI, dc:title, rdfs:comment) and which entities it
+defines. Loaders already parse each file into its own graph before merging,
+so they record a ``ModuleSummary`` per file at that point and attach the
+summaries to the merged graph as ``graph.module_summaries`` (a dict keyed by
+resolved file path). Consumers then never have to parse a module again.
+"""
+from dataclasses import dataclass
+from pathlib import Path
+
+from rdflib.namespace import DC, OWL, RDF, RDFS
+
+# rdf:type values that make a subject a documented entity
+ENTITY_TYPES = (
+    OWL.Class, OWL.ObjectProperty, OWL.DatatypeProperty, OWL.NamedIndividual
+)
+
+
+@dataclass
+class ModuleSummary:
+    """The ontology header and defined entities of one source file."""
+
+    path: Path
+    uri: str = None
+    title: str = None
+    description: str = None
+    entities: tuple = ()
+
+    def to_json(self):
+        """Return a JSON-serializable dict (without the path)."""
+        return {
+            "uri": self.uri,
+            "title": self.title,
+            "description": self.description,
+            "entities": list(self.entities),
+        }
+
+    @classmethod
+    def from_json(cls, path, data):
+        """Rebuild a summary written by ``to_json``."""
+        return cls(Path(path), data["uri"], data["title"], data["description"],
+                   tuple(data["entities"]))
+
+
+def defined_entities(graph):
+    """Return the URIs (as strings) of the classes, properties and individuals
+    declared in a graph, including classes only given an rdfs:subClassOf."""
+    entities = {}
+    for type_uri in ENTITY_TYPES:
+        for subject in graph.subjects(RDF.type, type_uri):
+            entities[str(subject)] = None
+    for subject in graph.subjects(RDFS.subClassOf, None):
+        entities[str(subject)] = None
+    return list(entities)
+
+
+def summarize_module(path, graph):
+    """Summarize one parsed source file.
+
+    The header comes from the file's first owl:Ontology declaration, with
+    its first dc:title and rdfs:comment.
+
+    Args:
+        path: Source file
+        graph: Graph holding only that file's triples
+
+    Returns:
+        ModuleSummary
+    """
+    summary = ModuleSummary(
+        Path(path).resolve(), entities=tuple(defined_entities(graph))
+    )
+    for ontology_uri in graph.subjects(RDF.type, OWL.Ontology):
+        summary.uri = str(ontology_uri)
+        summary.title = next(
+            (str(t) for t in graph.objects(ontology_uri, DC.title)), None
+        )
+        summary.description = next(
+            (str(c) for c in graph.objects(ontology_uri, RDFS.comment)), None
+        )
+        break
+    return summary
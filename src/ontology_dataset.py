@@ -0,0 +1,253 @@
+"""Incrementally refreshable ontology graph backed by an rdflib ``Dataset``.
+
+Every file in the owl:imports closure (modules, bridges, instance data) is
+parsed into its own named graph, identified by the file's ``file:`` URI. The
+dataset's default graph is the union of all of them, so it can be handed to
+anything that expects the merged ontology graph.
+
+``refresh`` checks which files changed on disk and re-parses only those: the
+stale named graph is dropped and replaced, imports that became reachable are
+loaded and those that no longer are get dropped. Long-running processes
+(``mkdocs serve``, services) can therefore pick up an edit to one module
+without re-parsing the rest of the ontology.
+
+Like graphs from ``ontology_loader``, the dataset carries
+``module_summaries``, kept current as files are reloaded.
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from rdflib import Dataset, URIRef
+from rdflib.namespace import OWL
+
+from helpers import file_sha256, get_ontology_path
+from import_resolver import ImportResolver, parse_file
+from module_summary import summarize_module
+
+
+@dataclass
+class RefreshReport:
+    """What a call to ``OntologyDataset.refresh`` changed."""
+
+    reloaded: list = field(default_factory=list)
+    added: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    failed: dict = field(default_factory=dict)
+
+    @property
+    def changed(self):
+        """Whether the union graph may differ from before the refresh."""
+        return bool(self.reloaded or self.added or self.removed)
+
+
+class OntologyDataset:
+    """The import closure of an ontology, one named graph per source file."""
+
+    def __init__(self, ontology_path=None, extra_files=()):
+        """Initialize the dataset and load every reachable file.
+
+        Args:
+            ontology_path: Main ontology file (defaults to waterframe.ttl)
+            extra_files: Additional roots, e.g. instance data
+        """
+        self.ontology_path = Path(ontology_path or get_ontology_path()).resolve()
+        self.roots = [self.ontology_path, *(Path(f).resolve() for f in extra_files)]
+        self.dataset = Dataset(default_union=True)
+        # path -> ModuleSummary, shared with the dataset so that code given
+        # only the union graph can find them
+        self.module_summaries = self.dataset.module_summaries = {}
+        self.resolver = None
+        self._imports = {}       # path -> resolved local import targets
+        self._fingerprints = {}  # path -> (mtime_ns, size, sha256)
+        self._catalog_fingerprint = None
+        self.reload()
+
+    @property
+    def graph(self):
+        """Union of all named graphs; use wherever the merged graph is expected."""
+        return self.dataset
+
+    @property
+    def files(self):
+        """Loaded source files, in load order."""
+        return list(self._fingerprints)
+
+    def named_graph(self, path):
+        """Return the named graph holding the triples of one source file."""
+        return self.dataset.graph(self._graph_id(path))
+
+    def reload(self):
+        """Drop everything and load the full import closure from scratch."""
+        for path in list(self._fingerprints):
+            self._drop(path)
+
+        self.resolver = ImportResolver.for_ontology(self.ontology_path)
+        self._catalog_fingerprint = self._fingerprint(self.resolver.catalog_path)
+
+        closure = self.resolver.resolve(self.roots)
+        for path in closure.files:
+            self._insert(path, closure.graphs[path])
+
+    def refresh(self):
+        """Re-parse files that changed on disk since they were loaded.
+
+        A changed catalog invalidates every import mapping, so it triggers a
+        full ``reload``.
+
+        Returns:
+            RefreshReport listing the reloaded, newly imported, dropped and
+            unparseable files
+        """
+        report = RefreshReport()
+        catalog_path = self.resolver.catalog_path
+        if catalog_path is not None:
+            self._catalog_fingerprint = self._revalidate(
+                catalog_path, self._catalog_fingerprint
+            )
+        if catalog_path is not None and self._catalog_fingerprint is None:
+            old_files = set(self._fingerprints)
+            self.reload()
+            report.reloaded = [p for p in self._fingerprints if p in old_files]
+            report.added = [p for p in self._fingerprints if p not in old_files]
+            report.removed = sorted(old_files - set(self._fingerprints))
+            return report
+
+        for path, fingerprint in list(self._fingerprints.items()):
+            if not path.exists():
+                self._drop(path)
+                report.removed.append(path)
+                continue
+            current = self._revalidate(path, fingerprint)
+            if current is not None:
+                self._fingerprints[path] = current
+                continue
+            try:
+                graph = parse_file(path)
+            except Exception as e:
+                # Keep serving the last good version of the file
+                print(f"Warning: Could not reload {path}: {e}")
+                report.failed[path] = e
+                continue
+            self._drop(path)
+            self._insert(path, graph)
+            report.reloaded.append(path)
+
+        if report.reloaded or report.removed:
+            self._sync_imports(report)
+        return report
+
+    def _sync_imports(self, report):
+        """Load newly reachable imports and drop unreachable ones."""
+        pending = [p for p in self.roots if p not in self._fingerprints and p.exists()]
+        pending += [
+            target for path in list(self._imports)
+            for target in self._imports[path] if target not in self._fingerprints
+        ]
+        while pending:
+            path = pending.pop(0)
+            if path in self._fingerprints or path in report.failed:
+                continue
+            try:
+                graph = parse_file(path)
+            except Exception as e:
+                print(f"Warning: Could not load {path}: {e}")
+                report.failed[path] = e
+                continue
+            self._insert(path, graph)
+            report.added.append(path)
+            pending.extend(
+                t for t in self._imports[path] if t not in self._fingerprints
+            )
+
+        reachable = set()
+        stack = [p for p in self.roots if p in self._fingerprints]
+        while stack:
+            path = stack.pop()
+            if path not in reachable:
+                reachable.add(path)
+                stack.extend(t for t in self._imports[path] if t in self._fingerprints)
+        for path in [p for p in self._fingerprints if p not in reachable]:
+            self._drop(path)
+            if path not in report.removed:
+                report.removed.append(path)
+
+    def _insert(self, path, parsed):
+        """Copy a parsed file into its named graph, in parse order."""
+        named = self.dataset.graph(self._graph_id(path))
+        named.addN((s, p, o, named) for s, p, o in parsed.added)
+        for prefix, namespace in parsed.namespaces():
+            self.dataset.bind(prefix, namespace, override=False)
+
+        targets = []
+        for iri in parsed.objects(None, OWL.imports):
+            target = self.resolver.resolve_iri(iri)
+            if target is not None and target not in targets:
+                targets.append(target)
+        self._imports[path] = targets
+        self._fingerprints[path] = self._fingerprint(path)
+        summary = summarize_module(path, parsed)
+        self.module_summaries[summary.path] = summary
+
+    def _drop(self, path):
+        self.dataset.remove_graph(self._graph_id(path))
+        self._imports.pop(path, None)
+        self._fingerprints.pop(path, None)
+        self.module_summaries.pop(Path(path).resolve(), None)
+
+    @staticmethod
+    def _graph_id(path):
+        return URIRef(Path(path).resolve().as_uri())
+
+    @staticmethod
+    def _fingerprint(path):
+        """Return (mtime_ns, size, sha256) for a file, or None if it is missing."""
+        if path is None:
+            return None
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, file_sha256(path))
+
+    @staticmethod
+    def _revalidate(path, fingerprint):
+        """Return the file's fingerprint if its content is unchanged, else None.
+
+        The file is only hashed when its stat changed; editors often rewrite
+        files without changing them, and such a file keeps its fingerprint
+        with the new stat so it is not hashed again next time.
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if (stat.st_mtime_ns, stat.st_size) == fingerprint[:2]:
+            return fingerprint
+        if file_sha256(path) != fingerprint[2]:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, fingerprint[2])
+
+
+# roots -> OntologyDataset, see live_dataset
+_live_datasets = {}
+
+
+def live_dataset(ontology_path=None, extra_files=()):
+    """Return a process-wide dataset for these roots, refreshed from disk.
+
+    The first call loads the full closure; later calls only re-parse files
+    that changed in between. The dataset lives in this module rather than in
+    the caller so it survives callers that are re-imported on every run,
+    such as MkDocs hooks under ``mkdocs serve``.
+
+    Returns:
+        Tuple of (OntologyDataset, RefreshReport or None on the first load)
+    """
+    roots = tuple(
+        Path(f).resolve() for f in (ontology_path or get_ontology_path(), *extra_files)
+    )
+    dataset = _live_datasets.get(roots)
+    if dataset is None:
+        dataset = _live_datasets[roots] = OntologyDataset(roots[0], roots[1:])
+        return dataset, None
+    return dataset, dataset.refresh()
@@ -0,0 +1,282 @@
+"""Single entry point for loading the assembled waterFRAME graph.
+
+Every tool (documentation generator, validation script, tests, notebook) should
+go through ``load_ontology`` rather than calling ``Graph.parse`` itself, so
+they all share the owl:imports resolution in ``import_resolver`` and the
+snapshot cache in ``snapshot_cache``.
+
+Read-only consumers that may load the same files many times in one process
+(the test suite, repeated ``OntologyDocGenerator`` construction) should use
+``load_shared_ontology``, which memoizes graphs per file set and content hash
+and hands out views that refuse modification.
+
+Graphs loaded from an import closure carry ``graph.module_summaries``: the
+ontology header and defined entities of every source file, recorded while the
+files were parsed (see ``module_summary``). Other graphs may lack it, so read
+it with ``getattr(graph, "module_summaries", None)``.
+"""
+from pathlib import Path
+
+from rdflib import Graph
+from rdflib.graph import ModificationException
+
+from helpers import get_ontology_path
+from import_resolver import ImportResolver, unreachable_files
+from module_summary import summarize_module
+from rdf_formats import parse_rdf
+from snapshot_cache import SnapshotCache
+
+# (request) -> (key files, content key, graph), see load_shared_ontology
+_shared_graphs = {}
+
+
+class ReadOnlyGraphError(ModificationException):
+    """Raised when something tries to modify a shared ontology graph."""
+
+    def __str__(self):
+        return (
+            "Shared ontology graphs are read-only; "
+            "use load_ontology() for a private, mutable copy"
+        )
+
+
+class ReadOnlyGraph(Graph):
+    """A view over another graph's store that refuses every modification.
+
+    Views are cheap: they share the underlying store and namespace bindings,
+    so any number of consumers can hold one without copying triples.
+    """
+
+    def __init__(self, graph):
+        super().__init__(
+            store=graph.store,
+            identifier=graph.identifier,
+            namespace_manager=graph.namespace_manager,
+        )
+        self.module_summaries = getattr(graph, "module_summaries", None)
+
+    def _refuse(self, *args, **kwargs):
+        raise ReadOnlyGraphError()
+
+    add = addN = remove = set = parse = update = bind = _refuse
+    __iadd__ = __isub__ = _refuse
+
+
+def parse_sources(source_files, verbose=False):
+    """Parse source files into a single new graph, skipping unreadable files.
+
+    Formats and compression are detected per file (see ``rdf_formats``).
+    """
+    graph = Graph()
+    for source_file in source_files:
+        try:
+            stats = parse_rdf(source_file, graph)
+            if verbose:
+                print(f"Loaded {stats}")
+        except Exception as e:
+            print(f"Warning: Could not load {source_file}: {e}")
+    return graph
+
+
+def resolve_imports(ontology_path=None, extra_files=()):
+    """Resolve the import closure of an ontology plus any extra root files.
+
+    Args:
+        ontology_path: Main ontology file (defaults to waterframe.ttl)
+        extra_files: Additional roots, e.g. instance data, whose imports are
+            followed as well
+
+    Returns:
+        ImportClosure holding the parsed graph of every reachable file
+    """
+    ontology_path = Path(ontology_path or get_ontology_path())
+    resolver = ImportResolver.for_ontology(ontology_path)
+    return resolver.resolve([ontology_path, *extra_files])
+
+
+def load_ontology(ontology_path=None, source_files=None, extra_files=(),
+                  use_cache=True, cache_dir=None, verbose=False):
+    """Load the merged ontology graph, from a snapshot when one is up to date.
+
+    By default the owl:imports closure of ``ontology_path`` is loaded, with
+    imports mapped to local files through the nearest ``catalog-v001.xml``.
+
+    Args:
+        ontology_path: Main ontology file (defaults to waterframe.ttl)
+        source_files: Explicit list of files to load instead of following
+            imports from ``ontology_path``
+        extra_files: Additional roots loaded alongside ``ontology_path``
+        use_cache: Read and write binary snapshots keyed on source content
+        cache_dir: Override the snapshot directory
+        verbose: Print which files or snapshot the graph came from
+
+    Returns:
+        rdflib Graph containing the triples of every loaded file
+    """
+    graph, _ = _load(ontology_path, source_files, extra_files, use_cache,
+                     cache_dir, verbose)
+    return graph
+
+
+def _load(ontology_path, source_files, extra_files, use_cache, cache_dir, verbose):
+    """Load a graph; also return the files whose content determines it."""
+    cache = SnapshotCache(cache_dir) if use_cache else None
+
+    if source_files is not None:
+        source_files = [Path(f) for f in source_files if Path(f).exists()]
+        if not source_files:
+            return Graph(), []
+        graph = cache.load(source_files) if cache is not None else None
+        if graph is not None:
+            if verbose:
+                print(f"Loaded {len(source_files)} file(s) from snapshot cache")
+            return graph, source_files
+        graph = parse_sources(source_files, verbose=verbose)
+        _store_snapshot(cache, source_files, graph)
+        return graph, source_files
+
+    ontology_path = Path(ontology_path or get_ontology_path())
+    roots = [ontology_path, *(Path(f) for f in extra_files)]
+    if not all(root.exists() for root in roots):
+        return Graph(), []
+
+    # The closure is only known after parsing, so reuse the file list
+    # recorded by the previous load; the snapshot key covers all of it
+    if cache is not None:
+        recorded = cache.load_sources(roots)
+        graph = cache.load(recorded) if recorded else None
+        if graph is not None:
+            if verbose:
+                print(f"Loaded {len(recorded)} file(s) from snapshot cache")
+            graph.module_summaries = cache.load_summaries(recorded)
+            return graph, recorded
+
+    closure = resolve_imports(ontology_path, extra_files)
+    if verbose:
+        for path in closure.files:
+            print(f"Loaded {closure.graphs[path].parse_stats}")
+        for iri in sorted(closure.unresolved):
+            print(f"Skipped import not in local catalog: {iri}")
+    for path in unreachable_files(ontology_path, closure.files):
+        print(
+            f"Warning: {path} is not imported from {ontology_path.name} "
+            f"through the catalog; its entities are not loaded"
+        )
+    graph = closure.merge()
+    summaries = (summarize_module(path, closure.graphs[path]) for path in closure.files)
+    graph.module_summaries = {summary.path: summary for summary in summaries}
+
+    if _store_snapshot(cache, closure.key_files, graph):
+        cache.store_sources(roots, closure.key_files)
+        cache.store_summaries(closure.key_files, graph.module_summaries)
+    return graph, closure.key_files
+
+
+def _store_snapshot(cache, source_files, graph):
+    """Write a snapshot if caching is enabled; return whether it was written."""
+    if cache is None:
+        return False
+    try:
+        cache.store(source_files, graph)
+    except OSError as e:
+        print(f"Warning: Could not write ontology snapshot: {e}")
+        return False
+    return True
+
+
+def load_shared_ontology(ontology_path=None, source_files=None, extra_files=(),
+                         use_cache=True, cache_dir=None, verbose=False,
+                         frozen=False):
+    """Load an ontology once per process and return a read-only view of it.
+
+    Graphs are memoized per requested file set and the content hash of every
+    file that went into them, so an edited source is picked up on the next
+    call while unchanged ones are never parsed twice. Takes the same arguments
+    as ``load_ontology``, plus:
+
+    Args:
+        frozen: Keep the memoized graph in a ``FrozenStore`` (sorted NumPy
+            arrays) instead of the Memory store; uses several times less
+            memory for large read-mostly graphs
+
+    Returns:
+        ReadOnlyGraph sharing the memoized graph's store
+    """
+    if source_files is not None:
+        request = ("files", tuple(Path(f).resolve() for f in source_files))
+    else:
+        roots = [Path(ontology_path or get_ontology_path()), *extra_files]
+        request = ("closure", tuple(Path(f).resolve() for f in roots))
+    request += (frozen,)
+
+    hasher = SnapshotCache(cache_dir)
+    memoized = _shared_graphs.get(request)
+    if memoized is not None:
+        key_files, content_key, graph = memoized
+        if (all(Path(f).exists() for f in key_files)
+                and hasher.content_key(key_files) == content_key):
+            return ReadOnlyGraph(graph)
+
+    graph, key_files = _load(ontology_path, source_files, extra_files, use_cache,
+                             cache_dir, verbose)
+    if frozen:
+        # numpy is only needed by callers that ask for frozen graphs
+        from frozen_store import freeze
+
+        summaries = getattr(graph, "module_summaries", None)
+        graph = freeze(graph)
+        graph.module_summaries = summaries
+    if key_files:
+        _shared_graphs[request] = (key_files, hasher.content_key(key_files), graph)
+    return ReadOnlyGraph(graph)
+
+
+def load_mapped_ontology(ontology_path=None, extra_files=(), cache_dir=None,
+                         verbose=False):
+    """Load an ontology's import closure as a memory-mapped, read-only graph.
+
+    The first call builds a ``mapped_store`` directory next to the snapshots;
+    later calls, in this or any other process, map the same files, so the
+    pages are shared through the OS page cache instead of being copied into
+    every process. A store is rebuilt when any source file changes.
+
+    Args:
+        ontology_path: Main ontology file (defaults to waterframe.ttl)
+        extra_files: Additional roots loaded alongside ``ontology_path``
+        cache_dir: Override the snapshot directory
+        verbose: Print which files or store the graph came from
+
+    Returns:
+        rdflib Graph backed by a MappedStore
+    """
+    # numpy is only needed by callers that ask for mapped graphs
+    from mapped_store import open_mapped_graph, write_mapped_store
+
+    cache = SnapshotCache(cache_dir)
+    ontology_path = Path(ontology_path or get_ontology_path())
+    roots = [ontology_path, *(Path(f) for f in extra_files)]
+
+    recorded = cache.load_sources(roots)
+    if recorded:
+        directory = cache.mapped_path(recorded)
+        if directory.exists():
+            try:
+                graph = open_mapped_graph(directory)
+                if verbose:
+                    print(f"Mapped {len(graph)} triples from {directory}")
+                return graph
+            except (OSError, ValueError) as e:
+                print(f"Warning: Rebuilding unreadable mapped store {directory}: {e}")
+
+    graph, key_files = _load(ontology_path, None, extra_files, True, cache_dir, verbose)
+    if not key_files:
+        return graph
+    directory = write_mapped_store(graph, cache.mapped_path(key_files), key_files)
+    cache.prune_mapped(key_files)
+    cache.store_sources(roots, key_files)
+    return open_mapped_graph(directory)
+
+
+def clear_shared_ontologies():
+    """Drop every memoized graph held by ``load_shared_ontology``."""
+    _shared_graphs.clear()
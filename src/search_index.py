@@ -0,0 +1,142 @@
+"""Prebuilt client-side search index for ontology entities.
+
+MkDocs search indexes whole pages, which is slow and imprecise for finding
+one entity among thousands by an alternative label or a URI fragment. The
+documentation generator therefore also writes a compact JSON index of the
+entities, queried in the browser by ``docs/javascripts/extra.js``:
+
+- ``entities``: one row per entity, ``[name, label, type, url, altLabels,
+  summary]``; rows are referred to by position
+- ``tokens``: token → rows whose local name, labels or altLabels contain it
+- ``text``: token → rows whose definitions contain it
+- ``trigrams``: trigram → rows whose normalized local name, labels or
+  altLabels contain it, for substring ("URI fragment") lookups
+
+Tokens are lowercase words, with camelCase and digit runs split apart (and
+the whole word kept), so "hasInputPort" is found by "input" as well as by
+"hasinputport". ``extra.js`` tokenizes queries with the same rules.
+"""
+import json
+import re
+from dataclasses import dataclass, field
+
+SEARCH_INDEX_VERSION = 1
+
+SEARCH_INDEX_NAME = "entity-search.json"
+
+# Longest definition excerpt shown in search results
+SUMMARY_LENGTH = 160
+
+_WORD = re.compile(r"[^\W_]+")
+_CAMEL_PART = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+
+
+@dataclass
+class SearchEntry:
+    """What the search index knows about one entity."""
+
+    name: str
+    url: str
+    type: str = "Entity"
+    labels: list = field(default_factory=list)
+    alt_labels: list = field(default_factory=list)
+    definitions: list = field(default_factory=list)
+
+
+def tokenize(text):
+    """Split text into lowercase search tokens.
+
+    Args:
+        text: Label, local name or definition
+
+    Returns:
+        List of unique tokens, in order of appearance
+    """
+    tokens = {}
+    for word in _WORD.findall(text):
+        parts = _CAMEL_PART.findall(word) if word.isascii() else []
+        for part in parts:
+            tokens[part.lower()] = None
+        tokens[word.lower()] = None
+    return list(tokens)
+
+
+def normalize(text):
+    """Lowercase text and keep only its letters and digits."""
+    return "".join(ch for ch in text.lower() if ch.isalnum())
+
+
+def trigrams(text):
+    """Set of three-character substrings of normalized text."""
+    key = normalize(text)
+    return {key[i:i + 3] for i in range(len(key) - 2)}
+
+
+def _summary(definitions):
+    if not definitions:
+        return ""
+    text = " ".join(definitions[0].split())
+    if len(text) <= SUMMARY_LENGTH:
+        return text
+    return text[:SUMMARY_LENGTH - 1].rsplit(" ", 1)[0] + "…"
+
+
+def build_search_index(entries):
+    """Build the search index of a list of entities.
+
+    Args:
+        entries: SearchEntry per entity, in the order results should
+            prefer on equal scores
+
+    Returns:
+        JSON-serializable dictionary
+    """
+    rows = []
+    tokens = {}
+    text = {}
+    grams = {}
+
+    for row, entry in enumerate(entries):
+        names = [entry.name, *entry.labels, *entry.alt_labels]
+        rows.append([
+            entry.name,
+            entry.labels[0] if entry.labels else entry.name,
+            entry.type,
+            entry.url,
+            list(entry.alt_labels),
+            _summary(entry.definitions),
+        ])
+
+        name_tokens = {token for name in names for token in tokenize(name)}
+        for token in name_tokens:
+            tokens.setdefault(token, []).append(row)
+        for token in {token for d in entry.definitions for token in tokenize(d)}:
+            if token not in name_tokens:
+                text.setdefault(token, []).append(row)
+        for gram in set().union(*(trigrams(name) for name in names)):
+            grams.setdefault(gram, []).append(row)
+
+    return {
+        "version": SEARCH_INDEX_VERSION,
+        "entities": rows,
+        "tokens": dict(sorted(tokens.items())),
+        "text": dict(sorted(text.items())),
+        "trigrams": dict(sorted(grams.items())),
+    }
+
+
+def write_search_index(path, entries):
+    """Build the search index and write it as compact JSON.
+
+    Args:
+        path: Output file
+        entries: SearchEntry per entity
+
+    Returns:
+        The index dictionary
+    """
+    index = build_search_index(entries)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+    return index
@@ -0,0 +1,211 @@
+"""Persistent binary snapshots of assembled ontology graphs.
+
+A snapshot is a pickled rdflib ``Graph`` stored under a key derived from the
+content hashes of every source file that went into it. Editing any source file
+changes the key, so stale snapshots are never served; they are pruned the next
+time the same set of files is stored. Snapshots of sets whose files were moved
+or deleted are pruned whenever any snapshot is stored. Per-file module
+summaries (see ``module_summary``) are kept next to each snapshot as JSON.
+
+Snapshots are only ever read from a local cache directory that this module
+writes itself. Do not point the cache at untrusted locations: unpickling runs
+arbitrary code.
+"""
+import hashlib
+import json
+import os
+import pickle
+import shutil
+from pathlib import Path
+
+import rdflib
+from rdflib import Graph
+
+from helpers import file_sha256
+from module_summary import ModuleSummary
+
+# Bump when the on-disk layout changes so old snapshots are ignored
+SNAPSHOT_VERSION = 2
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "snapshots"
+
+
+class SnapshotCache:
+    """Stores and retrieves merged graphs keyed on their source file hashes."""
+
+    def __init__(self, cache_dir=None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding snapshot files (created on demand)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+
+    def source_set_id(self, source_files):
+        """Identify a set of source files independently of their content."""
+        digest = hashlib.sha256()
+        for path in source_files:
+            digest.update(str(Path(path).resolve()).encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()[:16]
+
+    def content_key(self, source_files):
+        """Key a set of source files on their content and the rdflib version."""
+        digest = hashlib.sha256()
+        digest.update(f"{SNAPSHOT_VERSION}:{rdflib.__version__}".encode("utf-8"))
+        for path in source_files:
+            digest.update(str(Path(path).resolve()).encode("utf-8"))
+            digest.update(file_sha256(Path(path)).encode("ascii"))
+        return digest.hexdigest()[:32]
+
+    def snapshot_path(self, source_files):
+        """Return the snapshot file path for the current content of the sources."""
+        set_id = self.source_set_id(source_files)
+        return self.cache_dir / f"{set_id}-{self.content_key(source_files)}.pickle"
+
+    def summaries_path(self, source_files):
+        """Return the module summaries file for the current content of the sources."""
+        return self.snapshot_path(source_files).with_suffix(".modules.json")
+
+    def mapped_path(self, source_files):
+        """Return the mapped store directory for the current content of the sources."""
+        return self.snapshot_path(source_files).with_suffix(".mapped")
+
+    def prune_mapped(self, source_files):
+        """Remove mapped stores built from older content of the same sources."""
+        current = self.mapped_path(source_files)
+        source_set = self.source_set_id(source_files)
+        for stale in self.cache_dir.glob(f"{source_set}-*.mapped"):
+            if stale != current:
+                shutil.rmtree(stale, ignore_errors=True)
+
+    def load(self, source_files):
+        """Return the cached graph for these sources, or None on a miss."""
+        path = self.snapshot_path(source_files)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                graph = pickle.load(f)
+        except Exception as e:
+            print(f"Warning: Discarding unreadable snapshot {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        if not isinstance(graph, Graph):
+            path.unlink(missing_ok=True)
+            return None
+        return graph
+
+    def store(self, source_files, graph):
+        """Write a snapshot of the graph and prune stale ones.
+
+        Older snapshots of the same sources are removed, as are those of
+        source sets whose files no longer all exist.
+
+        Returns:
+            Path of the written snapshot
+        """
+        # Recorded first, so the snapshot never looks orphaned to a
+        # concurrent prune
+        self.store_sources(source_files, source_files)
+        path = self.snapshot_path(source_files)
+        tmp_path = path.with_suffix(f".tmp{os.getpid()}")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+        set_id = self.source_set_id(source_files)
+        for stale in self.cache_dir.glob(f"{set_id}-*.pickle"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+        summaries = self.summaries_path(source_files)
+        for stale in self.cache_dir.glob(f"{set_id}-*.modules.json"):
+            if stale != summaries:
+                stale.unlink(missing_ok=True)
+        self.prune_orphaned()
+        return path
+
+    def prune_orphaned(self):
+        """Remove the cached files of source sets whose files are gone.
+
+        A set is orphaned when a file it recorded no longer exists (the
+        ontology was moved, copied elsewhere or deleted), or when nothing
+        records its files at all.
+        """
+        recorded = set()
+        for sources in self.cache_dir.glob("*.sources.json"):
+            try:
+                with open(sources, encoding="utf-8") as f:
+                    source_files = [Path(p) for p in json.load(f)]
+            except OSError:
+                continue
+            except ValueError:
+                source_files = None
+            if source_files and all(p.exists() for p in source_files):
+                recorded.add(sources.name.split(".", 1)[0])
+            else:
+                sources.unlink(missing_ok=True)
+        for stale in self.cache_dir.glob("*-*"):
+            if stale.name.split("-", 1)[0] in recorded:
+                continue
+            if stale.is_dir():
+                shutil.rmtree(stale, ignore_errors=True)
+            else:
+                stale.unlink(missing_ok=True)
+
+    def load_summaries(self, source_files):
+        """Return the module summaries stored for these sources, or None."""
+        try:
+            with open(self.summaries_path(source_files), encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return {
+            Path(path): ModuleSummary.from_json(path, summary)
+            for path, summary in data.items()
+        }
+
+    def store_summaries(self, source_files, summaries):
+        """Store the module summaries of a snapshot's source files."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.summaries_path(source_files)
+        tmp_path = path.with_suffix(f".tmp{os.getpid()}")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({str(p): s.to_json() for p, s in summaries.items()}, f, indent=1)
+        os.replace(tmp_path, path)
+
+    def load_sources(self, roots):
+        """Return the source files last recorded for these roots, or None.
+
+        Used when the file list itself is derived from the content (for
+        example an owl:imports closure): the recorded list is only a guess,
+        and is trusted because the snapshot key covers every file on it.
+        """
+        path = self.cache_dir / f"{self.source_set_id(roots)}.sources.json"
+        try:
+            with open(path, encoding="utf-8") as f:
+                source_files = [Path(p) for p in json.load(f)]
+        except (OSError, ValueError):
+            return None
+        if not all(p.exists() for p in source_files):
+            return None
+        return source_files
+
+    def store_sources(self, roots, source_files):
+        """Record the source files that were loaded for these roots."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{self.source_set_id(roots)}.sources.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([str(p) for p in source_files], f, indent=2)
+
+    def clear(self):
+        """Remove every snapshot and mapped store in the cache directory."""
+        if self.cache_dir.exists():
+            for snapshot in self.cache_dir.glob("*.pickle"):
+                snapshot.unlink(missing_ok=True)
+            for sources in self.cache_dir.glob("*.sources.json"):
+                sources.unlink(missing_ok=True)
+            for summaries in self.cache_dir.glob("*.modules.json"):
+                summaries.unlink(missing_ok=True)
+            for mapped in self.cache_dir.glob("*.mapped"):
+                shutil.rmtree(mapped, ignore_errors=True)
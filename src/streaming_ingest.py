@@ -0,0 +1,322 @@
+"""Bounded-memory streaming ingest of large RDF instance files.
+
+``Graph.parse`` holds a whole file (and the parser's own copy of it) in memory
+before the first triple is available. The functions here read a file line by
+line instead and push triples to a sink in fixed-size batches, so memory use
+is bounded by the batch size rather than the file size.
+
+Supported inputs (optionally gzip or zstd compressed, see ``rdf_formats``):
+
+- N-Triples and N-Quads, parsed one line at a time with rdflib's own
+  N-Triples term parser.
+- A line-oriented subset of Turtle: ``@prefix``/``@base`` (or SPARQL-style
+  ``PREFIX``/``BASE``) directives on their own lines, and statements whose
+  last line ends in `` .`` (before any ``#`` comment), as in the instance
+  files under ``data/ontology/instances`` and the ontology modules.
+  Statements are collected into chunks and each chunk is parsed with the
+  regular Turtle parser under the directives seen so far. Labelled blank
+  nodes (``_:b1``) are only guaranteed to be shared within one chunk; use
+  ``[ ... ]`` or N-Triples for those.
+
+Callers can filter or project triples on the fly (see ``keep_predicates``)
+and follow progress through a callback receiving ``IngestStats``.
+"""
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from rdflib import Dataset
+from rdflib.exceptions import ParserError
+from rdflib.plugins.parsers.ntriples import W3CNTriplesParser, r_tail, r_wspace
+
+from parallel_parse import TripleCollector
+from rdf_formats import compression_of, decompressing_reader, detect_format
+
+DEFAULT_BATCH_SIZE = 10_000
+
+# Lines of Turtle handed to the Turtle parser at once
+TURTLE_CHUNK_LINES = 5_000
+
+_TURTLE_DIRECTIVES = ("@prefix", "@base", "prefix ", "base ")
+
+# What changes how the rest of a Turtle line is read: IRIs (which may hold
+# a "#"), escapes, string delimiters and comments
+_TURTLE_TOKEN = re.compile(r"<[^>\s]*>|\\.|\"\"\"|'''|[\"'#]")
+# Rest of a string up to and including its closing delimiter
+_STRING_END = {
+    '"': re.compile(r'(?:\\.|[^\\"])*"'),
+    "'": re.compile(r"(?:\\.|[^\\'])*'"),
+    '"""': re.compile(r'(?:\\.|[^\\"]|"(?!""))*"""'),
+    "'''": re.compile(r"(?:\\.|[^\\']|'(?!''))*'''"),
+}
+
+
+@dataclass
+class IngestStats:
+    """Running totals of a streaming ingest."""
+
+    path: Path
+    total_bytes: int = 0
+    bytes_read: int = 0
+    parsed: int = 0
+    emitted: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+    @property
+    def skipped(self):
+        """Triples dropped by the filter."""
+        return self.parsed - self.emitted
+
+    @property
+    def triples_per_second(self):
+        """Parse throughput so far."""
+        return self.parsed / self.seconds if self.seconds else 0.0
+
+    @property
+    def fraction_done(self):
+        """Share of the input file read so far, between 0 and 1."""
+        return self.bytes_read / self.total_bytes if self.total_bytes else 1.0
+
+
+class _StatementParser(W3CNTriplesParser):
+    """Parses single N-Triples or N-Quads lines, sharing blank node labels."""
+
+    def parse_statement(self, line):
+        """Return (s, p, o, graph) for a line, or None for blanks and comments.
+
+        ``graph`` is None for N-Triples lines and default-graph N-Quads lines.
+        """
+        self.line = line
+        self.eat(r_wspace)
+        if not self.line or self.line.startswith("#"):
+            return None
+        subject = self.subject()
+        self.eat(r_wspace)
+        predicate = self.predicate()
+        self.eat(r_wspace)
+        object_ = self.object()
+        self.eat(r_wspace)
+        context = self.uriref() or self.nodeid() or None
+        self.eat(r_tail)
+        if self.line:
+            raise ParserError(f"Trailing garbage: {self.line}")
+        return subject, predicate, object_, context
+
+
+def _line_statements(lines):
+    parser = _StatementParser()
+    for number, line in enumerate(lines, 1):
+        try:
+            statement = parser.parse_statement(line.rstrip("\r\n"))
+        except ParserError as e:
+            raise ParserError(f"Line {number}: {e}") from None
+        if statement is not None:
+            yield statement
+
+
+def _turtle_code(line, long_quote=None):
+    """Strip the comment off a Turtle line.
+
+    Args:
+        line: Line of Turtle
+        long_quote: Delimiter of the long string the line starts in, or None
+
+    Returns:
+        Tuple (code, long_quote): the stripped line without its comment, and
+        the delimiter of a long string still open at the end of the line
+    """
+    quote = long_quote
+    position = 0
+    while True:
+        if quote:
+            end = _STRING_END[quote].match(line, position)
+            if end is None:
+                # Only long strings go on over the next line
+                return line.strip(), quote if len(quote) == 3 else None
+            position = end.end()
+            quote = None
+        token = _TURTLE_TOKEN.search(line, position)
+        if token is None:
+            return line.strip(), None
+        text = token.group()
+        if text == "#":
+            return line[:token.start()].strip(), None
+        position = token.end()
+        if text[0] in "\"'":
+            quote = text
+
+
+def _turtle_chunks(lines, chunk_lines):
+    """Group Turtle lines into (directives, statements text) chunks."""
+    directives = []
+    statement = []
+    chunk = []
+    long_quote = None
+
+    for line in lines:
+        in_long_string = long_quote is not None
+        code, long_quote = _turtle_code(line, long_quote)
+        if not in_long_string:
+            if not statement and code.lower().startswith(_TURTLE_DIRECTIVES):
+                # Statements read so far must not see a redefined prefix
+                if chunk:
+                    yield "".join(directives), "".join(chunk)
+                    chunk = []
+                directives.append(line)
+                continue
+            # Blank and comment-only lines, inside a statement too
+            if not code:
+                continue
+
+        statement.append(line)
+        if long_quote is None and code.endswith("."):
+            chunk.extend(statement)
+            statement = []
+            if len(chunk) >= chunk_lines:
+                yield "".join(directives), "".join(chunk)
+                chunk = []
+
+    if statement:
+        raise ParserError("Unterminated Turtle statement at end of file")
+    if chunk:
+        yield "".join(directives), "".join(chunk)
+
+
+def _turtle_statements(lines, chunk_lines):
+    for header, body in _turtle_chunks(lines, chunk_lines):
+        collector = TripleCollector()
+        collector.parse(data=header + body, format="turtle")
+        for s, p, o in collector.added:
+            yield s, p, o, None
+
+
+def stream_statements(path, format=None, chunk_lines=TURTLE_CHUNK_LINES, stats=None):
+    """Yield (s, p, o, graph) statements from a file without loading it whole.
+
+    Args:
+        path: N-Triples, N-Quads or line-oriented Turtle file, optionally
+            gzip or zstd compressed
+        format: "nt", "nquads" or "turtle" (detected by default)
+        chunk_lines: Turtle lines parsed at once
+        stats: Optional IngestStats whose ``bytes_read`` is kept up to date
+            (in bytes of the file on disk, so compressed input is covered)
+
+    Yields:
+        Statements in file order; ``graph`` is None outside named graphs
+    """
+    path = Path(path)
+    format = format or detect_format(path)[0]
+    raw = open(path, "rb")
+    with decompressing_reader(raw, compression_of(path)) as stream:
+        def lines():
+            for line in stream:
+                if stats is not None:
+                    stats.bytes_read = raw.tell()
+                yield line.decode("utf-8")
+
+        if format in ("nt", "ntriples", "nquads"):
+            yield from _line_statements(lines())
+        elif format == "turtle":
+            yield from _turtle_statements(lines(), chunk_lines)
+        else:
+            raise ValueError(f"Streaming is not supported for format {format!r}")
+
+
+def ingest(path, sink, format=None, batch_size=DEFAULT_BATCH_SIZE, transform=None,
+           progress=None, chunk_lines=TURTLE_CHUNK_LINES):
+    """Stream a file into a sink in fixed-size batches.
+
+    Args:
+        path: File to ingest
+        sink: Callable receiving each batch as a list of (s, p, o, graph)
+            tuples; see ``graph_sink`` and ``ntriples_sink``
+        format: "nt", "nquads" or "turtle" (detected by default)
+        batch_size: Statements per batch
+        transform: Optional callable mapping a statement to a new statement
+            (projection) or None (drop it)
+        progress: Optional callable receiving the IngestStats after each batch
+        chunk_lines: Turtle lines parsed at once
+
+    Returns:
+        IngestStats for the whole file
+    """
+    path = Path(path)
+    stats = IngestStats(path, total_bytes=path.stat().st_size)
+    start = time.perf_counter()
+    batch = []
+
+    def flush():
+        sink(batch)
+        stats.emitted += len(batch)
+        stats.batches += 1
+        stats.seconds = time.perf_counter() - start
+        if progress is not None:
+            progress(stats)
+        batch.clear()
+
+    for statement in stream_statements(path, format, chunk_lines, stats):
+        stats.parsed += 1
+        if transform is not None:
+            statement = transform(statement)
+            if statement is None:
+                continue
+        batch.append(statement)
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+def graph_sink(graph):
+    """Sink adding batches to a graph; named graphs go to a Dataset's graphs."""
+
+    def add_batch(batch):
+        if isinstance(graph, Dataset):
+            graph.addN(
+                (s, p, o, graph.graph(g) if g is not None else graph.default_graph)
+                for s, p, o, g in batch
+            )
+        else:
+            graph.addN((s, p, o, graph) for s, p, o, _ in batch)
+
+    return add_batch
+
+
+def ntriples_sink(stream):
+    """Sink writing batches to a text stream as N-Triples (or N-Quads)."""
+
+    def write_batch(batch):
+        stream.writelines(
+            f"{s.n3()} {p.n3()} {o.n3()} {g.n3()} .\n" if g is not None
+            else f"{s.n3()} {p.n3()} {o.n3()} .\n"
+            for s, p, o, g in batch
+        )
+
+    return write_batch
+
+
+def keep_predicates(*namespaces, keep_types=True):
+    """Build a transform keeping statements whose predicate is in a namespace.
+
+    Args:
+        *namespaces: Namespace IRIs (str or Namespace), e.g. the wf: namespace
+        keep_types: Also keep rdf:type statements whose class is in one of
+            the namespaces, so the kept topology stays typed
+    """
+    prefixes = tuple(str(ns) for ns in namespaces)
+    rdf_type = "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"
+
+    def transform(statement):
+        predicate, object_ = str(statement[1]), str(statement[2])
+        if predicate.startswith(prefixes):
+            return statement
+        if keep_types and predicate == rdf_type and object_.startswith(prefixes):
+            return statement
+        return None
+
+    return transform
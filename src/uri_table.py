@@ -0,0 +1,130 @@
+"""Display names and anchors of URIs, computed once per URI.
+
+Rendering a page names and links the same URIs over and over: every
+superclass, domain, range, related entity and backlink of every section.
+``UriTable`` splits each URI once into its local name, a prefixed name
+("qname") and the ``{#anchor}`` of its section, and hands the stored result
+to every later lookup. The documentation generator keeps one table per
+graph, shared by all its renderers.
+
+Anchors are the whole URI with ``:``, ``#`` and ``/`` replaced by ``_`` and
+lowercased, so two URIs can share one: ``ns/Pump`` and ``ns#Pump``, or
+``ns#Pump`` and ``ns#pump``. Their sections would then get the same
+``{#anchor}`` and links would land on whichever comes first. Registering the
+documented entities with ``register`` records such collisions.
+
+Entity descriptions list related entities by local name. They use
+``LinkedName``, a string that keeps the URI it names, so links are built
+from the real URI rather than from the local name in some namespace.
+"""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class UriNames:
+    """The names a URI is shown and linked by."""
+
+    local_name: str
+    qname: str
+    anchor: str
+
+
+class LinkedName(str):
+    """Local name of a URI that remembers the URI (as ``uri``)."""
+
+    def __new__(cls, name, uri):
+        self = super().__new__(cls, name)
+        self.uri = str(uri)
+        return self
+
+    def __reduce__(self):
+        return LinkedName, (str(self), self.uri)
+
+
+def local_name(uri):
+    """The part of a URI after its last ``#``, or else its last ``/``."""
+    uri = str(uri)
+    if '#' in uri:
+        return uri.split('#')[-1]
+    elif '/' in uri:
+        return uri.split('/')[-1]
+    return uri
+
+
+def anchor_id(uri):
+    """Anchor of the section documenting a URI."""
+    return str(uri).replace(':', '_').replace('#', '_').replace('/', '_').lower()
+
+
+class UriTable:
+    """Local name, qname and anchor per URI, computed on first lookup."""
+
+    def __init__(self, namespaces=()):
+        """Create an empty table.
+
+        Args:
+            namespaces: (prefix, namespace URI) pairs used for qnames, e.g.
+                ``graph.namespaces()``
+        """
+        # Longest namespace first, so the most specific prefix wins
+        self.namespaces = sorted(
+            ((str(prefix), str(namespace)) for prefix, namespace in namespaces),
+            key=lambda pair: (-len(pair[1]), pair[0]),
+        )
+        self._names = {}
+        self._anchors = {}  # anchor → first registered URI
+        self.collisions = {}  # anchor → every registered URI sharing it
+
+    def __len__(self):
+        return len(self._names)
+
+    def __getitem__(self, uri):
+        # Keyed by plain strings: a URIRef key would be compared with
+        # rdflib's Python-level __eq__ whenever the lookup uses another
+        # URIRef object for the same URI
+        uri = str(uri)
+        names = self._names.get(uri)
+        if names is None:
+            names = self._names[uri] = self._compute(uri)
+        return names
+
+    def _compute(self, uri):
+        name = local_name(uri)
+        qname = name
+        for prefix, namespace in self.namespaces:
+            if uri.startswith(namespace) and len(uri) > len(namespace):
+                qname = f"{prefix}:{uri[len(namespace):]}"
+                break
+        return UriNames(name, qname, anchor_id(uri))
+
+    def local_name(self, uri):
+        """Local name of a URI (a URIRef or its string)."""
+        return self[uri].local_name
+
+    def qname(self, uri):
+        """Prefixed name of a URI, or its local name if no prefix matches."""
+        return self[uri].qname
+
+    def anchor(self, uri):
+        """Anchor of the section documenting a URI."""
+        return self[uri].anchor
+
+    def register(self, uris):
+        """Record the URIs that get a section, and any anchors they share.
+
+        Args:
+            uris: Documented entity URIs
+
+        Returns:
+            Dict of the anchors used by more than one of all URIs registered
+            so far, to the URIs (as strings) using them
+        """
+        for uri in uris:
+            anchor = self[uri].anchor
+            uri = str(uri)
+            first = self._anchors.setdefault(anchor, uri)
+            if first != uri:
+                sharing = self.collisions.setdefault(anchor, [first])
+                if uri not in sharing:
+                    sharing.append(uri)
+        return self.collisions
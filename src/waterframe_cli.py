@@ -0,0 +1,309 @@
+"""Command-line entry point for waterFRAME tooling.
+
+Installed as the ``waterframe`` console script. Only the standard library is
+imported at module level: rdflib, the documentation generator and everything
+they pull in are imported inside the subcommand that needs them, so trivial
+invocations (``--help``, argument errors) and cron jobs start quickly. The
+import-time budget is enforced by ``tests/test_cli_startup.py``.
+
+The tool runs from a source checkout of the repository (``pip install -e .``
+or ``uv run``): ``validate`` and ``docs`` import from ``scripts/``, and the
+default ontology, competency questions and docs directory are read from
+``data/`` and ``docs/``. None of these are packaged, so in a plain wheel
+install those subcommands exit with an error naming the missing directory.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+SPARQL_DIR = PROJECT_ROOT / "data" / "competency_questions" / "sparql"
+
+# Modules that must not be imported until a subcommand actually runs
+HEAVY_MODULES = ("rdflib", "pyshacl", "networkx", "matplotlib", "plotly", "marimo")
+
+
+def _checkout_path(path):
+    """Return a path of the source checkout, or exit if it is missing."""
+    if not path.exists():
+        sys.exit(
+            f"✗ {path} not found; this command must be run from a source "
+            "checkout of the waterFRAME repository"
+        )
+    return path
+
+
+def _import_script(name):
+    """Import a module from the repository's scripts/ directory."""
+    _checkout_path(SCRIPTS_DIR)
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    return __import__(name)
+
+
+def _load_graph(args):
+    from ontology_loader import load_ontology
+
+    return load_ontology(
+        args.ontology,
+        extra_files=args.extra,
+        use_cache=not args.no_cache,
+        verbose=args.verbose,
+    )
+
+
+def cmd_load(args):
+    """Load the ontology and report what was loaded."""
+    graph = _load_graph(args)
+    if not len(graph):
+        print("✗ Nothing loaded")
+        return 1
+    print(f"✓ Loaded {len(graph)} triples")
+    return 0
+
+
+def cmd_validate(args):
+    """Run the consistency and competency question validation script."""
+    return _import_script("validate_coverage").main()
+
+
+def cmd_cq(args):
+    """Run competency question SPARQL files against the loaded graph."""
+    query_files = (
+        [Path(q) for q in args.queries]
+        or sorted(_checkout_path(SPARQL_DIR).glob("*.rq"))
+    )
+    graph = _load_graph(args)
+
+    failures = 0
+    for query_file in query_files:
+        try:
+            results = graph.query(query_file.read_text(encoding="utf-8"))
+        except Exception as e:
+            failures += 1
+            print(f"✗ {query_file.stem}: {e}")
+            continue
+        print(f"✓ {query_file.stem}: {len(results)} results")
+        if args.show:
+            for row in results:
+                print("    " + " | ".join(str(value) for value in row))
+    return 1 if failures else 0
+
+
+def cmd_docs(args):
+    """Generate the index, entity reference, module diagrams and pages, and
+    search index."""
+    generate_docs = _import_script("generate_docs")
+    from build_profile import BuildProfile
+
+    profile = BuildProfile(enabled=bool(args.profile))
+    try:
+        generator = generate_docs.OntologyDocGenerator(
+            ontology_path=Path(args.ontology) if args.ontology else None,
+            force=args.force,
+            max_workers=args.jobs,
+            shard_size=(generate_docs.DEFAULT_SHARD_SIZE if args.shard_size is None
+                        else args.shard_size),
+            profile=profile,
+        )
+        module_files = generate_docs.generate_all(generator)
+    finally:
+        profile.close()
+    print(f"✓ Generated {len(module_files)} module pages")
+    if profile.enabled:
+        profile.write_json(args.profile)
+        print(profile.summary())
+        print(f"✓ Wrote build profile to {args.profile}")
+    return 0
+
+
+def cmd_check_links(args):
+    """Check the links between all pages of the documentation."""
+    from link_validator import config_nav_pages, validate_site
+
+    docs_dir = Path(args.docs) if args.docs else _checkout_path(PROJECT_ROOT / "docs")
+    # Pages in the nav are reachable without a link, as in the MkDocs hook
+    entry_pages = ["index.md", *args.entry]
+    if args.config:
+        config_file = _checkout_path(Path(args.config))
+    else:
+        config_file = docs_dir.parent / "mkdocs.yml"
+    if config_file.exists():
+        try:
+            entry_pages += config_nav_pages(config_file)
+        except ImportError:
+            print(f"Warning: PyYAML is not installed; the nav of {config_file} "
+                  "was not read, so pages only listed there count as orphans")
+    report = validate_site(docs_dir, entry_pages)
+    for problem in report.problems():
+        print(f"✗ {problem}")
+    if not report.ok:
+        return 1
+    print(f"✓ {report.links} links across {report.pages} pages are valid")
+    return 0
+
+
+def cmd_export(args):
+    """Serialize the merged graph to a single file."""
+    graph = _load_graph(args)
+    graph.serialize(destination=args.output, format=args.format)
+    print(f"✓ Wrote {len(graph)} triples to {args.output}")
+    return 0
+
+
+def cmd_ingest(args):
+    """Stream a large instance file to N-Triples, optionally filtered."""
+    from streaming_ingest import ingest, keep_predicates, ntriples_sink
+
+    transform = keep_predicates(*args.keep) if args.keep else None
+
+    def report(stats):
+        if args.verbose:
+            print(
+                f"  {stats.fraction_done:6.1%}  {stats.parsed} triples read, "
+                f"{stats.emitted} kept ({stats.triples_per_second:,.0f} triples/s)"
+            )
+
+    options = dict(batch_size=args.batch_size, transform=transform, progress=report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            stats = ingest(args.input, ntriples_sink(out), **options)
+    else:
+        stats = ingest(args.input, lambda batch: None, **options)
+    print(
+        f"✓ Read {stats.parsed} triples, kept {stats.emitted} "
+        f"in {stats.seconds:.2f} s ({stats.triples_per_second:,.0f} triples/s)"
+    )
+    return 0
+
+
+def build_parser():
+    """Build the argument parser for all subcommands."""
+    parser = argparse.ArgumentParser(
+        prog="waterframe", description="waterFRAME ontology tooling"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    loading = argparse.ArgumentParser(add_help=False)
+    loading.add_argument(
+        "--ontology", "-o", default=None,
+        help="Main ontology file (default: data/ontology/waterframe.ttl)",
+    )
+    loading.add_argument(
+        "--extra", "-e", action="append", default=[],
+        help="Additional file to load alongside the ontology, e.g. instances",
+    )
+    loading.add_argument(
+        "--no-cache", action="store_true", help="Bypass the snapshot cache"
+    )
+    loading.add_argument(
+        "--verbose", "-v", action="store_true", help="List every loaded file"
+    )
+
+    load = subparsers.add_parser(
+        "load", parents=[loading], help="Load the ontology and report its size"
+    )
+    load.set_defaults(func=cmd_load)
+
+    validate = subparsers.add_parser(
+        "validate", help="Run consistency checks and competency questions"
+    )
+    validate.set_defaults(func=cmd_validate)
+
+    cq = subparsers.add_parser(
+        "cq", parents=[loading], help="Run competency question queries"
+    )
+    cq.add_argument(
+        "queries", nargs="*",
+        help="SPARQL files to run (default: all of data/competency_questions/sparql)",
+    )
+    cq.add_argument("--show", action="store_true", help="Print result rows")
+    cq.set_defaults(func=cmd_cq)
+
+    docs = subparsers.add_parser("docs", help="Generate the documentation pages")
+    docs.add_argument("--ontology", "-o", default=None, help="Main ontology file")
+    docs.add_argument(
+        "--force", action="store_true",
+        help="Regenerate every page, even those unchanged since the last build",
+    )
+    docs.add_argument(
+        "--jobs", "-j", type=int, default=None,
+        help="Processes rendering module pages (default: CPU count)",
+    )
+    docs.add_argument(
+        "--shard-size", type=int, default=None,
+        help="Split module pages with more entities than this into numbered "
+             "pages (default: 500; 0 never splits)",
+    )
+    docs.add_argument(
+        "--profile", nargs="?", const="build-profile.json", default=None,
+        metavar="FILE",
+        help="Record time and peak memory of each build phase per module and "
+             "write them to FILE (default: build-profile.json); renders in one process",
+    )
+    docs.set_defaults(func=cmd_docs)
+
+    check_links = subparsers.add_parser(
+        "check-links", help="Check the links between documentation pages"
+    )
+    check_links.add_argument(
+        "--docs", default=None,
+        help="MkDocs docs directory (default: docs/ of the source checkout)",
+    )
+    check_links.add_argument(
+        "--config", default=None,
+        help="MkDocs configuration whose nav pages are not orphans "
+             "(default: mkdocs.yml next to the docs directory)",
+    )
+    check_links.add_argument(
+        "--entry", action="append", default=[], metavar="PAGE",
+        help="Extra page that is not an orphan (repeatable; index.md and the "
+             "pages in the nav always are)",
+    )
+    check_links.set_defaults(func=cmd_check_links)
+
+    export = subparsers.add_parser(
+        "export", parents=[loading], help="Write the merged graph to one file"
+    )
+    export.add_argument("output", help="Destination file")
+    export.add_argument(
+        "--format", "-f", default="turtle",
+        help="rdflib serialization format (turtle, nt, xml, json-ld, ...)",
+    )
+    export.set_defaults(func=cmd_export)
+
+    ingest = subparsers.add_parser(
+        "ingest", help="Stream a large N-Triples/N-Quads/Turtle file in batches"
+    )
+    ingest.add_argument("input", help="File to read")
+    ingest.add_argument(
+        "--output", help="Write the kept triples here as N-Triples/N-Quads"
+    )
+    ingest.add_argument(
+        "--keep", action="append", default=[], metavar="NAMESPACE",
+        help="Only keep statements whose predicate (or rdf:type class) is "
+             "in this namespace IRI; repeatable",
+    )
+    ingest.add_argument("--batch-size", type=int, default=10_000)
+    ingest.add_argument(
+        "--verbose", "-v", action="store_true", help="Report progress per batch"
+    )
+    ingest.set_defaults(func=cmd_ingest)
+
+    return parser
+
+
+def main(argv=None):
+    """Run the ``waterframe`` command."""
+    # Make src/ modules importable when run from a source checkout
+    src_dir = str(Path(__file__).resolve().parent)
+    if src_dir not in sys.path:
+        sys.path.insert(0, src_dir)
+
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""Shared pytest fixtures.
+
+Ontology graphs are loaded once per test session through the memoized
+loader and handed out as read-only views, so no test can change the graph
+another test sees. Tests that edit the ontology get a private copy of it,
+and a private snapshot cache, so they never write into the repository.
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ontology_loader import load_shared_ontology
+
+ONTOLOGY_DIR = Path(__file__).parent.parent / "data" / "ontology"
+
+
+@pytest.fixture(scope="session")
+def ontology_graph():
+    """Main ontology with its owl:imports closure, plus instances"""
+    return load_shared_ontology(
+        ONTOLOGY_DIR / "waterframe.ttl",
+        extra_files=[ONTOLOGY_DIR / "instances" / "household_case1.ttl"],
+    )
+
+
+@pytest.fixture(scope="session")
+def port_based_graph():
+    """Properties module (which imports material entities) and port-based instances"""
+    return load_shared_ontology(
+        ONTOLOGY_DIR / "modules" / "core" / "properties.ttl",
+        extra_files=[ONTOLOGY_DIR / "instances" / "household_case1_port_based.ttl"],
+    )
+
+
+
+@pytest.fixture
+def ontology(tmp_path):
+    """A private copy of the ontology and its modules."""
+    root = tmp_path / "ontology"
+    root.mkdir()
+    shutil.copy(ONTOLOGY_DIR / "waterframe.ttl", root)
+    shutil.copy(ONTOLOGY_DIR / "catalog-v001.xml", root)
+    shutil.copytree(ONTOLOGY_DIR / "modules", root / "modules")
+    return root / "waterframe.ttl"
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path):
+    """A private snapshot cache directory for loading the ontology copy."""
+    return tmp_path / "snapshots"
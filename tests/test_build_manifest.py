@@ -0,0 +1,121 @@
+"""Tests for incremental documentation builds driven by the build manifest."""
+
+import shutil
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import generate_docs
+from generate_docs import OntologyDocGenerator
+
+
+class TestBuildManifest:
+    """Test suite for skipping pages whose inputs did not change."""
+
+    def build(self, ontology, snapshot_dir, capsys, force=False):
+        """Run a docs build and return the pages it reported writing."""
+        generator = OntologyDocGenerator(
+            ontology_path=ontology,
+            output_dir=ontology.parent.parent / "docs" / "entities",
+            force=force,
+            cache_dir=snapshot_dir,
+        )
+        docs = generator.output_dir.parent
+        capsys.readouterr()
+        generator.generate_index()
+        pages = generator.generate_modular_docs()
+        written = set()
+        for line in capsys.readouterr().out.splitlines():
+            if line.startswith(("Generated index at ", "Generated module page: ")):
+                page = Path(line.split(" ", 3)[-1])
+                written.add(page.relative_to(docs).as_posix())
+        return pages, written
+
+    def test_unchanged_build_writes_nothing(self, ontology, snapshot_dir, capsys):
+        """Test that a second build leaves every page untouched."""
+        pages, written = self.build(ontology, snapshot_dir, capsys)
+        assert written == {
+            "index.md",
+            "modules/core/material_entities.md",
+            "modules/core/properties.md",
+        }
+
+        second_pages, written = self.build(ontology, snapshot_dir, capsys)
+        assert written == set()
+        assert second_pages == pages
+
+    def test_entity_edited_elsewhere_rebuilds_its_page(self, ontology, snapshot_dir,
+                                                       capsys):
+        """Test that a page is rebuilt when one of its entities changes in
+        another file."""
+        self.build(ontology, snapshot_dir, capsys)
+        material = ontology.parent / "modules" / "core" / "material_entities.ttl"
+        with open(material, "a", encoding="utf-8") as f:
+            f.write('\nwf:WaterFlow rdfs:comment "Edited from another module" .\n')
+
+        _, written = self.build(ontology, snapshot_dir, capsys)
+
+        assert written == {
+            "modules/core/material_entities.md", "modules/core/properties.md"
+        }
+        docs = ontology.parent.parent / "docs"
+        properties_page = docs / "modules" / "core" / "properties.md"
+        content = properties_page.read_text(encoding="utf-8")
+        assert "Edited from another module" in content
+
+    def test_edited_template_rebuilds_pages(self, ontology, snapshot_dir, capsys,
+                                            tmp_path, monkeypatch):
+        """Test that every module page is rebuilt when a module it renders
+        through, such as the templates, changes."""
+        templates = generate_docs.SRC_DIR / "doc_templates.py"
+        assert templates in generate_docs.RENDER_SOURCES
+        # Stand in for the real templates, which must stay untouched
+        copy = tmp_path / "doc_templates.py"
+        shutil.copy(templates, copy)
+        monkeypatch.setattr(generate_docs, "RENDER_SOURCES", tuple(
+            copy if source == templates else source
+            for source in generate_docs.RENDER_SOURCES
+        ))
+        self.build(ontology, snapshot_dir, capsys)
+
+        with open(copy, "a", encoding="utf-8") as f:
+            f.write('\nSECTION_SEPARATOR = "\\n***\\n\\n"\n')
+        _, written = self.build(ontology, snapshot_dir, capsys)
+
+        assert written == {
+            "modules/core/material_entities.md", "modules/core/properties.md"
+        }
+
+    def test_moved_referrers_rebuild_backlinks(self, ontology, snapshot_dir, capsys):
+        """Test that a page is rebuilt when the entities it links to move to
+        another page, although none of its own entities changed."""
+        self.build(ontology, snapshot_dir, capsys)
+        modules = ontology.parent / "modules" / "core"
+        (modules / "properties.ttl").rename(modules / "relations.ttl")
+        catalog = ontology.parent / "catalog-v001.xml"
+        catalog.write_text(
+            catalog.read_text(encoding="utf-8").replace(
+                'uri="modules/core/properties.ttl"', 'uri="modules/core/relations.ttl"'
+            ),
+            encoding="utf-8",
+        )
+
+        _, written = self.build(ontology, snapshot_dir, capsys)
+
+        assert written == {
+            "modules/core/material_entities.md", "modules/core/relations.md"
+        }
+        docs = ontology.parent.parent / "docs"
+        material_page = docs / "modules" / "core" / "material_entities.md"
+        content = material_page.read_text(encoding="utf-8")
+        assert "](relations.md#" in content
+        assert "](properties.md#" not in content
+
+    def test_force_rebuilds_everything(self, ontology, snapshot_dir, capsys):
+        """Test that force rewrites pages whose inputs are unchanged."""
+        self.build(ontology, snapshot_dir, capsys)
+
+        _, written = self.build(ontology, snapshot_dir, capsys, force=True)
+
+        assert "modules/core/properties.md" in written
+        assert "index.md" in written
@@ -0,0 +1,91 @@
+"""Tests for the per-phase build profile."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from generate_docs import OntologyDocGenerator
+
+from build_profile import PHASES, BuildProfile
+
+
+class TestBuildProfile:
+    """Test suite for BuildProfile."""
+
+    @pytest.fixture
+    def profile(self):
+        """An enabled profile, closed after the test."""
+        profile = BuildProfile()
+        yield profile
+        profile.close()
+
+    def test_phases_are_recorded_per_module(self, profile):
+        """Test that repeated phases of a module are summed, not replaced."""
+        for _ in range(3):
+            with profile.phase("rendering", "a"):
+                pass
+        with profile.phase("rendering", "b"):
+            pass
+
+        assert profile.records[("rendering", "a")]["calls"] == 3
+        assert profile.records[("rendering", "b")]["calls"] == 1
+        total, = profile.phase_totals()
+        assert total["modules"] == 2
+        assert total["calls"] == 4
+
+    def test_peak_memory_of_nested_phases(self, profile):
+        """Test that an enclosing phase's peak includes its nested phases."""
+        with profile.phase("rendering", "outer"):
+            with profile.phase("writing", "inner"):
+                data = bytearray(2_000_000)
+                del data
+
+        inner = profile.records[("writing", "inner")]["peak_bytes"]
+        outer = profile.records[("rendering", "outer")]["peak_bytes"]
+        assert inner >= 2_000_000
+        assert outer >= inner
+
+    def test_disabled_profile_records_nothing(self):
+        """Test that a disabled profile only runs the wrapped code."""
+        profile = BuildProfile(enabled=False)
+        with profile.phase("load"):
+            pass
+        assert profile.records == {}
+
+    def test_json_and_summary(self, profile, tmp_path):
+        """Test that the JSON report and summary list every phase."""
+        with profile.phase("load"):
+            pass
+        with profile.phase("writing", "module"):
+            pass
+
+        path = tmp_path / "profile.json"
+        profile.write_json(path)
+        data = json.loads(path.read_text())
+        assert [t["phase"] for t in data["phases"]] == ["load", "writing"]
+        assert {r["module"] for r in data["records"]} == {None, "module"}
+        summary = profile.summary()
+        assert "load" in summary and "writing" in summary
+
+    def test_generator_records_every_phase(self, ontology, snapshot_dir, tmp_path):
+        """Test that a profiled build records all phases, per module page."""
+        profile = BuildProfile()
+        try:
+            generator = OntologyDocGenerator(
+                ontology_path=ontology,
+                output_dir=tmp_path / "docs" / "entities",
+                profile=profile,
+                cache_dir=snapshot_dir,
+            )
+            module_files = generator.generate_modular_docs()
+        finally:
+            profile.close()
+
+        assert generator.max_workers == 1
+        assert {record["phase"] for record in profile.records.values()} == set(PHASES)
+        rendered = {module for phase, module in profile.records if phase == "rendering"}
+        assert len(rendered) == len(module_files)
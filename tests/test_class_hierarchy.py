@@ -0,0 +1,108 @@
+"""Tests for the precomputed class hierarchy closure."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from rdflib import BNode, Graph, Namespace
+from rdflib.namespace import OWL, RDF, RDFS
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from generate_docs import OntologyDocGenerator
+
+from class_hierarchy import ClassHierarchy
+
+EX = Namespace("http://test.example.org/onto#")
+
+
+class TestClassHierarchy:
+    """Test suite for ClassHierarchy."""
+
+    @pytest.fixture
+    def hierarchy(self):
+        """A diamond under A, a cycle X ⊑ Y ⊑ X with Z under it, and Q alone."""
+        return ClassHierarchy(
+            [("B", "A"), ("C", "B"), ("D", "B"), ("D", "A"), ("E", "C"), ("E", "D"),
+             ("X", "Y"), ("Y", "X"), ("Z", "X")],
+            classes=["Q"],
+        )
+
+    def test_topological_order(self, hierarchy):
+        """Test that every class comes after all of its superclasses."""
+        position = {name: i for i, name in enumerate(hierarchy.classes)}
+        for sub, sup in [("B", "A"), ("C", "B"), ("D", "B"), ("E", "C"), ("E", "D")]:
+            assert position[sup] < position[sub]
+        assert hierarchy.roots() == ["A", "Q"]
+
+    def test_transitive_closure(self, hierarchy):
+        """Test ancestors, descendants, subtree sizes and subclass tests."""
+        assert hierarchy.ancestors("E") == ["A", "B", "C", "D"]
+        assert hierarchy.descendants("B") == ["C", "D", "E"]
+        assert hierarchy.subtree_size("A") == 4
+        assert hierarchy.subtree_size("E") == 0
+        assert hierarchy.is_subclass("E", "A")
+        assert hierarchy.is_subclass("A", "A")
+        assert not hierarchy.is_subclass("A", "E")
+        assert not hierarchy.is_subclass("E", "Q")
+        assert not hierarchy.is_subclass("E", "Unknown")
+
+    def test_depth_and_ancestry(self, hierarchy):
+        """Test that ancestry follows the longest chain up to a root."""
+        assert hierarchy.depth("A") == 0
+        assert hierarchy.depth("E") == 3
+        assert hierarchy.ancestry("E") == ["A", "B", "C"]
+        assert hierarchy.ancestry("A") == []
+
+    def test_cycles_are_collapsed(self, hierarchy):
+        """Test that classes in a subclass cycle are ancestors of each other."""
+        assert hierarchy.is_subclass("X", "Y") and hierarchy.is_subclass("Y", "X")
+        ancestors = hierarchy.ancestors("Z")
+        assert ancestors == sorted(ancestors) == ["X", "Y"]
+        assert hierarchy.subtree_size("Y") == 2
+        assert hierarchy.ancestry("Z") == ["X"]
+
+    def test_from_graph_ignores_blank_nodes(self):
+        """Test that restrictions do not become classes."""
+        graph = Graph()
+        graph.add((EX.Sub, RDFS.subClassOf, EX.Super))
+        graph.add((EX.Sub, RDFS.subClassOf, BNode()))
+        graph.add((EX.Alone, RDF.type, OWL.Class))
+
+        hierarchy = ClassHierarchy.from_graph(graph)
+        expected = sorted(map(str, [EX.Alone, EX.Sub, EX.Super]))
+        assert sorted(hierarchy.classes) == expected
+        assert hierarchy.is_subclass(EX.Sub, EX.Super)
+
+
+class TestHierarchySection:
+    """Test suite for the Hierarchy section of class documentation."""
+
+    @pytest.fixture
+    def generator(self, tmp_path):
+        """Create a generator with the waterFRAME ontology."""
+        ontology = Path(__file__).parent.parent / "data" / "ontology" / "waterframe.ttl"
+        return OntologyDocGenerator(
+            ontology_path=ontology, output_dir=tmp_path / "entities"
+        )
+
+    def test_section_shows_ancestry(self, generator):
+        """Test that a class lists its ancestry from the hierarchy root."""
+        toilet = f"{generator.ontology_namespace}Toilet"
+        info = generator._get_entity_info(toilet)
+        assert [generator.uris.local_name(uri) for uri in info['ancestry']] == [
+            "BFO_0000040", "WaterSystemComponent", "WaterUsagePoint",
+        ]
+
+        content = generator._generate_entity_section(info)
+        assert "### Hierarchy" in content
+        assert "- **Ancestry:** BFO_0000040 › [WaterSystemComponent](#" in content
+
+    def test_section_counts_descendants(self, generator):
+        """Test that the size of a subtree deeper than one level is shown."""
+        component = f"{generator.ontology_namespace}WaterSystemComponent"
+        info = generator._get_entity_info(component)
+        assert info['descendant_count'] > len(info['subclasses'])
+
+        content = generator._generate_entity_section(info)
+        assert f"- **Descendant classes:** {info['descendant_count']}" in content
@@ -0,0 +1,160 @@
+"""Startup benchmark and smoke tests for the waterframe command-line tool."""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import generate_docs
+
+from waterframe_cli import PROJECT_ROOT, main
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+FIXTURE = Path(__file__).parent / "fixtures" / "minimal_ontology.ttl"
+
+# Cumulative import time of waterframe_cli itself, excluding interpreter
+# startup; generous enough for slow CI machines, far below rdflib's ~300 ms
+IMPORT_BUDGET_US = 100_000
+
+
+def run_python(code, *flags):
+    """Run a snippet in a fresh interpreter with src/ on the path."""
+    setup = f"import sys; sys.path.insert(0, {str(SRC_DIR)!r}); "
+    return subprocess.run(
+        [sys.executable, *flags, "-c", setup + code],
+        capture_output=True, text=True, check=True,
+    )
+
+
+def cli_import_time_us():
+    """Measure the cumulative import time of waterframe_cli in microseconds."""
+    result = run_python("import waterframe_cli", "-X", "importtime")
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == "waterframe_cli":
+            return int(fields[1])
+    raise AssertionError("waterframe_cli missing from -X importtime output")
+
+
+class TestStartup:
+    """Test suite for the import-time budget."""
+
+    def test_import_defers_heavy_modules(self):
+        """Test that importing the CLI pulls in none of the heavy libraries."""
+        result = run_python(
+            "import waterframe_cli; "
+            "print(','.join("
+            "m for m in waterframe_cli.HEAVY_MODULES if m in sys.modules))"
+        )
+        assert result.stdout.strip() == ""
+
+    def test_help_defers_heavy_modules(self):
+        """Test that building the parser and printing help stays lightweight."""
+        result = run_python(
+            "import waterframe_cli\n"
+            "try:\n"
+            "    waterframe_cli.main(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('loaded:' + ','.join("
+            "m for m in waterframe_cli.HEAVY_MODULES if m in sys.modules))"
+        )
+        assert "load" in result.stdout
+        assert result.stdout.strip().endswith("loaded:")
+
+    def test_import_time_within_budget(self):
+        """Test that the best of several cold imports stays within budget."""
+        best = min(cli_import_time_us() for _ in range(3))
+        assert best < IMPORT_BUDGET_US, (
+            f"importing waterframe_cli took {best / 1000:.1f} ms "
+            f"(budget {IMPORT_BUDGET_US / 1000:.0f} ms)"
+        )
+
+
+class TestCommands:
+    """Test suite for the subcommands."""
+
+    def test_load_reports_triples(self, capsys):
+        """Test that load parses the ontology and reports its size."""
+        assert main(["load", "--ontology", str(FIXTURE), "--no-cache"]) == 0
+        assert "✓ Loaded" in capsys.readouterr().out
+
+    def test_cq_runs_given_queries(self, tmp_path, capsys):
+        """Test that cq runs each query file and reports its result count."""
+        query = tmp_path / "classes.rq"
+        query.write_text("SELECT ?c WHERE { ?c a owl:Class }", encoding="utf-8")
+
+        assert main(["cq", str(query), "--ontology", str(FIXTURE), "--no-cache"]) == 0
+        assert "✓ classes: 2 results" in capsys.readouterr().out
+
+    def test_cq_reports_failing_query(self, tmp_path, capsys):
+        """Test that a malformed query makes cq exit non-zero."""
+        query = tmp_path / "broken.rq"
+        query.write_text("SELECT WHERE {", encoding="utf-8")
+
+        assert main(["cq", str(query), "--ontology", str(FIXTURE), "--no-cache"]) == 1
+        assert "✗ broken" in capsys.readouterr().out
+
+    def test_export_writes_graph(self, tmp_path):
+        """Test that export serializes the loaded graph."""
+        output = tmp_path / "out.ttl"
+        assert main([
+            "export", str(output), "--ontology", str(FIXTURE), "--no-cache"
+        ]) == 0
+        assert "TestClass" in output.read_text(encoding="utf-8")
+
+    def test_ingest_streams_to_ntriples(self, tmp_path, capsys):
+        """Test that ingest writes the kept statements as N-Triples."""
+        output = tmp_path / "out.nt"
+        assert main([
+            "ingest", str(FIXTURE), "--output", str(output),
+            "--keep", "http://test.example.org/onto#",
+        ]) == 0
+        assert "testProperty" in output.read_text(encoding="utf-8")
+        assert "Read 23 triples, kept 3 in" in capsys.readouterr().out
+
+    def test_check_links_reads_the_nav(self, ontology, snapshot_dir, tmp_path,
+                                       capsys):
+        """Test that check-links treats the pages in the nav of mkdocs.yml
+        next to the docs as linked, as the MkDocs hook does."""
+        pytest.importorskip("yaml")
+        shutil.copy(PROJECT_ROOT / "mkdocs.yml", tmp_path)
+        docs = tmp_path / "docs"
+        shutil.copytree(
+            PROJECT_ROOT / "docs", docs,
+            ignore=shutil.ignore_patterns("entities", "modules", "index.md"),
+        )
+        generator = generate_docs.OntologyDocGenerator(
+            ontology_path=ontology,
+            output_dir=docs / "entities",
+            max_workers=1,
+            cache_dir=snapshot_dir,
+        )
+        generate_docs.generate_all(generator)
+        capsys.readouterr()
+
+        assert main(["check-links", "--docs", str(docs)]) == 0
+        assert "are valid" in capsys.readouterr().out
+        # Without the nav, the module pages nothing links to are orphans
+        (tmp_path / "mkdocs.yml").unlink()
+        assert main([
+            "check-links", "--docs", str(docs), "--entry", "entities/entities.md"
+        ]) == 1
+        assert "modules/core/properties.md" in capsys.readouterr().out
+
+    def test_checkout_only_command_outside_checkout(self, tmp_path, monkeypatch):
+        """Test that commands needing scripts/ exit with an error without it."""
+        monkeypatch.setattr("waterframe_cli.SCRIPTS_DIR", tmp_path / "scripts")
+        with pytest.raises(SystemExit) as excinfo:
+            main(["validate"])
+        assert "must be run from a source checkout" in str(excinfo.value.code)
+
+    def test_missing_subcommand_is_an_error(self):
+        """Test that running without a subcommand exits with a usage error."""
+        with pytest.raises(SystemExit) as excinfo:
+            main([])
+        assert excinfo.value.code == 2
@@ -0,0 +1,83 @@
+"""Tests for the precompiled documentation templates."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from benchmark_rendering import (
+    collect_entities,
+    legacy_entity_section,
+    legacy_module_page,
+)
+from generate_docs import OntologyDocGenerator
+
+from doc_templates import ListSection, compile_template
+
+FIXTURES = Path(__file__).parent / "fixtures"
+ONTOLOGIES = [
+    FIXTURES / "minimal_ontology.ttl",
+    FIXTURES / "namespace_edge_cases.ttl",
+    Path(__file__).parent.parent / "data" / "ontology" / "waterframe.ttl",
+]
+
+
+class TestDocTemplates:
+    """Test suite for template rendering of entity sections and module pages."""
+
+    @pytest.fixture(params=ONTOLOGIES, ids=lambda path: path.stem)
+    def generator(self, request, tmp_path):
+        """A generator for each fixture ontology."""
+        return OntologyDocGenerator(
+            ontology_path=request.param, output_dir=tmp_path / "entities"
+        )
+
+    def test_compiled_template_keeps_literal_braces(self):
+        """Test that escaped braces survive compilation like in str.format."""
+        heading = compile_template("## {name} {{#{anchor}}}\n", "name", "anchor")
+
+        assert heading("Pump", "pump") == "## Pump {#pump}\n"
+
+    def test_compiled_template_runs_no_code(self):
+        """Test that quotes, backslashes and braces in a template are kept as
+        text, and that unknown placeholders are rejected."""
+        line = compile_template("'{a}' \\ \"{b!r:>6}\" {{'{a}'}}\n", "a", "b")
+
+        assert line("x", "y") == "'x' \\ \"   'y'\" {'x'}\n"
+        with pytest.raises(ValueError):
+            compile_template("{__import__('os')}", "a")
+
+    def test_empty_section_is_left_out(self):
+        """Test that a list section without items writes nothing."""
+        section = ListSection("Labels")
+        out = []
+
+        section.write(out, [], str)
+        section.write(out, None, str)
+        assert out == []
+
+        section.write(out, ["a", "b"], "- {}\n".format)
+        assert "".join(out) == "### Labels\n\n- a\n- b\n\n"
+
+    def test_entity_sections_match_concatenation(self, generator):
+        """Test that every entity section is byte-identical to the old renderer."""
+        entities = [
+            info for group in collect_entities(generator).values() for info in group
+        ]
+        assert entities
+
+        for entity_info in entities:
+            assert generator._generate_entity_section(entity_info) == \
+                legacy_entity_section(generator, entity_info), entity_info['uri']
+
+    def test_module_page_matches_concatenation(self, generator):
+        """Test that a module page is byte-identical to the old renderer."""
+        entities_by_type = collect_entities(generator)
+        module_path = generator.ontology_path
+
+        page = generator._generate_module_page("fixture", module_path, entities_by_type)
+        assert page == legacy_module_page(
+            generator, "fixture", module_path, entities_by_type
+        )
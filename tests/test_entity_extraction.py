@@ -131,6 +131,22 @@ class TestEntityExtraction:
         assert 'ranges' in entity_info
         assert 'SubClass' in entity_info['ranges']
 
+    def test_class_has_backlinks(self, generator):
+        """Test that a class lists the entities referencing it, by predicate."""
+        test_class_uri = "http://test.example.org/onto#TestClass"
+        entity_info = generator._get_entity_info(test_class_uri)
+
+        assert entity_info['referenced_by'] == [
+            ('domain', ["http://test.example.org/onto#testProperty"]),
+            ('subClassOf', ["http://test.example.org/onto#SubClass"]),
+            ('type', ["http://test.example.org/onto#testIndividual"]),
+        ]
+
+        section = generator._generate_entity_section(entity_info)
+        anchor = generator._get_anchor_id("http://test.example.org/onto#testProperty")
+        assert "### Referenced By" in section
+        assert f"- **domain**: [testProperty](#{anchor})" in section
+
     def test_individual_has_type(self, generator):
         """Test that individual information includes its class."""
         individual_uri = "http://test.example.org/onto#testIndividual"
@@ -193,3 +209,19 @@ class TestEntityExtraction:
         assert f"Classes:** {classes}" in content
         assert f"Object Properties:** {obj_props}" in content
         assert f"Total Entities:** {total_expected}" in content
+
+    def test_all_docs_sections_are_sorted(self, generator, tmp_path):
+        """Test that the entity reference lists its sections sorted by name."""
+        import re
+
+        generator.output_dir = tmp_path / "entities"
+        output_file = generator.generate_all_docs()
+
+        with open(output_file, 'r') as f:
+            content = f.read()
+
+        toc, body = content.split("\n---\n", 1)
+        headings = re.findall(r'^## (\w+) \{#', body, re.MULTILINE)
+        assert headings == sorted(headings, key=str.lower)
+        assert "## Table of Contents" in toc
+        assert re.findall(r'^- \[(\w+)\]', toc, re.MULTILINE) == headings
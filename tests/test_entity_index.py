@@ -0,0 +1,77 @@
+"""Tests for the single-pass entity adjacency index."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from rdflib import Graph, Namespace
+from rdflib.namespace import OWL, RDF, RDFS
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from generate_docs import OntologyDocGenerator
+
+from entity_index import EntityIndex
+
+FIXTURE = Path(__file__).parent / "fixtures" / "minimal_ontology.ttl"
+EX = Namespace("http://test.example.org/onto#")
+
+
+class TestEntityIndex:
+    """Test suite for EntityIndex lookups."""
+
+    @pytest.fixture
+    def graph(self):
+        """The minimal ontology plus a class with several superclasses."""
+        graph = Graph()
+        graph.parse(FIXTURE, format="turtle")
+        for parent in (EX.Zeta, EX.Alpha, EX.Mid):
+            graph.add((EX.Multi, RDFS.subClassOf, parent))
+        for child in (EX.Zeta, EX.Alpha, EX.Mid):
+            graph.add((child, RDFS.subClassOf, EX.TestClass))
+        return graph
+
+    def test_lookups_match_graph(self, graph):
+        """Test that every (s, p) and (p, o) lookup matches the graph, in order."""
+        index = EntityIndex(graph)
+
+        assert len(index) == len(graph)
+        for s, p, o in graph:
+            assert list(index.objects(s, p)) == list(graph.objects(s, p))
+            assert list(index.subjects(p, o)) == list(graph.subjects(p, o))
+            assert index.has(s, p, o)
+            assert index.has(s, p)
+
+    def test_backlinks_match_graph(self, graph):
+        """Test that in-edges group every referencing subject by predicate."""
+        index = EntityIndex(graph)
+
+        for obj in set(graph.objects()):
+            expected = {}
+            for s, p in graph.subject_predicates(obj):
+                expected.setdefault(p, set()).add(s)
+            assert {p: set(subjects) for p, subjects in index.predicate_subjects(obj)} \
+                == expected
+
+    def test_missing_entities_are_empty(self, graph):
+        """Test that unknown subjects and objects yield no results."""
+        index = EntityIndex(graph)
+
+        assert list(index.objects(EX.Missing, RDF.type)) == []
+        assert list(index.subjects(RDFS.subClassOf, EX.Missing)) == []
+        assert not index.has(EX.TestClass, RDFS.subClassOf)
+        assert not index.has(EX.testIndividual, RDF.type, OWL.Class)
+
+    def test_generator_builds_index_once(self, tmp_path):
+        """Test that the generator answers entity lookups from one index."""
+        generator = OntologyDocGenerator(
+            ontology_path=FIXTURE, output_dir=tmp_path / "entities"
+        )
+        index = generator.index
+
+        info = generator._get_entity_info(str(EX.testIndividual))
+
+        assert generator.index is index
+        assert info['instance_of'] == ['TestClass']
+        assert {'property': 'testProperty', 'value': 'anotherIndividual',
+                'is_uri': True} in info['property_values']
@@ -0,0 +1,94 @@
+"""Tests for the read-only, array-backed frozen triple store."""
+
+import itertools
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+from rdflib import Graph, Literal, Namespace
+from rdflib.namespace import OWL, RDF, RDFS
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from frozen_store import FrozenStore, FrozenStoreError, freeze
+from ontology_loader import clear_shared_ontologies, load_shared_ontology
+
+FIXTURE = Path(__file__).parent / "fixtures" / "minimal_ontology.ttl"
+EX = Namespace("http://test.example.org/onto#")
+
+
+class TestFrozenStore:
+    """Test suite for pattern lookups and immutability of frozen graphs."""
+
+    @pytest.fixture
+    def graph(self):
+        """Parse the minimal ontology into a regular Memory-backed graph."""
+        graph = Graph()
+        graph.parse(FIXTURE, format="turtle")
+        return graph
+
+    def test_every_pattern_matches_memory_store(self, graph):
+        """Test that all eight bound/unbound patterns give the same triples."""
+        frozen = freeze(graph)
+        terms = {t for triple in graph for t in triple} | {EX.Missing}
+
+        assert len(frozen) == len(graph)
+        for triple in graph:
+            for mask in itertools.product((True, False), repeat=3):
+                pattern = tuple(t if keep else None for t, keep in zip(triple, mask))
+                assert set(frozen.triples(pattern)) == set(graph.triples(pattern))
+        for term in terms:
+            assert set(frozen.triples((term, None, None))) == set(
+                graph.triples((term, None, None))
+            )
+
+    def test_two_term_lookups_keep_graph_order(self):
+        """Test that objects(s, p) and subjects(p, o) follow insertion order."""
+        graph = Graph()
+        comments = [Literal(f"comment {i}") for i in range(20)]
+        for comment in comments:
+            graph.add((EX.Thing, RDFS.comment, comment))
+        subclasses = [EX[f"Sub{i}"] for i in reversed(range(20))]
+        for subclass in subclasses:
+            graph.add((subclass, RDFS.subClassOf, EX.Thing))
+
+        frozen = freeze(graph)
+
+        assert list(frozen.objects(EX.Thing, RDFS.comment)) == comments
+        assert list(frozen.subjects(RDFS.subClassOf, EX.Thing)) == subclasses
+
+    def test_sparql_and_prefixes(self, graph):
+        """Test that SPARQL runs over the frozen store with the same prefixes."""
+        frozen = freeze(graph)
+
+        rows = list(frozen.query("SELECT ?c WHERE { ?c a owl:Class }"))
+        assert {row.c for row in rows} == {EX.TestClass, EX.SubClass}
+        assert dict(frozen.namespaces())[""] == dict(graph.namespaces())[""]
+
+    def test_refuses_modification(self, graph):
+        """Test that adding or removing triples raises."""
+        frozen = freeze(graph)
+
+        with pytest.raises(FrozenStoreError):
+            frozen.add((EX.New, RDF.type, OWL.Class))
+        with pytest.raises(FrozenStoreError):
+            frozen.remove((EX.TestClass, None, None))
+
+    def test_pickles(self, graph):
+        """Test that a frozen graph survives a pickle round trip."""
+        frozen = pickle.loads(pickle.dumps(freeze(graph)))
+
+        assert isinstance(frozen.store, FrozenStore)
+        assert (EX.SubClass, RDFS.subClassOf, EX.TestClass) in frozen
+
+    def test_shared_loader_can_freeze(self, tmp_path):
+        """Test that load_shared_ontology hands out frozen graphs on request."""
+        try:
+            graph = load_shared_ontology(
+                source_files=[FIXTURE], cache_dir=tmp_path, frozen=True
+            )
+        finally:
+            clear_shared_ontologies()
+
+        assert isinstance(graph.store, FrozenStore)
+        assert (EX.TestClass, RDF.type, OWL.Class) in graph
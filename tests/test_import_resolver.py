@@ -0,0 +1,132 @@
+"""Tests for owl:imports closure resolution against a local catalog."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from import_resolver import (
+    ImportResolver,
+    find_catalog,
+    read_catalog,
+    unreachable_files,
+)
+from ontology_loader import load_ontology
+
+ONTOLOGY_DIR = Path(__file__).parent.parent / "data" / "ontology"
+
+HEADER = """@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix ex: <http://example.org/onto#> .
+"""
+
+
+class TestImportResolver:
+    """Test suite for catalog lookup and import closure resolution."""
+
+    @pytest.fixture
+    def ontology_dir(self, tmp_path):
+        """Write a small import tree with a cycle and an unused module."""
+        files = {
+            "root.ttl": "<http://example.org/root> a owl:Ontology ;\n"
+                        "    owl:imports <http://example.org/a> ,\n"
+                        "        <http://example.org/b> .\n",
+            "a.ttl": "<http://example.org/a> a owl:Ontology ;\n"
+                     "    owl:imports <http://example.org/b> .\nex:A a owl:Class .\n",
+            "b.ttl": "<http://example.org/b> a owl:Ontology ;\n"
+                     "    owl:imports <http://example.org/a> ,\n"
+                     "        <http://example.org/remote> .\n"
+                     "ex:B a owl:Class .\n",
+            "unused.ttl": "ex:Unused a owl:Class .\n",
+        }
+        for name, body in files.items():
+            (tmp_path / name).write_text(HEADER + body, encoding="utf-8")
+        (tmp_path / "catalog-v001.xml").write_text(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<catalog xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog">\n'
+            '  <uri name="http://example.org/a" uri="a.ttl"/>\n'
+            '  <uri name="http://example.org/b" uri="b.ttl"/>\n'
+            '  <uri name="http://example.org/unused" uri="unused.ttl"/>\n'
+            '</catalog>\n',
+            encoding="utf-8",
+        )
+        return tmp_path
+
+    def test_reads_project_catalog(self):
+        """Test that the waterFRAME catalog maps module IRIs to local files."""
+        catalog = read_catalog(ONTOLOGY_DIR / "catalog-v001.xml")
+        module_iri = "https://ugentbiomath.github.io/waterframe/modules/core/properties"
+
+        assert catalog[module_iri] == (
+            ONTOLOGY_DIR / "modules" / "core" / "properties.ttl"
+        ).resolve()
+
+    def test_finds_catalog_in_parent_directory(self):
+        """Test that module files pick up the catalog next to waterframe.ttl."""
+        module_path = ONTOLOGY_DIR / "modules" / "core" / "properties.ttl"
+
+        catalog = (ONTOLOGY_DIR / "catalog-v001.xml").resolve()
+        assert find_catalog(module_path) == catalog
+
+    def test_waterframe_closure_contains_core_modules(self):
+        """Test that waterframe.ttl resolves to itself plus both core modules."""
+        closure = ImportResolver.for_ontology(ONTOLOGY_DIR / "waterframe.ttl").resolve(
+            [ONTOLOGY_DIR / "waterframe.ttl"]
+        )
+
+        names = [path.name for path in closure.files]
+        assert names == ["waterframe.ttl", "material_entities.ttl", "properties.ttl"]
+        # BFO is not in the local catalog and is reported, not fetched
+        assert "http://purl.obolibrary.org/obo/bfo.owl" in closure.unresolved
+
+    def test_closure_follows_cycles_once(self, ontology_dir):
+        """Test that mutually importing modules are each loaded once."""
+        resolver = ImportResolver(ontology_dir / "catalog-v001.xml")
+        closure = resolver.resolve([ontology_dir / "root.ttl"])
+
+        assert [path.name for path in closure.files] == ["root.ttl", "a.ttl", "b.ttl"]
+        assert closure.unresolved == {"http://example.org/remote"}
+
+    def test_reports_modules_outside_closure(self, ontology_dir, tmp_path, capsys):
+        """Test that a module file the catalog does not reach is warned about."""
+        orphan = ontology_dir / "modules" / "orphan.ttl"
+        orphan.parent.mkdir()
+        orphan.write_text(HEADER + "ex:Orphan a owl:Class .\n", encoding="utf-8")
+
+        closure = ImportResolver(ontology_dir / "catalog-v001.xml").resolve(
+            [ontology_dir / "root.ttl"]
+        )
+        assert unreachable_files(ontology_dir / "root.ttl", closure.files) == [orphan]
+
+        load_ontology(ontology_dir / "root.ttl", cache_dir=tmp_path / "cache")
+        output = capsys.readouterr().out
+        assert f"Warning: {orphan} is not imported from root.ttl" in output
+
+    def test_waterframe_modules_are_all_imported(self):
+        """Test that every waterFRAME module is reachable from waterframe.ttl."""
+        closure = ImportResolver.for_ontology(ONTOLOGY_DIR / "waterframe.ttl").resolve(
+            [ONTOLOGY_DIR / "waterframe.ttl"]
+        )
+        assert unreachable_files(ONTOLOGY_DIR / "waterframe.ttl", closure.files) == []
+
+    def test_loader_skips_modules_outside_closure(self, ontology_dir, tmp_path):
+        """Test that files not reachable through imports are not loaded."""
+        graph = load_ontology(ontology_dir / "root.ttl", cache_dir=tmp_path / "cache")
+        subjects = {str(s) for s in graph.subjects()}
+
+        assert "http://example.org/onto#A" in subjects
+        assert "http://example.org/onto#B" in subjects
+        assert "http://example.org/onto#Unused" not in subjects
+
+    def test_loader_reuses_snapshot_for_closure(self, ontology_dir, tmp_path):
+        """Test that a second load of the same closure is served from cache."""
+        cache_dir = tmp_path / "cache"
+        first = load_ontology(ontology_dir / "root.ttl", cache_dir=cache_dir)
+        assert list(cache_dir.glob("*.sources.json"))
+
+        # Editing an imported module invalidates the snapshot
+        with open(ontology_dir / "b.ttl", "a", encoding="utf-8") as f:
+            f.write("ex:C a owl:Class .\n")
+        second = load_ontology(ontology_dir / "root.ttl", cache_dir=cache_dir)
+
+        assert len(second) == len(first) + 1
@@ -6,9 +6,14 @@ from pathlib import Path
 
 import pytest
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 from generate_docs import OntologyDocGenerator
 
+from link_validator import nav_pages, validate_site
+
+ONTOLOGY = Path(__file__).parent.parent / "data" / "ontology" / "waterframe.ttl"
+
 
 class TestLinkValidation:
     """Test suite for validating internal links in generated documentation."""
@@ -201,3 +206,117 @@ class TestLinkValidation:
         for name, anchor in toc_links:
             assert anchor in heading_anchors, \
                 f"TOC link {name} (#{anchor}) should point to existing section"
+
+
+class TestSiteLinkValidator:
+    """Test suite for the whole-site link validator."""
+
+    @pytest.fixture
+    def site(self, tmp_path):
+        """A small docs directory with one problem of each kind."""
+        docs = tmp_path / "docs"
+        (docs / "modules").mkdir(parents=True)
+        (docs / "assets").mkdir()
+        (docs / "assets" / "logo.png").write_bytes(b"")
+        (docs / "index.md").write_text(
+            "# Home\n\n"
+            "- [A](modules/a.md#thing)\n"
+            "- [Missing](modules/missing.md)\n"
+            "- [Logo](assets/logo.png)\n"
+            "- [External](https://example.org/x.md)\n"
+        )
+        (docs / "modules" / "a.md").write_text(
+            "# Module A\n\n"
+            "## Classes\n\n## Classes\n\n"
+            "## Thing {#thing}\n\n## Other {#thing}\n\n"
+            "- [Second classes](#classes_1)\n"
+            "- [Nowhere](#nowhere)\n"
+            "- [Back](../index.md#home)\n\n"
+            "```\n[not a link](#inside-code)\n```\n"
+        )
+        (docs / "modules" / "orphan.md").write_text("# Orphan\n")
+        return docs
+
+    def test_reports_broken_links(self, site):
+        """Test that missing pages, anchors and files are reported, and
+        nothing else."""
+        report = validate_site(site)
+        broken = {(b.page, b.target) for b in report.broken}
+        assert broken == {
+            ("index.md", "modules/missing.md"),
+            ("modules/a.md", "#nowhere"),
+        }
+        assert report.links == 6
+
+    def test_reports_duplicate_anchors(self, site):
+        """Test that an explicit id used twice on a page is reported, while
+        repeated headings get numbered ids."""
+        report = validate_site(site)
+        assert report.duplicate_anchors == [("modules/a.md", "thing", [7, 9])]
+
+    def test_reports_orphan_pages(self, site):
+        """Test that pages not reachable from the entry pages are orphans."""
+        assert validate_site(site).orphans == ["modules/orphan.md"]
+        assert validate_site(site, ["index.md", "modules/orphan.md"]).orphans == []
+
+    def test_nav_pages(self):
+        """Test that markdown pages are collected from a nested nav."""
+        nav = [
+            {"Home": "index.md"},
+            {"Modules": [{"Core": [{"A": "modules/a.md"}, "modules/b.md"]}]},
+            {"Notebook": "notebook/index.html"},
+        ]
+        assert nav_pages(nav) == ["index.md", "modules/a.md", "modules/b.md"]
+
+    def test_sharded_module_pages_are_linked(self, tmp_path):
+        """Test that the numbered pages of a sharded module page exist and
+        are reachable from the module page."""
+        generator = OntologyDocGenerator(
+            ontology_path=ONTOLOGY,
+            output_dir=tmp_path / "docs" / "entities",
+            shard_size=10,
+            max_workers=1,
+        )
+        module_files = generator.generate_modular_docs()
+        docs = tmp_path / "docs"
+        entry_pages = [f.relative_to(docs).as_posix() for f in module_files]
+
+        report = validate_site(docs, entry_pages)
+        assert report.pages > len(module_files)
+        assert report.orphans == []
+        assert not [b for b in report.broken if b.reason.startswith("no page")]
+
+    def test_links_between_module_pages(self, tmp_path):
+        """Test that links to entities documented on another module page,
+        such as backlinks from properties, name that page."""
+        generator = OntologyDocGenerator(
+            ontology_path=ONTOLOGY,
+            output_dir=tmp_path / "docs" / "entities",
+            max_workers=1,
+        )
+        generator.generate_all_docs()
+        module_files = generator.generate_modular_docs()
+        docs = tmp_path / "docs"
+        entry_pages = [f.relative_to(docs).as_posix() for f in module_files]
+
+        report = validate_site(docs, ["entities/entities.md", *entry_pages])
+        assert report.broken == []
+        material_page = docs / "modules" / "core" / "material_entities.md"
+        material = material_page.read_text(encoding="utf-8")
+        referenced_by = material.split("### Referenced By")[1]
+        assert "](properties.md#" in referenced_by
+
+    def test_index_links_to_entity_reference(self, tmp_path):
+        """Test that the index links to the entity reference where it is
+        written, so the page is neither missing nor an orphan."""
+        generator = OntologyDocGenerator(
+            ontology_path=Path(__file__).parent / "fixtures" / "minimal_ontology.ttl",
+            output_dir=tmp_path / "docs" / "entities",
+        )
+        generator.generate_index()
+        generator.generate_all_docs()
+
+        report = validate_site(tmp_path / "docs")
+        assert report.pages == 2
+        assert not [b for b in report.broken if b.page == "index.md"]
+        assert report.orphans == []
@@ -0,0 +1,109 @@
+"""Tests for the memory-mapped on-disk frozen store."""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from rdflib import Graph, Literal, Namespace
+from rdflib.namespace import OWL, RDF, RDFS
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from frozen_store import FrozenStoreError, freeze
+from mapped_store import MappedStore, open_mapped_graph, write_mapped_store
+from ontology_loader import load_mapped_ontology
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+FIXTURE = Path(__file__).parent / "fixtures" / "minimal_ontology.ttl"
+EX = Namespace("http://test.example.org/onto#")
+
+
+class TestMappedStore:
+    """Test suite for writing, mapping and validating mapped stores."""
+
+    @pytest.fixture
+    def ontology_file(self, tmp_path):
+        """Copy the minimal ontology somewhere it can be edited."""
+        target = tmp_path / "minimal_ontology.ttl"
+        shutil.copy(FIXTURE, target)
+        return target
+
+    @pytest.fixture
+    def graph(self, ontology_file):
+        """Parse the copied ontology into a regular graph."""
+        graph = Graph()
+        graph.parse(ontology_file, format="turtle")
+        return graph
+
+    def test_round_trip_matches_source_graph(self, graph, tmp_path):
+        """Test that a mapped graph holds exactly the source triples."""
+        directory = write_mapped_store(graph, tmp_path / "store.mapped")
+        mapped = open_mapped_graph(directory)
+
+        assert isinstance(mapped.store, MappedStore)
+        assert set(mapped.triples((None, None, None))) == set(graph)
+        assert set(mapped.triples((None, RDFS.subClassOf, None))) == set(
+            graph.triples((None, RDFS.subClassOf, None))
+        )
+        assert list(mapped.objects(EX.Missing, RDFS.label)) == []
+        assert str(dict(mapped.namespaces())[""]) == str(EX)
+
+    def test_keeps_two_term_lookup_order(self, tmp_path):
+        """Test that renumbering terms does not reorder objects(s, p)."""
+        graph = Graph()
+        comments = [Literal(f"comment {i}") for i in reversed(range(20))]
+        for comment in comments:
+            graph.add((EX.Thing, RDFS.comment, comment))
+
+        mapped = open_mapped_graph(write_mapped_store(freeze(graph), tmp_path / "s"))
+
+        assert list(mapped.objects(EX.Thing, RDFS.comment)) == comments
+
+    def test_records_sources(self, graph, ontology_file, tmp_path):
+        """Test that the store knows which file content it was built from."""
+        directory = write_mapped_store(
+            graph, tmp_path / "store.mapped", [ontology_file]
+        )
+        store = open_mapped_graph(directory).store
+
+        assert list(store.sources) == [ontology_file.resolve()]
+        assert store.is_current()
+
+        with open(ontology_file, "a", encoding="utf-8") as f:
+            f.write("\n:ExtraClass rdf:type owl:Class .\n")
+        assert not store.is_current()
+
+    def test_refuses_modification(self, graph, tmp_path):
+        """Test that mapped graphs are read-only."""
+        mapped = open_mapped_graph(write_mapped_store(graph, tmp_path / "s"))
+
+        with pytest.raises(FrozenStoreError):
+            mapped.add((EX.New, RDF.type, OWL.Class))
+
+    def test_other_processes_open_the_same_files(self, graph, tmp_path):
+        """Test that a second process can map the store written by this one."""
+        directory = write_mapped_store(graph, tmp_path / "store.mapped")
+        code = (
+            f"import sys; sys.path.insert(0, {str(SRC_DIR)!r}); "
+            "from mapped_store import open_mapped_graph; "
+            f"print(len(open_mapped_graph({str(directory)!r})))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert int(result.stdout) == len(graph)
+
+    def test_loader_rebuilds_after_edit(self, ontology_file, tmp_path):
+        """Test that load_mapped_ontology reuses stores until a source changes."""
+        first = load_mapped_ontology(ontology_file, cache_dir=tmp_path / "cache")
+        second = load_mapped_ontology(ontology_file, cache_dir=tmp_path / "cache")
+        assert second.store.manifest == first.store.manifest
+
+        with open(ontology_file, "a", encoding="utf-8") as f:
+            f.write("\n:ExtraClass rdf:type owl:Class .\n")
+        third = load_mapped_ontology(ontology_file, cache_dir=tmp_path / "cache")
+
+        assert len(third) == len(first) + 1
+        assert len(list((tmp_path / "cache").glob("*.mapped"))) == 1
@@ -0,0 +1,138 @@
+"""Tests for per-module class diagrams."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from rdflib import Graph
+from rdflib.namespace import OWL, RDF
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import generate_docs
+from generate_docs import OntologyDocGenerator
+
+from module_diagram import module_diagram_spec
+
+
+class TestModuleDiagrams:
+    """Test suite for module diagrams."""
+
+    def generator(self, ontology, snapshot_dir, max_workers=1):
+        """A generator writing next to the ontology copy."""
+        return OntologyDocGenerator(
+            ontology_path=ontology,
+            output_dir=ontology.parent.parent / "docs" / "entities",
+            max_workers=max_workers,
+            cache_dir=snapshot_dir,
+        )
+
+    def test_spec_lists_classes_and_edges(self, ontology, snapshot_dir):
+        """Test that a diagram shows the module's classes, their
+        superclasses and its object properties."""
+        generator = self.generator(ontology, snapshot_dir)
+        module = ontology.parent / "modules" / "core" / "material_entities.ttl"
+        summary = generator._module_summary(module)
+
+        spec = module_diagram_spec("Material entities", summary.entities,
+                                   generator.index, generator.uris, generator.hierarchy)
+        nodes = {uri: (label, kind, layer) for uri, label, kind, layer in spec.nodes}
+        toilet = f"{generator.ontology_namespace}Toilet"
+        usage_point = f"{generator.ontology_namespace}WaterUsagePoint"
+        assert nodes[toilet] == ("Toilet", "class", 3)
+        assert [toilet, usage_point, ""] in spec.edges
+        assert spec.digest() == module_diagram_spec(
+            "Material entities", reversed(summary.entities),
+            generator.index, generator.uris, generator.hierarchy,
+        ).digest()
+
+    def test_page_shows_diagram(self, ontology, snapshot_dir):
+        """Test that a module page embeds its diagram once one is drawn."""
+        generator = self.generator(ontology, snapshot_dir)
+        module_file = ontology.parent / "modules" / "core" / "material_entities.ttl"
+        page = generator.output_dir.parent / "modules" / "core" / "material_entities.md"
+        generator.generate_modular_docs()
+        assert "## Class Diagram" not in page.read_text()
+
+        # As recorded by generate_module_diagrams
+        generator.diagrams = {module_file.resolve(): page.with_suffix(".svg")}
+        generator.generate_modular_docs()
+        diagram = "![Class diagram of material_entities](material_entities.svg)"
+        assert diagram in page.read_text()
+
+    def test_missing_libraries_skip_diagrams(self, ontology, snapshot_dir, monkeypatch,
+                                             capsys):
+        """Test that diagrams are skipped with a warning without networkx
+        and matplotlib."""
+        monkeypatch.setattr(generate_docs, "diagrams_available", lambda: False)
+        generator = self.generator(ontology, snapshot_dir)
+
+        assert generator.generate_module_diagrams() == []
+        assert generator.diagrams == {}
+        assert "Warning: networkx and matplotlib are needed" in capsys.readouterr().out
+
+    def test_missing_libraries_remove_old_diagrams(self, ontology, snapshot_dir,
+                                                   monkeypatch):
+        """Test that diagrams of an earlier build are deleted, and no longer
+        shown, once the libraries drawing them are gone."""
+        generator = self.generator(ontology, snapshot_dir)
+        page = generator.output_dir.parent / "modules" / "core" / "material_entities.md"
+        page.parent.mkdir(parents=True)
+        diagram = page.with_suffix(".svg")
+        diagram.write_text("<svg/>", encoding="utf-8")
+        generator.manifest.record(diagram, {"diagram": "old"})
+        generator.manifest.save()
+
+        monkeypatch.setattr(generate_docs, "diagrams_available", lambda: False)
+        generator = self.generator(ontology, snapshot_dir)
+        generator.generate_module_diagrams()
+        generator.generate_modular_docs()
+
+        assert not diagram.exists()
+        assert generator.manifest.entry(diagram) is None
+        assert "## Class Diagram" not in page.read_text()
+
+    def test_module_without_classes_loses_its_diagram(self, ontology, snapshot_dir):
+        """Test that the diagram of a module whose classes were all removed
+        is deleted, forgotten and no longer shown on its page."""
+        pytest.importorskip("networkx")
+        pytest.importorskip("matplotlib")
+        generator = self.generator(ontology, snapshot_dir)
+        generator.generate_module_diagrams()
+        generator.generate_modular_docs()
+        page = generator.output_dir.parent / "modules" / "core" / "material_entities.md"
+        diagram = page.with_suffix(".svg")
+        assert diagram.exists()
+        assert "](material_entities.svg)" in page.read_text()
+
+        module = ontology.parent / "modules" / "core" / "material_entities.ttl"
+        # Keep only the module's ontology header
+        graph = Graph().parse(module)
+        header = set(graph.subjects(RDF.type, OWL.Ontology))
+        for entity in set(graph.subjects()) - header:
+            graph.remove((entity, None, None))
+        graph.serialize(module, format="turtle")
+
+        generator = self.generator(ontology, snapshot_dir)
+        assert diagram not in generator.generate_module_diagrams()
+        generator.generate_modular_docs()
+
+        assert not diagram.exists()
+        assert generator.manifest.entry(diagram) is None
+        assert "## Class Diagram" not in page.read_text()
+
+    def test_diagrams_are_drawn_once(self, ontology, snapshot_dir):
+        """Test that diagrams are written as SVG and not redrawn while
+        their module is unchanged."""
+        pytest.importorskip("networkx")
+        pytest.importorskip("matplotlib")
+
+        generator = self.generator(ontology, snapshot_dir, max_workers=2)
+        diagrams = generator.generate_module_diagrams()
+        assert diagrams
+        assert all(b"<svg" in diagram.read_bytes() for diagram in diagrams)
+        mtimes = [diagram.stat().st_mtime_ns for diagram in diagrams]
+
+        generator = self.generator(ontology, snapshot_dir)
+        assert generator.generate_module_diagrams() == diagrams
+        assert [diagram.stat().st_mtime_ns for diagram in diagrams] == mtimes
@@ -0,0 +1,102 @@
+"""Tests for splitting large module pages into numbered pages."""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from generate_docs import OntologyDocGenerator
+
+# Anchor of each entity section heading
+SECTION_ANCHOR = re.compile(r"^## \w+ \{#(\S+)\}$", re.MULTILINE)
+
+
+class TestModuleSharding:
+    """Test suite for sharded module pages."""
+
+    def generator(self, ontology, snapshot_dir, shard_size):
+        """A generator writing next to the ontology copy."""
+        return OntologyDocGenerator(
+            ontology_path=ontology,
+            output_dir=ontology.parent.parent / "docs" / "entities",
+            shard_size=shard_size,
+            max_workers=1,
+            cache_dir=snapshot_dir,
+        )
+
+    def test_sections_are_split_across_pages(self, ontology, snapshot_dir):
+        """Test that every section lands on exactly one numbered page."""
+        whole = self.generator(ontology, snapshot_dir, shard_size=0)
+        whole.generate_modular_docs()
+        docs = whole.output_dir.parent
+        module_page = docs / "modules" / "core" / "material_entities.md"
+        expected = SECTION_ANCHOR.findall(module_page.read_text())
+
+        self.generator(ontology, snapshot_dir, shard_size=10).generate_modular_docs()
+        overview = module_page.read_text()
+        pages = sorted(module_page.with_suffix("").glob("page-*.md"))
+
+        assert [p.name for p in pages] == ["page-1.md", "page-2.md", "page-3.md"]
+        assert "## Pages" in overview
+        assert "(page 1 of 3)" in pages[0].read_text()
+        assert "{#" not in overview
+        found = [
+            anchor
+            for page in pages for anchor in SECTION_ANCHOR.findall(page.read_text())
+        ]
+        assert found == expected
+
+    def test_links_name_the_page_holding_the_anchor(self, ontology, snapshot_dir):
+        """Test that links between numbered pages point at the right page."""
+        self.generator(ontology, snapshot_dir, shard_size=10).generate_modular_docs()
+        docs = ontology.parent.parent / "docs"
+        shard_dir = docs / "modules" / "core" / "material_entities"
+        anchors = {
+            anchor: page.name for page in shard_dir.glob("page-*.md")
+            for anchor in re.findall(r"\{#(\S+)\}", page.read_text())
+        }
+
+        checked = 0
+        for page in shard_dir.glob("page-*.md"):
+            for target in re.findall(r"\]\(([^)]*#[^)]+)\)", page.read_text()):
+                href, anchor = target.split("#")
+                if anchor in anchors:
+                    assert (href or page.name) == anchors[anchor], (page.name, target)
+                    checked += 1
+        assert checked
+
+    def test_shrinking_removes_stale_pages(self, ontology, snapshot_dir):
+        """Test that pages of a previous, finer split are deleted."""
+        self.generator(ontology, snapshot_dir, shard_size=10).generate_modular_docs()
+        self.generator(ontology, snapshot_dir, shard_size=20).generate_modular_docs()
+        docs = ontology.parent.parent / "docs"
+        shard_dir = docs / "modules" / "core" / "material_entities"
+        pages = sorted(p.name for p in shard_dir.glob("*.md"))
+        assert pages == ["page-1.md", "page-2.md"]
+
+        self.generator(ontology, snapshot_dir, shard_size=0).generate_modular_docs()
+        assert not shard_dir.exists()
+
+    def test_edited_page_part_is_rebuilt(self, ontology, snapshot_dir, capsys):
+        """Test that a changed numbered page makes its module page stale."""
+        self.generator(ontology, snapshot_dir, shard_size=10).generate_modular_docs()
+        docs = ontology.parent.parent / "docs"
+        page = docs / "modules" / "core" / "properties" / "page-2.md"
+        page.write_text("edited", encoding="utf-8")
+        capsys.readouterr()
+
+        self.generator(ontology, snapshot_dir, shard_size=10).generate_modular_docs()
+
+        assert "Generated module page:" in capsys.readouterr().out
+        assert page.read_text() != "edited"
+
+    def test_search_index_points_at_numbered_pages(self, ontology, snapshot_dir):
+        """Test that search results link to the numbered page of an entity."""
+        generator = self.generator(ontology, snapshot_dir, shard_size=10)
+        generator.generate_modular_docs()
+        index_file = generator.generate_search_index()
+        index = json.loads(index_file.read_text(encoding="utf-8"))
+
+        urls = {row[0]: row[3] for row in index["entities"]}
+        assert re.match(r"modules/core/material_entities/page-\d/#", urls["Appliance"])
@@ -0,0 +1,67 @@
+"""Tests for per-module summaries recorded at load time."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import generate_docs
+from generate_docs import OntologyDocGenerator
+
+from ontology_dataset import OntologyDataset
+from ontology_loader import load_ontology
+
+WF = "https://ugentbiomath.github.io/waterframe#"
+
+
+class TestModuleSummary:
+    """Test suite for module summaries captured while loading."""
+
+    def test_loader_summarizes_each_file(self, ontology, snapshot_dir):
+        """Test that every file of the closure gets its header and entities."""
+        graph = load_ontology(ontology, cache_dir=snapshot_dir)
+
+        properties = ontology.parent / "modules" / "core" / "properties.ttl"
+        summary = graph.module_summaries[properties.resolve()]
+        assert len(graph.module_summaries) == 3
+        assert summary.uri.endswith("/modules/core/properties")
+        assert summary.description.startswith("Properties that connect")
+        assert WF + "WaterFlow" in summary.entities
+        assert WF + "Port" not in summary.entities
+
+    def test_summaries_survive_snapshot_cache(self, ontology, snapshot_dir):
+        """Test that a graph served from a snapshot has the same summaries."""
+        cold = load_ontology(ontology, cache_dir=snapshot_dir)
+        warm = load_ontology(ontology, cache_dir=snapshot_dir)
+
+        assert warm.module_summaries == cold.module_summaries
+
+    def test_dataset_refresh_updates_summary(self, ontology):
+        """Test that reloading an edited module replaces its summary."""
+        dataset = OntologyDataset(ontology)
+        properties = (ontology.parent / "modules" / "core" / "properties.ttl").resolve()
+        with open(properties, "a", encoding="utf-8") as f:
+            f.write("\nwf:NewFlow a owl:Class .\n")
+
+        dataset.refresh()
+
+        assert WF + "NewFlow" in dataset.graph.module_summaries[properties].entities
+
+    def test_module_pages_need_no_parse(self, ontology, snapshot_dir, tmp_path,
+                                        monkeypatch):
+        """Test that module pages are built from the summaries alone."""
+        generator = OntologyDocGenerator(
+            ontology_path=ontology,
+            output_dir=tmp_path / "docs" / "entities",
+            cache_dir=snapshot_dir,
+        )
+
+        def refuse(*args, **kwargs):
+            raise AssertionError("module parsed again")
+
+        monkeypatch.setattr(generate_docs, "parse_rdf", refuse)
+        pages = generator.generate_modular_docs()
+
+        assert len(pages) == 2
+        module_uri = "https://ugentbiomath.github.io/waterframe/modules/core/properties"
+        assert f"**Module URI:** `{module_uri}`" in pages[1].read_text(encoding="utf-8")
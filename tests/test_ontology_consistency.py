@@ -5,40 +5,8 @@ Tests that the ontology loads and can be reasoned over
 """
 
 import pytest
-from rdflib import Graph, Namespace
+from rdflib import Namespace
 from rdflib.namespace import RDF, RDFS, OWL
-from pathlib import Path
-
-
-@pytest.fixture
-def ontology_graph():
-    """Load the ontology for testing"""
-    g = Graph()
-
-    base_dir = Path(__file__).parent.parent
-
-    # Load main ontology (this imports all modules)
-    main_ontology_file = base_dir / "data" / "ontology" / "waterframe.ttl"
-    if main_ontology_file.exists():
-        g.parse(str(main_ontology_file), format="turtle")
-
-        # Load core modules explicitly (RDFLib doesn't auto-download imports)
-        modules_dir = base_dir / "data" / "ontology" / "modules" / "core"
-        core_modules = ["material_entities.ttl", "properties.ttl"]
-
-        for module_file in core_modules:
-            module_path = modules_dir / module_file
-            if module_path.exists():
-                g.parse(str(module_path), format="turtle")
-
-    # Load instances
-    instances_file = (
-        base_dir / "data" / "ontology" / "instances" / "household_case1.ttl"
-    )
-    if instances_file.exists():
-        g.parse(str(instances_file), format="turtle")
-
-    return g
 
 
 def test_ontology_loads(ontology_graph):
@@ -0,0 +1,117 @@
+"""Tests for the incrementally refreshable named-graph ontology dataset."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from rdflib import URIRef
+from rdflib.namespace import OWL, RDF
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ontology_dataset import OntologyDataset
+from ontology_loader import load_ontology
+
+ONTOLOGY_DIR = Path(__file__).parent.parent / "data" / "ontology"
+
+HEADER = """@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix ex: <http://example.org/onto#> .
+"""
+
+EX = "http://example.org/onto#"
+
+
+def write(path, body):
+    path.write_text(HEADER + body, encoding="utf-8")
+
+
+class TestOntologyDataset:
+    """Test suite for per-file named graphs and incremental refresh."""
+
+    @pytest.fixture
+    def ontology_dir(self, tmp_path):
+        """Write a root importing module a, plus an unimported module b."""
+        write(tmp_path / "root.ttl",
+              "<http://example.org/root> a owl:Ontology ;\n"
+              "    owl:imports <http://example.org/a> .\n")
+        write(tmp_path / "a.ttl", "ex:A a owl:Class .\n")
+        write(tmp_path / "b.ttl", "ex:B a owl:Class .\n")
+        (tmp_path / "catalog-v001.xml").write_text(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<catalog xmlns="urn:oasis:names:tc:entity:xmlns:xml:catalog">\n'
+            '  <uri name="http://example.org/a" uri="a.ttl"/>\n'
+            '  <uri name="http://example.org/b" uri="b.ttl"/>\n'
+            '</catalog>\n',
+            encoding="utf-8",
+        )
+        return tmp_path
+
+    def test_each_file_gets_a_named_graph(self, ontology_dir):
+        """Test that triples land in the named graph of the file they came from."""
+        dataset = OntologyDataset(ontology_dir / "root.ttl")
+
+        assert [p.name for p in dataset.files] == ["root.ttl", "a.ttl"]
+        module = dataset.named_graph(ontology_dir / "a.ttl")
+        assert (URIRef(EX + "A"), RDF.type, OWL.Class) in module
+        assert (URIRef(EX + "A"), RDF.type, OWL.Class) in dataset.graph
+        assert len(dataset.graph) == 3
+
+    def test_union_matches_merged_graph(self):
+        """Test that the union view holds exactly the merged waterFRAME graph."""
+        dataset = OntologyDataset(ONTOLOGY_DIR / "waterframe.ttl")
+        merged = load_ontology(ONTOLOGY_DIR / "waterframe.ttl", use_cache=False)
+
+        assert set(dataset.graph.triples((None, None, None))) == set(merged)
+
+    def test_refresh_without_changes_is_a_no_op(self, ontology_dir):
+        """Test that untouched and merely re-saved files are not reloaded."""
+        dataset = OntologyDataset(ontology_dir / "root.ttl")
+        (ontology_dir / "a.ttl").write_bytes((ontology_dir / "a.ttl").read_bytes())
+
+        report = dataset.refresh()
+
+        assert not report.changed
+
+    def test_refresh_reloads_only_the_edited_file(self, ontology_dir):
+        """Test that an edit replaces that file's triples and nothing else."""
+        dataset = OntologyDataset(ontology_dir / "root.ttl")
+        root_graph = dataset.named_graph(ontology_dir / "root.ttl")
+        write(ontology_dir / "a.ttl", "ex:Renamed a owl:Class .\n")
+
+        report = dataset.refresh()
+
+        assert [p.name for p in report.reloaded] == ["a.ttl"]
+        assert (URIRef(EX + "A"), RDF.type, OWL.Class) not in dataset.graph
+        assert (URIRef(EX + "Renamed"), RDF.type, OWL.Class) in dataset.graph
+        assert len(root_graph) == 2
+
+    def test_refresh_follows_new_and_dropped_imports(self, ontology_dir):
+        """Test that import edits load new modules and drop unreachable ones."""
+        dataset = OntologyDataset(ontology_dir / "root.ttl")
+        write(ontology_dir / "root.ttl",
+              "<http://example.org/root> a owl:Ontology ;\n"
+              "    owl:imports <http://example.org/b> .\n")
+
+        report = dataset.refresh()
+
+        assert [p.name for p in report.added] == ["b.ttl"]
+        assert [p.name for p in report.removed] == ["a.ttl"]
+        assert (URIRef(EX + "B"), RDF.type, OWL.Class) in dataset.graph
+        assert (URIRef(EX + "A"), RDF.type, OWL.Class) not in dataset.graph
+
+    def test_broken_edit_keeps_last_good_version(self, ontology_dir):
+        """Test that a syntax error does not empty the module's graph."""
+        dataset = OntologyDataset(ontology_dir / "root.ttl")
+        write(ontology_dir / "a.ttl", "ex:A a owl:Class\n")
+
+        report = dataset.refresh()
+
+        assert [p.name for p in report.failed] == ["a.ttl"]
+        assert (URIRef(EX + "A"), RDF.type, OWL.Class) in dataset.graph
+
+    def test_sparql_sees_the_union(self, ontology_dir):
+        """Test that queries on the dataset run against all named graphs."""
+        dataset = OntologyDataset(ontology_dir / "root.ttl")
+
+        rows = list(dataset.graph.query("SELECT ?c WHERE { ?c a owl:Class }"))
+
+        assert [str(row.c) for row in rows] == [EX + "A"]
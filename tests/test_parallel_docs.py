@@ -0,0 +1,68 @@
+"""Tests for rendering module pages in a worker pool."""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from generate_docs import OntologyDocGenerator
+
+
+def read_tree(root):
+    """Map each markdown file under root to its content."""
+    return {
+        p.relative_to(root).as_posix(): p.read_text(encoding="utf-8")
+        for p in sorted(root.rglob("*.md"))
+    }
+
+
+class TestParallelDocs:
+    """Test suite for parallel module page rendering."""
+
+    @pytest.fixture
+    def ontology(self, ontology):
+        """The ontology copy with an extra bridge and a broken module."""
+        root = ontology.parent
+        (root / "bridges").mkdir()
+        shutil.copy(root / "modules" / "core" / "properties.ttl",
+                    root / "bridges" / "flows.ttl")
+        (root / "modules" / "core" / "broken.ttl").write_text(
+            "this is not turtle", encoding="utf-8"
+        )
+        return ontology
+
+    def render(self, ontology, snapshot_dir, output_root, max_workers):
+        """Build the module pages and return (page list, page contents)."""
+        generator = OntologyDocGenerator(
+            ontology_path=ontology,
+            output_dir=output_root / "entities",
+            max_workers=max_workers,
+            cache_dir=snapshot_dir,
+        )
+        pages = generator.generate_modular_docs()
+        return [p.relative_to(output_root) for p in pages], read_tree(output_root)
+
+    def test_parallel_output_matches_serial(self, ontology, snapshot_dir, tmp_path):
+        """Test that a worker pool writes the same pages, in the same order."""
+        serial = self.render(ontology, snapshot_dir, tmp_path / "serial",
+                             max_workers=1)
+        parallel = self.render(ontology, snapshot_dir, tmp_path / "parallel",
+                               max_workers=3)
+
+        assert parallel == serial
+        assert [p.as_posix() for p in serial[0]] == [
+            "modules/core/material_entities.md",
+            "modules/core/properties.md",
+            "bridges/flows.md",
+        ]
+
+    def test_broken_module_is_reported(self, ontology, snapshot_dir, tmp_path,
+                                       capsys):
+        """Test that a module the workers cannot parse is skipped with a warning."""
+        self.render(ontology, snapshot_dir, tmp_path / "docs", max_workers=2)
+
+        out = capsys.readouterr().out
+        assert "Warning: Could not parse" in out
+        assert "broken.ttl" in out
@@ -0,0 +1,77 @@
+"""Tests for process-pool parsing of multi-file ontologies."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from rdflib import Graph, URIRef
+from rdflib.namespace import RDFS
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from parallel_parse import decode_batch, encode_batch, load_parallel
+
+ONTOLOGY_DIR = Path(__file__).parent.parent / "data" / "ontology"
+SOURCE_FILES = [
+    ONTOLOGY_DIR / "waterframe.ttl",
+    ONTOLOGY_DIR / "modules" / "core" / "material_entities.ttl",
+    ONTOLOGY_DIR / "modules" / "core" / "properties.ttl",
+]
+
+
+class TestParallelParse:
+    """Test suite for the parallel loader."""
+
+    @pytest.fixture
+    def sequential_graph(self):
+        """Parse the source files one after the other."""
+        graph = Graph()
+        for path in SOURCE_FILES:
+            graph.parse(path, format="turtle")
+        return graph
+
+    def test_batch_round_trip(self, sequential_graph):
+        """Test that encoded batches decode to the same triples."""
+        triples = list(sequential_graph)
+        terms, ids = encode_batch(triples)
+
+        assert len(ids) == 3 * len(triples)
+        assert len(terms) < len(ids)
+        assert list(decode_batch(terms, ids)) == triples
+
+    def test_loads_same_triples_as_sequential_parse(self, sequential_graph):
+        """Test that the parallel loader produces the same graph."""
+        result = load_parallel(SOURCE_FILES, max_workers=2, batch_size=50)
+
+        assert set(result.graph) == set(sequential_graph)
+        assert not result.failed
+
+    def test_ordered_load_preserves_object_order(self, sequential_graph):
+        """Test that ordered loading iterates like a sequential parse."""
+        result = load_parallel(SOURCE_FILES, max_workers=2, batch_size=7)
+        storage_tank = URIRef("https://ugentbiomath.github.io/waterframe#StorageTank")
+
+        assert list(result.graph.subjects(RDFS.subClassOf, storage_tank)) == list(
+            sequential_graph.subjects(RDFS.subClassOf, storage_tank)
+        )
+
+    def test_records_per_file_timing(self):
+        """Test that every file gets a timing entry with its triple count."""
+        finished = []
+        result = load_parallel(SOURCE_FILES, max_workers=2, progress=finished.append)
+
+        assert set(result.timings) == set(SOURCE_FILES)
+        assert len(finished) == len(SOURCE_FILES)
+        for path, timing in result.timings.items():
+            expected = len(Graph().parse(path, format="turtle"))
+            assert timing.triples == expected
+            assert timing.parse_seconds > 0
+
+    def test_reports_unparseable_file(self, tmp_path):
+        """Test that a broken file is reported without aborting the load."""
+        broken = tmp_path / "broken.ttl"
+        broken.write_text("this is not turtle", encoding="utf-8")
+
+        result = load_parallel([SOURCE_FILES[1], broken], max_workers=2)
+
+        assert broken in result.failed
+        assert len(result.graph) == result.timings[SOURCE_FILES[1]].triples
@@ -5,33 +5,8 @@ Validates that the port-based approach enables answering key competency question
 """
 
 import pytest
-from rdflib import Graph, Namespace
+from rdflib import Namespace
 from rdflib.namespace import RDF, RDFS
-from pathlib import Path
-
-
-@pytest.fixture
-def port_based_graph():
-    """Load the port-based ontology and instance data"""
-    g = Graph()
-
-    base_dir = Path(__file__).parent.parent
-
-    # Load core modules
-    modules_dir = base_dir / "data" / "ontology" / "modules" / "core"
-    for module_file in ["material_entities.ttl", "properties.ttl"]:
-        module_path = modules_dir / module_file
-        if module_path.exists():
-            g.parse(str(module_path), format="turtle")
-
-    # Load port-based instances
-    instances_file = (
-        base_dir / "data" / "ontology" / "instances" / "household_case1_port_based.ttl"
-    )
-    if instances_file.exists():
-        g.parse(str(instances_file), format="turtle")
-
-    return g
 
 
 def test_port_classes_exist(port_based_graph):
@@ -0,0 +1,82 @@
+"""Tests for RDF format detection and transparent decompression."""
+
+import gzip
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+from rdflib import Graph
+from rdflib.compare import isomorphic
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from import_resolver import parse_file
+from rdf_formats import detect_format, parse_rdf, sniff_format
+
+FIXTURE = Path(__file__).parent / "fixtures" / "minimal_ontology.ttl"
+
+
+class TestRdfFormats:
+    """Test suite for format sniffing and compressed inputs."""
+
+    @pytest.fixture
+    def expected(self):
+        """The fixture ontology parsed the plain way."""
+        graph = Graph()
+        graph.parse(FIXTURE, format="turtle")
+        return graph
+
+    @pytest.mark.parametrize("head, expected_format", [
+        (b'<?xml version="1.0"?>\n<rdf:RDF>', "xml"),
+        (b'{"@context": {}}', "json-ld"),
+        (b"@prefix ex: <http://ex.org/> .\nex:a ex:b ex:c .\n", "turtle"),
+        (b"<http://ex.org/a> <http://ex.org/b> <http://ex.org/c> .\n", "nt"),
+        (b'_:x <http://ex.org/b> "label"@en .\n# comment\n', "nt"),
+        (b"<http://ex.org/a> <http://ex.org/b> <http://ex.org/c> <http://ex.org/g> .\n",
+         "nquads"),
+        (b"<http://ex.org/a> <http://ex.org/b> <http://ex.org/c> ;\n"
+         b"    <http://ex.org/d> <http://ex.org/e> .\n", "turtle"),
+    ])
+    def test_sniffs_content(self, head, expected_format):
+        """Test that leading bytes identify the serialization."""
+        assert sniff_format(head) == expected_format
+
+    def test_extension_wins_when_unambiguous(self, tmp_path):
+        """Test that .ttl is Turtle and .owl falls back to the content."""
+        owl = tmp_path / "module.owl"
+        owl.write_text('<?xml version="1.0"?>\n<rdf:RDF/>\n', encoding="utf-8")
+
+        assert detect_format(FIXTURE) == ("turtle", None)
+        assert detect_format(owl) == ("xml", None)
+
+    def test_ntriples_content_uses_nt_parser(self, tmp_path, expected):
+        """Test that N-Triples under an unknown extension gets the fast parser."""
+        source = tmp_path / "export.data"
+        source.write_text(expected.serialize(format="nt"), encoding="utf-8")
+
+        graph = Graph()
+        stats = parse_rdf(source, graph)
+
+        assert stats.format == "nt"
+        assert stats.triples == len(expected)
+        assert isomorphic(graph, expected)
+
+    def test_gzip_is_transparent(self, tmp_path, expected):
+        """Test that a gzipped Turtle file parses like the plain file."""
+        source = tmp_path / "minimal_ontology.ttl.gz"
+        with open(FIXTURE, "rb") as plain, gzip.open(source, "wb") as packed:
+            shutil.copyfileobj(plain, packed)
+
+        graph = parse_file(source)
+
+        assert graph.parse_stats.compression == "gzip"
+        assert graph.parse_stats.format == "turtle"
+        assert isomorphic(graph, expected)
+
+    def test_reports_parse_rate(self, expected):
+        """Test that parse statistics include a triples-per-second rate."""
+        stats = parse_file(FIXTURE).parse_stats
+
+        assert stats.triples == len(expected)
+        assert stats.triples_per_second > 0
+        assert "triples/s" in str(stats)
@@ -0,0 +1,80 @@
+"""Tests for the prebuilt entity search index."""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from generate_docs import OntologyDocGenerator
+
+from search_index import SearchEntry, build_search_index, tokenize
+
+ONTOLOGY = Path(__file__).parent.parent / "data" / "ontology" / "waterframe.ttl"
+
+
+class TestSearchIndex:
+    """Test suite for search index construction and generation."""
+
+    @pytest.fixture
+    def generator(self, tmp_path):
+        """A generator writing into a temporary docs directory."""
+        return OntologyDocGenerator(
+            ontology_path=ONTOLOGY, output_dir=tmp_path / "entities"
+        )
+
+    def test_tokenize_splits_camel_case(self):
+        """Test that camelCase words yield their parts and the whole word."""
+        assert tokenize("hasInputPort") == ["has", "input", "port", "hasinputport"]
+        assert tokenize("XML2RDF, water-flow") == [
+            "xml", "2", "rdf", "xml2rdf", "water", "flow"
+        ]
+
+    def test_postings_point_at_entities(self):
+        """Test that tokens, definition words and trigrams map to the right rows."""
+        index = build_search_index([
+            SearchEntry("InputPort", "a/#inputport", "Class", ["Input port"],
+                        ["Inlet"], ["Where water enters a component"]),
+            SearchEntry("hasInputPort", "b/#hasinputport", "Object Property"),
+        ])
+
+        assert index["entities"][0] == [
+            "InputPort", "Input port", "Class", "a/#inputport", ["Inlet"],
+            "Where water enters a component",
+        ]
+        assert index["entities"][1][1] == "hasInputPort"
+        assert index["tokens"]["input"] == [0, 1]
+        assert index["tokens"]["inlet"] == [0]
+        assert index["text"]["enters"] == [0]
+        assert "input" not in index["text"]
+        assert index["trigrams"]["tpo"] == [0, 1]
+
+    def test_generated_index_links_to_sections(self, generator):
+        """Test that every indexed entity links to a heading on its page."""
+        generator.generate_modular_docs()
+        index_file = generator.generate_search_index()
+        index = json.loads(index_file.read_text(encoding="utf-8"))
+
+        assert index["entities"]
+        docs_dir = generator.output_dir.parent
+        for name, _, _, url, _, _ in index["entities"]:
+            page, anchor = url.split("#")
+            content = (docs_dir / f"{page.rstrip('/')}.md").read_text(encoding="utf-8")
+            heading = rf"^## {name} \{{#{re.escape(anchor)}\}}$"
+            assert re.search(heading, content, re.MULTILINE)
+
+    def test_unchanged_index_is_skipped(self, generator, capsys):
+        """Test that a second build reuses the index unless the URL style changes."""
+        generator.generate_search_index()
+        capsys.readouterr()
+
+        generator.generate_search_index()
+        assert "Search index is up to date" in capsys.readouterr().out
+
+        index_file = generator.generate_search_index(use_directory_urls=False)
+        assert "Generated search index" in capsys.readouterr().out
+        index = json.loads(index_file.read_text(encoding="utf-8"))
+        assert all(".html#" in row[3] for row in index["entities"])
@@ -0,0 +1,72 @@
+"""Tests for the memoized, read-only shared ontology loader."""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+from rdflib import URIRef
+from rdflib.namespace import OWL, RDF
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ontology_loader import (
+    ReadOnlyGraphError,
+    clear_shared_ontologies,
+    load_shared_ontology,
+)
+
+TEST_CLASS = URIRef("http://test.example.org/onto#TestClass")
+
+
+class TestSharedLoader:
+    """Test suite for memoization and read-only views."""
+
+    @pytest.fixture
+    def ontology_file(self, tmp_path):
+        """Copy the minimal ontology somewhere it can be edited."""
+        fixture_path = Path(__file__).parent / "fixtures" / "minimal_ontology.ttl"
+        target = tmp_path / "minimal_ontology.ttl"
+        shutil.copy(fixture_path, target)
+        yield target
+        clear_shared_ontologies()
+
+    def test_repeated_loads_share_one_store(self, ontology_file, tmp_path):
+        """Test that loading the same files twice does not parse them again."""
+        first = load_shared_ontology(ontology_file, cache_dir=tmp_path / "cache")
+        second = load_shared_ontology(ontology_file, cache_dir=tmp_path / "cache")
+
+        assert first is not second
+        assert first.store is second.store
+
+    def test_view_refuses_modification(self, ontology_file, tmp_path):
+        """Test that tests cannot mutate a graph other tests share."""
+        graph = load_shared_ontology(ontology_file, cache_dir=tmp_path / "cache")
+        size = len(graph)
+
+        with pytest.raises(ReadOnlyGraphError):
+            graph.add((TEST_CLASS, RDF.type, OWL.Thing))
+        with pytest.raises(ReadOnlyGraphError):
+            graph.remove((TEST_CLASS, None, None))
+        with pytest.raises(ReadOnlyGraphError):
+            graph += [(TEST_CLASS, RDF.type, OWL.Thing)]
+        assert len(graph) == size
+
+    def test_view_supports_reads_and_queries(self, ontology_file, tmp_path):
+        """Test that the view answers pattern lookups and SPARQL."""
+        graph = load_shared_ontology(ontology_file, cache_dir=tmp_path / "cache")
+
+        assert (TEST_CLASS, RDF.type, OWL.Class) in graph
+        rows = list(graph.query("SELECT ?c WHERE { ?c a owl:Class }"))
+        assert len(rows) == 2
+        assert dict(graph.namespaces())[""] == URIRef("http://test.example.org/onto#")
+
+    def test_edited_source_is_reloaded(self, ontology_file, tmp_path):
+        """Test that the memo is keyed on content, not just the file name."""
+        first = load_shared_ontology(ontology_file, cache_dir=tmp_path / "cache")
+
+        with open(ontology_file, "a", encoding="utf-8") as f:
+            f.write("\n:ExtraClass rdf:type owl:Class .\n")
+        second = load_shared_ontology(ontology_file, cache_dir=tmp_path / "cache")
+
+        assert second.store is not first.store
+        assert len(second) == len(first) + 1
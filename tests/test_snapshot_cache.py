@@ -0,0 +1,108 @@
+"""Tests for the binary snapshot cache behind the ontology loader."""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from ontology_loader import load_ontology
+from snapshot_cache import SnapshotCache
+
+
+class TestSnapshotCache:
+    """Test suite for snapshot creation, reuse and invalidation."""
+
+    @pytest.fixture
+    def ontology_file(self, tmp_path):
+        """Copy the minimal ontology somewhere it can be edited."""
+        fixture_path = Path(__file__).parent / "fixtures" / "minimal_ontology.ttl"
+        target = tmp_path / "onto" / "minimal_ontology.ttl"
+        target.parent.mkdir()
+        shutil.copy(fixture_path, target)
+        return target
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create an empty cache in a temporary directory."""
+        return SnapshotCache(tmp_path / "cache")
+
+    def test_first_load_writes_snapshot(self, ontology_file, cache):
+        """Test that a cold load stores a snapshot for the source files."""
+        assert cache.load([ontology_file]) is None
+
+        graph = load_ontology(ontology_file, cache_dir=cache.cache_dir)
+
+        cached = cache.load([ontology_file])
+        assert cached is not None
+        assert len(cached) == len(graph) > 0
+
+    def test_snapshot_preserves_triples_and_prefixes(self, ontology_file, cache):
+        """Test that a graph read from a snapshot matches a fresh parse."""
+        fresh = load_ontology(ontology_file, use_cache=False)
+        load_ontology(ontology_file, cache_dir=cache.cache_dir)
+        cached = load_ontology(ontology_file, cache_dir=cache.cache_dir)
+
+        assert set(cached) == set(fresh)
+        assert dict(cached.namespaces())[""] == dict(fresh.namespaces())[""]
+
+    def test_edit_invalidates_snapshot(self, ontology_file, cache):
+        """Test that changing a source file changes the snapshot key."""
+        load_ontology(ontology_file, cache_dir=cache.cache_dir)
+        old_snapshot = cache.snapshot_path([ontology_file])
+
+        with open(ontology_file, "a", encoding="utf-8") as f:
+            f.write('\n:ExtraClass rdf:type owl:Class .\n')
+
+        assert cache.load([ontology_file]) is None
+        graph = load_ontology(ontology_file, cache_dir=cache.cache_dir)
+
+        assert any("ExtraClass" in str(s) for s in graph.subjects())
+        # The stale snapshot for the same source set is pruned
+        assert not old_snapshot.exists()
+        assert cache.snapshot_path([ontology_file]).exists()
+
+    def test_unreadable_snapshot_is_rebuilt(self, ontology_file, cache):
+        """Test that a corrupt snapshot is discarded instead of crashing."""
+        load_ontology(ontology_file, cache_dir=cache.cache_dir)
+        snapshot = cache.snapshot_path([ontology_file])
+        snapshot.write_bytes(b"not a pickle")
+
+        graph = load_ontology(ontology_file, cache_dir=cache.cache_dir)
+
+        assert len(graph) > 0
+        assert cache.load([ontology_file]) is not None
+
+    def test_missing_ontology_returns_empty_graph(self, tmp_path, cache):
+        """Test that loading a missing file yields an empty graph."""
+        graph = load_ontology(tmp_path / "missing.ttl", cache_dir=cache.cache_dir)
+
+        assert len(graph) == 0
+
+    def test_moved_ontology_snapshots_are_pruned(self, ontology_file, cache):
+        """Test that storing a snapshot removes those of sets whose files
+        no longer exist."""
+        load_ontology(ontology_file, cache_dir=cache.cache_dir)
+        first_set = cache.source_set_id([ontology_file])
+        assert list(cache.cache_dir.glob(f"{first_set}*"))
+
+        moved = ontology_file.parent.parent / "moved" / ontology_file.name
+        moved.parent.mkdir()
+        shutil.move(ontology_file, moved)
+        load_ontology(moved, cache_dir=cache.cache_dir)
+
+        assert not list(cache.cache_dir.glob(f"{first_set}*"))
+        assert cache.load([moved]) is not None
+
+    def test_snapshots_of_existing_sets_are_kept(self, ontology_file, cache):
+        """Test that pruning keeps the snapshots of every set still on disk."""
+        copy = ontology_file.parent.parent / "copy" / ontology_file.name
+        copy.parent.mkdir()
+        shutil.copy(ontology_file, copy)
+
+        load_ontology(ontology_file, cache_dir=cache.cache_dir)
+        load_ontology(copy, cache_dir=cache.cache_dir)
+
+        assert cache.load([ontology_file]) is not None
+        assert cache.load([copy]) is not None
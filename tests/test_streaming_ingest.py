@@ -0,0 +1,137 @@
+"""Tests for bounded-memory streaming ingest."""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+from rdflib import BNode, Dataset, Graph, Literal, URIRef
+from rdflib.compare import isomorphic
+from rdflib.exceptions import ParserError
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from streaming_ingest import graph_sink, ingest, keep_predicates, ntriples_sink
+
+INSTANCES = Path(__file__).parent.parent / "data" / "ontology" / "instances"
+MODULES = Path(__file__).parent.parent / "data" / "ontology" / "modules"
+PORT_BASED = INSTANCES / "household_case1_port_based.ttl"
+WF = "https://ugentbiomath.github.io/waterframe#"
+
+
+class TestStreamingIngest:
+    """Test suite for streaming N-Triples, N-Quads and Turtle files."""
+
+    def test_turtle_stream_matches_full_parse(self):
+        """Test that the port-based instance file streams to the same graph."""
+        expected = Graph()
+        expected.parse(PORT_BASED, format="turtle")
+
+        graph = Graph()
+        stats = ingest(PORT_BASED, graph_sink(graph), batch_size=50, chunk_lines=20)
+
+        assert isomorphic(graph, expected)
+        assert stats.parsed == len(expected)
+        assert stats.batches == -(-len(expected) // 50)
+        assert stats.bytes_read == stats.total_bytes
+
+    @pytest.mark.parametrize(
+        "module", sorted(MODULES.rglob("*.ttl")), ids=lambda path: path.stem
+    )
+    def test_module_stream_matches_full_parse(self, module):
+        """Test that every ontology module streams to the same graph."""
+        expected = Graph().parse(module, format="turtle")
+
+        graph = Graph()
+        ingest(module, graph_sink(graph), chunk_lines=10)
+        assert isomorphic(graph, expected)
+
+    def test_turtle_comments_do_not_end_statements(self, tmp_path):
+        """Test that a statement ends at a " ." followed by a comment, and not
+        at a comment ending in "." or a "#" inside an IRI or string."""
+        source = tmp_path / "comments.ttl"
+        source.write_text(
+            "@prefix ex: <http://ex.org/ns#> .  # prefix\n"
+            "ex:a ex:p ex:b ;\n"
+            "    # Not the end of the statement.\n"
+            '    ex:q "a # b ." ;\n'
+            "    ex:r <http://ex.org/x#y> .  # done.\n"
+            "ex:c ex:p ex:d .  # last",
+            encoding="utf-8",
+        )
+        graph = Graph()
+        ingest(source, graph_sink(graph), chunk_lines=1)
+
+        assert isomorphic(graph, Graph().parse(source, format="turtle"))
+        assert len(graph) == 4
+
+    def test_ntriples_round_trip_keeps_blank_nodes(self, tmp_path):
+        """Test that N-Triples output re-ingests with blank nodes intact."""
+        source = tmp_path / "in.nt"
+        source.write_text(
+            "# comment\n"
+            '_:port <http://ex.org/label> "Inlet \\"A\\""@en .\n'
+            "<http://ex.org/pump> <http://ex.org/has> _:port .\n",
+            encoding="utf-8",
+        )
+        graph = Graph()
+        ingest(source, graph_sink(graph))
+
+        (port,) = graph.objects(URIRef("http://ex.org/pump"), URIRef("http://ex.org/has"))
+        assert isinstance(port, BNode)
+        assert graph.value(port, URIRef("http://ex.org/label")) == Literal(
+            'Inlet "A"', lang="en"
+        )
+
+    def test_nquads_go_to_named_graphs(self, tmp_path):
+        """Test that N-Quads statements land in their named graph."""
+        source = tmp_path / "in.nq"
+        source.write_text(
+            "<http://ex.org/a> <http://ex.org/p> <http://ex.org/b> "
+            "<http://ex.org/g1> .\n"
+            "<http://ex.org/a> <http://ex.org/p> <http://ex.org/c> .\n",
+            encoding="utf-8",
+        )
+        dataset = Dataset()
+        ingest(source, graph_sink(dataset))
+
+        assert len(dataset.graph(URIRef("http://ex.org/g1"))) == 1
+        assert len(dataset.default_graph) == 1
+
+    def test_filter_keeps_waterframe_topology(self):
+        """Test that keep_predicates drops labels and comments but keeps typing."""
+        graph = Graph()
+        stats = ingest(PORT_BASED, graph_sink(graph), transform=keep_predicates(WF))
+
+        assert stats.skipped > 0
+        assert stats.emitted == len(graph)
+        for _, predicate, obj in graph:
+            assert str(predicate).startswith(WF) or str(obj).startswith(WF)
+
+    def test_writes_ntriples(self):
+        """Test that the N-Triples sink output parses back to the same graph."""
+        out = io.StringIO()
+        ingest(PORT_BASED, ntriples_sink(out))
+
+        expected = Graph()
+        expected.parse(PORT_BASED, format="turtle")
+        assert isomorphic(Graph().parse(data=out.getvalue(), format="nt"), expected)
+
+    def test_reports_progress_per_batch(self):
+        """Test that the progress callback sees every batch."""
+        seen = []
+        ingest(PORT_BASED, lambda batch: None, batch_size=100,
+               progress=lambda stats: seen.append(stats.emitted))
+
+        assert seen == sorted(seen)
+        assert seen[0] == 100
+
+    def test_invalid_line_reports_line_number(self, tmp_path):
+        """Test that a malformed N-Triples line names its line number."""
+        source = tmp_path / "bad.nt"
+        source.write_text(
+            "<http://ex.org/a> <http://ex.org/p> <http://ex.org/b> .\n"
+            "<http://ex.org/a> <http://ex.org/p>\n",
+            encoding="utf-8",
+        )
+        with pytest.raises(ParserError, match="Line 2"):
+            ingest(source, lambda batch: None)
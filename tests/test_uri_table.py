@@ -0,0 +1,115 @@
+"""Tests for the URI name and anchor table."""
+
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+from rdflib import Graph, Literal, Namespace, URIRef
+from rdflib.namespace import OWL, RDF, RDFS
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from generate_docs import OntologyDocGenerator
+
+from uri_table import LinkedName, UriTable
+
+EX = Namespace("http://test.example.org/onto#")
+OTHER = Namespace("http://other.example.org/onto#")
+
+
+class TestUriTable:
+    """Test suite for UriTable."""
+
+    @pytest.fixture
+    def table(self):
+        """A table knowing the ex: and owl: prefixes."""
+        return UriTable([("ex", str(EX)), ("owl", str(OWL))])
+
+    def test_names_of_a_uri(self, table):
+        """Test that a URI is split into local name, qname and anchor."""
+        names = table[EX.TestClass]
+        assert names.local_name == "TestClass"
+        assert names.qname == "ex:TestClass"
+        assert names.anchor == "http___test.example.org_onto_testclass"
+        assert table.qname(OWL.Class) == "owl:Class"
+        assert table.qname("http://other.example.org/path/Thing") == "Thing"
+
+    def test_names_are_computed_once(self, table):
+        """Test that equal URIs, as URIRef or string, share one entry."""
+        first = table[URIRef(str(EX.TestClass))]
+        assert table[str(EX.TestClass)] is first
+        assert table[URIRef(str(EX.TestClass))] is first
+        assert len(table) == 1
+
+    def test_matches_generator_anchors(self):
+        """Test that the table gives the anchors of the generated sections."""
+        generator = OntologyDocGenerator(
+            ontology_path=Path(__file__).parent / "fixtures" / "minimal_ontology.ttl"
+        )
+        uri = "http://test.example.org/onto#TestClass"
+        assert generator.uris.anchor(uri) == generator._get_anchor_id(uri)
+        assert generator.uris.local_name(uri) == generator._get_local_name(URIRef(uri))
+
+    @pytest.mark.parametrize("other", [
+        "http://test.example.org/onto/TestClass",
+        "http://test.example.org/onto#testclass",
+    ])
+    def test_detects_anchor_collisions(self, table, other):
+        """Test that distinct URIs with the same anchor are reported."""
+        collisions = table.register(
+            [EX.TestClass, EX.SubClass, URIRef(other), EX.TestClass]
+        )
+        assert collisions == {
+            "http___test.example.org_onto_testclass": [str(EX.TestClass), other],
+        }
+
+    def test_generator_warns_about_collisions(self, tmp_path, capsys):
+        """Test that the generator warns when two entities share an anchor."""
+        graph = Graph()
+        graph.bind("", EX)
+        for uri in (EX.Pump, URIRef("http://test.example.org/onto/Pump")):
+            graph.add((uri, RDF.type, OWL.Class))
+            graph.add((uri, RDFS.label, Literal("pump")))
+        generator = OntologyDocGenerator(
+            ontology_path=tmp_path / "unused.ttl",
+            output_dir=tmp_path / "entities",
+            graph=graph,
+        )
+
+        assert list(generator.uris.collisions) == ["http___test.example.org_onto_pump"]
+        assert "Warning: Anchor #http___test.example.org_onto_pump is shared by" in (
+            capsys.readouterr().out
+        )
+
+    def test_linked_name_keeps_its_uri(self):
+        """Test that a linked name compares as its local name and keeps its
+        URI, also when sent to a worker process."""
+        name = LinkedName("TestClass", EX.TestClass)
+        assert name == "TestClass"
+        assert name.uri == str(EX.TestClass)
+        copy = pickle.loads(pickle.dumps(name))
+        assert (copy, copy.uri) == ("TestClass", str(EX.TestClass))
+
+    def test_links_use_the_real_uri(self, tmp_path):
+        """Test that a related entity is linked by its own URI, not by its
+        local name in the ontology namespace."""
+        graph = Graph()
+        graph.bind("", EX)
+        graph.add((EX.Pump, RDF.type, OWL.Class))
+        graph.add((EX.Pump, RDFS.subClassOf, OTHER.Pump))
+        graph.add((EX.Valve, RDFS.subClassOf, EX.Pump))
+        generator = OntologyDocGenerator(
+            ontology_path=tmp_path / "unused.ttl",
+            output_dir=tmp_path / "entities",
+            graph=graph,
+        )
+
+        pump = generator._generate_entity_section(generator._get_entity_info(EX.Pump))
+        valve = generator._generate_entity_section(generator._get_entity_info(EX.Valve))
+
+        assert "### Superclasses\n\n- Pump\n" in pump
+        assert (
+            "### Superclasses\n\n- [Pump](#http___test.example.org_onto_pump)\n"
+            in valve
+        )